@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+
+from market_margins import MARKET_GROUPS
+
+# Oran geçmişi üzerinde geriye dönük test. Skor ve İY metinleri ("2-1") tamsayı gol
+# sütunlarına çevrilir; her pazar seçeneğinin kazanıp kazanmadığı gol dizilerinden
+# NumPy boolean dizileri olarak tek seferde hesaplanır. Strateji, hangi satırda hangi
+# seçeneğe birim bahis yapıldığını gösteren boolean bir DataFrame'dir (sütunlar oran
+# sütunlarıyla aynı adı taşır); getiri ve ROI lig/hafta gibi sütunlara göre toplanır.
+#
+# Örn. favori MS seçeneğine oynayan stratejinin lig bazında ROI'si:
+#   picks = favourite_picks(df, ['MS1', 'MS0', 'MS2'])
+#   strategy_roi(df, picks, by=['Lig'])
+
+GOAL_COLUMNS = {
+    'Skor': ('Ev Gol', 'Deplasman Gol'),
+    'İY': ('IY Ev Gol', 'IY Deplasman Gol'),
+}
+GOAL_DTYPE = 'Int16'
+SCORE_REGEX = r'^\s*(\d+)\s*-\s*(\d+)\s*$'
+
+# Maç sonucu kodları: 1 ev sahibi, 0 beraberlik, 2 deplasman
+RESULT_CODES = {'1': 1, '0': 0, '2': -1}
+
+SELECTIONS = [column for group, columns, coverage in MARKET_GROUPS for column in columns]
+
+def add_goal_columns(df):
+    # Skoru olmayan (oynanmamış, ertelenmiş) maçların gol sütunları <NA> kalır
+    goals = {}
+    for score_column, (home_column, away_column) in GOAL_COLUMNS.items():
+        if score_column not in df.columns:
+            continue
+        parts = df[score_column].astype('string').str.extract(SCORE_REGEX)
+        goals[home_column] = pd.to_numeric(parts[0]).astype(GOAL_DTYPE)
+        goals[away_column] = pd.to_numeric(parts[1]).astype(GOAL_DTYPE)
+    return df.assign(**goals)
+
+def goal_arrays(df):
+    # (ev, deplasman) gol dizileri ve skorun bilindiği satırların maskesi
+    arrays = {}
+    for score_column, (home_column, away_column) in GOAL_COLUMNS.items():
+        if home_column not in df.columns:
+            df = add_goal_columns(df)
+        home = df[home_column].to_numpy(dtype='int16', na_value=-1)
+        away = df[away_column].to_numpy(dtype='int16', na_value=-1)
+        arrays[score_column] = (home, away, (home >= 0) & (away >= 0))
+    return arrays
+
+def settle_markets(df, selections=SELECTIONS):
+    # (kazandı, sonuçlandı) boolean DataFrame'leri; sonuçlanmayan (skoru bilinmeyen)
+    # satırlarda kazandı her zaman False'tur ve bahis iade sayılır
+    goals = goal_arrays(df)
+    home, away, full_time = goals['Skor']
+    ht_home, ht_away, half_time = goals['İY']
+    total = home + away
+    ht_total = ht_home + ht_away
+    ms = np.sign(home - away)
+    iy = np.sign(ht_home - ht_away)
+    second_half = np.sign((home - ht_home) - (away - ht_away))
+    both_halves = full_time & half_time
+
+    outcomes = {
+        'AU2.5 Alt': (total < 2.5, full_time),
+        'AU2.5 Üst': (total > 2.5, full_time),
+        'AU1.5 Alt': (total < 1.5, full_time),
+        'AU1.5 Üst': (total > 1.5, full_time),
+        'IY0.5 Alt': (ht_total < 0.5, half_time),
+        'IY0.5 Üst': (ht_total > 0.5, half_time),
+        'KG Var': ((home > 0) & (away > 0), full_time),
+        'KG Yok': ((home == 0) | (away == 0), full_time),
+        'Tek': (total % 2 == 1, full_time),
+        'Çift': (total % 2 == 0, full_time),
+    }
+    for code, value in RESULT_CODES.items():
+        outcomes[f'MS{code}'] = (ms == value, full_time)
+        outcomes[f'IY{code}'] = (iy == value, half_time)
+        outcomes[f'2Y{code}'] = (second_half == value, both_halves)
+        for ms_code, ms_value in RESULT_CODES.items():
+            outcomes[f'IY/MS {code}/{ms_code}'] = ((iy == value) & (ms == ms_value), both_halves)
+    # Çifte şans seçenekleri, dışarıda bıraktıkları sonuç dışında kazanır
+    for selection, excluded in (('1-X', -1), ('1-2', 0), ('X-2', 1)):
+        outcomes[f'Çifte Şans {selection}'] = (ms != excluded, full_time)
+        outcomes[f'IY Çifte Şans {selection}'] = (iy != excluded, half_time)
+
+    won = {selection: outcomes[selection][0] & outcomes[selection][1] for selection in selections}
+    settled = {selection: outcomes[selection][1] for selection in selections}
+    return pd.DataFrame(won, index=df.index), pd.DataFrame(settled, index=df.index)
+
+def odds_between(df, selections, low=None, high=None):
+    # Oranı [low, high] aralığında olan her seçeneğe bahis
+    odds = df[selections].to_numpy(dtype='float64', na_value=np.nan)
+    picks = ~np.isnan(odds)
+    if low is not None:
+        picks &= odds >= low
+    if high is not None:
+        picks &= odds <= high
+    return pd.DataFrame(picks, index=df.index, columns=selections)
+
+def favourite_picks(df, selections, low=None, high=None):
+    # Her maçta seçenekler arasında en düşük oranlı olana bahis; oranı eksik satırlar atlanır
+    odds = df[selections].to_numpy(dtype='float64', na_value=np.nan)
+    complete = ~np.isnan(odds).any(axis=1)
+    picks = np.zeros(odds.shape, dtype=bool)
+    rows = np.flatnonzero(complete)
+    picks[rows, np.argmin(odds[complete], axis=1)] = True
+    return odds_between(df, selections, low, high) & pd.DataFrame(picks, index=df.index, columns=selections)
+
+def strategy_roi(df, picks, by=None, stake=1.0):
+    # picks: df ile aynı indeksli boolean DataFrame; her True hücre birim bahistir.
+    # Oranı eksik ya da skoru bilinmeyen bahisler sayılmaz.
+    selections = list(picks.columns)
+    won, settled = settle_markets(df, selections)
+    odds = df[selections].to_numpy(dtype='float64', na_value=np.nan)
+    bets = picks.to_numpy(dtype=bool) & settled.to_numpy() & ~np.isnan(odds)
+    hits = bets & won.to_numpy()
+
+    totals = pd.DataFrame({
+        'Bahis': bets.sum(axis=1) * stake,
+        'Kazanan': hits.sum(axis=1),
+        'Getiri': np.where(hits, odds, 0.0).sum(axis=1) * stake,
+    }, index=df.index)
+    if by:
+        summary = totals.groupby([df[column] for column in by], observed=True).sum()
+    else:
+        summary = totals.sum().to_frame().T
+    summary['Kâr'] = summary['Getiri'] - summary['Bahis']
+    summary['ROI'] = summary['Kâr'] / summary['Bahis'].where(summary['Bahis'] > 0)
+    return summary
@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backtest import add_goal_columns, favourite_picks, settle_markets, strategy_roi
+from bench_market_margins import synthetic_odds
+from synthetic_page import LEAGUE_HEADERS
+
+# 1M satırlık sentetik geçmişte bahis sonuçlandırma ve strateji ROI'si: satır satır
+# Python döngüsü ile NumPy boolean dizileri karşılaştırılır. Döngü LOOP_ROWS satırda
+# ölçülüp satır başına süre üzerinden ölçeklenir.
+
+ROWS = 1_000_000
+LOOP_ROWS = 20_000
+STRATEGY = ['MS1', 'MS0', 'MS2']
+
+def synthetic_history(rows, seed=0, unplayed=0.02):
+    rng = np.random.default_rng(seed)
+    df = synthetic_odds(rows, seed)
+    ht_home = rng.poisson(0.6, rows)
+    ht_away = rng.poisson(0.5, rows)
+    home = ht_home + rng.poisson(0.8, rows)
+    away = ht_away + rng.poisson(0.6, rows)
+    skor = pd.Series(home.astype(str)).str.cat(away.astype(str), sep='-')
+    iy = pd.Series(ht_home.astype(str)).str.cat(ht_away.astype(str), sep='-')
+    missing = rng.random(rows) < unplayed
+    df['Skor'] = skor.where(~missing, '')
+    df['İY'] = iy.where(~missing, '')
+    df['Lig'] = pd.Categorical(rng.choice([slug for name, slug in LEAGUE_HEADERS], rows))
+    df['Hafta'] = rng.integers(1500, 1900, rows).astype('int16')
+    return df
+
+def row_loop_roi(df, selections):
+    # Satır satır: skoru ayrıştır, favoriyi bul, sonuçlandır
+    totals = {}
+    for row in df.itertuples(index=False):
+        values = dict(zip(df.columns, row))
+        try:
+            home, away = (int(part) for part in values['Skor'].split('-'))
+        except ValueError:
+            continue
+        odds = [values[selection] for selection in selections]
+        if any(pd.isna(value) for value in odds):
+            continue
+        pick = odds.index(min(odds))
+        result = 0 if home == away else (1 if home > away else 2)
+        won = [1, 0, 2][pick] == result
+        stakes, returns = totals.get(values['Lig'], (0, 0.0))
+        totals[values['Lig']] = (stakes + 1, returns + (odds[pick] if won else 0.0))
+    return {league: (returns - stakes) / stakes for league, (stakes, returns) in totals.items()}
+
+if __name__ == "__main__":
+    df = synthetic_history(ROWS)
+
+    sample = df.head(LOOP_ROWS)
+    expected = row_loop_roi(sample, STRATEGY)
+    actual = strategy_roi(sample, favourite_picks(sample, STRATEGY), by=['Lig'])['ROI']
+    if not all(np.isclose(actual[league], roi, rtol=1e-4) for league, roi in expected.items()):
+        raise SystemExit("Satır döngüsü ile NumPy sonuçlandırması farklı ROI üretti!")
+
+    start = time.perf_counter()
+    row_loop_roi(sample, STRATEGY)
+    loop = (time.perf_counter() - start) / LOOP_ROWS * ROWS
+
+    start = time.perf_counter()
+    df = add_goal_columns(df)
+    goals = time.perf_counter() - start
+
+    start = time.perf_counter()
+    won, settled = settle_markets(df)
+    settle = time.perf_counter() - start
+
+    start = time.perf_counter()
+    roi = strategy_roi(df, favourite_picks(df, STRATEGY), by=['Lig', 'Hafta'])
+    strategy = time.perf_counter() - start
+
+    print(f"{ROWS} satır, {len(won.columns)} seçenek, {len(roi)} lig/hafta")
+    print(f"Satır döngüsü, tek strateji (tahmini): {loop * 1000:10.1f} ms")
+    print(f"Skor ayrıştırma:                       {goals * 1000:10.1f} ms")
+    print(f"Tüm pazarları sonuçlandırma:           {settle * 1000:10.1f} ms")
+    print(f"Favori MS stratejisi, lig/hafta ROI:   {strategy * 1000:10.1f} ms ({loop / strategy:.0f}x)")
@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from iddaa import LeagueBoundaryScanner, select_leagues
+from synthetic_page import build_page
+
+# Akış döngüsündeki lig sınırı tespitinin sayfa boyutuyla nasıl ölçeklendiğini ölçer.
+# Hedef lig sayfanın sonunda olduğunda tüm sayfa taranmak zorundadır (en kötü durum).
+
+CHUNK_SIZE = 4096
+
+def reparse_scan(page, league_string):
+    # Eski yöntem: her parçada biriken tüm içeriği BeautifulSoup ile yeniden ayrıştır
+    content = ''
+    buffer = ''
+    for i in range(0, len(page), CHUNK_SIZE):
+        buffer += page[i:i + CHUNK_SIZE]
+        if len(buffer) > 8192:
+            content += buffer
+            buffer = ''
+        if league_string in content:
+            headers = BeautifulSoup(content, 'html.parser').find_all('tr', {'class': 'tablemainheader'})
+            for j, header in enumerate(headers):
+                if league_string in header.get_text():
+                    if j + 1 < len(headers) and league_string not in headers[j+1].get_text():
+                        return
+    return
+
+def incremental_scan(page, leagues):
+    scanner = LeagueBoundaryScanner(leagues)
+    chunks = []
+    for i in range(0, len(page), CHUNK_SIZE):
+        chunk = page[i:i + CHUNK_SIZE]
+        chunks.append(chunk)
+        if scanner.feed(chunk):
+            break
+    return ''.join(chunks)
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    leagues = select_leagues(['İSP'])  # Sentetik sayfada sondan ikinci lig
+    print(f"{'Sayfa (KB)':>10} {'Yeniden ayrıştırma (s)':>24} {'Artımlı tarama (s)':>20} {'Hızlanma':>10}")
+    for matches_per_league in (5, 10, 20, 40, 80):
+        page = build_page(matches_per_league)
+        old = timed(reparse_scan, page, leagues[0]['league_string'])
+        new = timed(incremental_scan, page, leagues)
+        print(f"{len(page.encode('utf-8')) // 1024:>10} {old:>24.4f} {new:>20.4f} {old / new:>9.0f}x")
@@ -0,0 +1,57 @@
+import io
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from columnar_store import ColumnarStore
+from frame_schema import apply_frame_schema
+from iddaa import LEAGUES, build_dataframe, parse_week_page
+from synthetic_page import build_page
+
+# Tüm liglerin geçmişini CSV'den okumak ile lig başına tek dosyalık Parquet'ten okumayı
+# karşılaştırır; Parquet tarafında tek lig ve son 10 hafta için manifest budaması da ölçülür.
+
+WEEKS = 100
+
+def league_histories():
+    frames = {}
+    for offset in range(WEEKS):
+        hafta = 1900 - offset
+        for league_slug, rows in parse_week_page(build_page(10, seed=offset), LEAGUES).items():
+            df = build_dataframe(rows)
+            df['Hafta'] = hafta
+            frames.setdefault(league_slug, []).append(df)
+    return {league_slug: apply_frame_schema(pd.concat(dfs, ignore_index=True)) for league_slug, dfs in frames.items()}
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+if __name__ == "__main__":
+    histories = league_histories()
+    csv_texts = {league_slug: df.to_csv(index=False) for league_slug, df in histories.items()}
+
+    with tempfile.TemporaryDirectory() as root:
+        store = ColumnarStore(root)
+        for league_slug, df in histories.items():
+            store.write_weeks(league_slug, df)
+        store.save_manifest()
+
+        def read_csvs():
+            return pd.concat([pd.read_csv(io.StringIO(text)) for text in csv_texts.values()], ignore_index=True)
+
+        csv_df, csv_time = timed(read_csvs)
+        all_df, all_time = timed(lambda: ColumnarStore(root).read())
+        league_slug = next(iter(histories))
+        pruned_df, pruned_time = timed(lambda: ColumnarStore(root).read([league_slug], first_week=1891))
+
+    print(f"{len(histories)} lig, {WEEKS} hafta, {len(csv_df)} maç")
+    print(f"CSV (tümü):                {csv_time * 1000:8.1f} ms")
+    print(f"Parquet (tümü):            {all_time * 1000:8.1f} ms")
+    print(f"Parquet ({league_slug}, 10 hafta): {pruned_time * 1000:8.1f} ms ({len(pruned_df)} maç)")
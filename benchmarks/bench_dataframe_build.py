@@ -0,0 +1,56 @@
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frame_schema import KICKOFF_COLUMN, ODDS_COLUMNS, apply_frame_schema, to_odds
+from iddaa import LEAGUES, build_dataframe, parse_date_columns, parse_week_page
+from markets import MARKETS_KEY
+from synthetic_page import build_page
+
+# Hafta başına DataFrame kurma süresi. Eski yol: satırlardan (list of lists) object
+# tipli DataFrame, her object sütununa ayrı regex ile boşluk temizliği ve her oran
+# sütununa ayrı to_odds. Yeni yol (build_dataframe): hücreler okunurken normalize
+# edilir, oranlar tek bir 2 boyutlu blok olarak float32'ye çevrilir.
+
+def baseline_build(data):
+    columns = list(dict.fromkeys(column for row in data for column in row if column != MARKETS_KEY))
+    df = pd.DataFrame([[row.get(column) for column in columns] for row in data], columns=columns, dtype=object)
+    for col in df.columns:
+        if df[col].dtype == 'object':
+            df[col] = df[col].str.replace(r'\s+', ' ', regex=True).str.strip()
+    df = parse_date_columns(df)
+    for column in ODDS_COLUMNS:
+        if column in df.columns:
+            df[column] = to_odds(df[column])
+    df = apply_frame_schema(df)
+    return df.sort_values(by=KICKOFF_COLUMN, ascending=False, kind='stable').reset_index(drop=True)
+
+def per_week(build, weeks, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for league_rows in weeks:
+            for rows in league_rows.values():
+                build(rows)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(weeks)
+
+if __name__ == "__main__":
+    weeks = [parse_week_page(build_page(10, seed=seed), LEAGUES) for seed in range(10)]
+
+    # İki yol aynı değerleri üretmeli (eski yolda serbest metin sütunları object kalır)
+    for league_rows in weeks:
+        for rows in league_rows.values():
+            pd.testing.assert_frame_equal(baseline_build(rows), build_dataframe(rows), check_dtype=False)
+
+    old = per_week(baseline_build, weeks)
+    new = per_week(build_dataframe, weeks)
+    columns = len(build_dataframe(next(iter(weeks[0].values()))).columns)
+    print(f"{len(weeks)} hafta, {len(weeks[0])} lig, {columns} sütun")
+    print(f"Object DataFrame + sütun başına regex/to_odds: {old * 1000:8.2f} ms/hafta")
+    print(f"build_dataframe:                               {new * 1000:8.2f} ms/hafta ({old / new:.1f}x)")
@@ -0,0 +1,41 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frame_schema import apply_frame_schema
+from iddaa import LEAGUES, parse_date_columns, parse_week_page
+from markets import MARKETS_KEY
+from synthetic_page import build_page
+
+# Tüm liglerin birleştirilmiş geçmişinin bellek kullanımını (memory_usage(deep=True))
+# string sütunlu eski DataFrame ile tipli şema arasında karşılaştırır.
+
+WEEKS = 40
+
+def untyped_frame(rows):
+    return parse_date_columns(pd.DataFrame(rows).drop(columns=MARKETS_KEY, errors='ignore'))
+
+def history(frame_builder):
+    frames = []
+    for hafta in range(WEEKS):
+        league_rows = parse_week_page(build_page(10, seed=hafta), LEAGUES)
+        for rows in league_rows.values():
+            df = frame_builder(rows)
+            df['Hafta'] = 1800 + hafta
+            frames.append(df)
+    return pd.concat(frames, ignore_index=True)
+
+def megabytes(df):
+    return df.memory_usage(deep=True).sum() / 2**20
+
+if __name__ == "__main__":
+    untyped = history(untyped_frame)
+    typed = apply_frame_schema(untyped.copy())
+
+    print(f"{len(untyped)} maç, {WEEKS} hafta")
+    print(f"string sütunlar: {megabytes(untyped):7.2f} MB")
+    print(f"tipli şema:      {megabytes(typed):7.2f} MB ({megabytes(untyped) / megabytes(typed):.1f}x)")
+    print(typed.dtypes.value_counts().to_string())
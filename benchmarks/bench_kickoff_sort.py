@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frame_schema import KICKOFF_COLUMN, to_kickoff
+
+# Tarih (datetime64) + Saat (datetime.time, object) sütunlarıyla sıralama ve aralık
+# filtresi ile tek bir datetime64 kickoff sütunu üzerindeki karşılıkları.
+
+ROWS = 1_000_000
+
+def synthetic_frame(rows, seed=1):
+    rng = np.random.default_rng(seed)
+    kickoff = pd.Timestamp('2015-01-01') + pd.to_timedelta(rng.integers(0, 10 * 365 * 96, rows) * 15, unit='min')
+    raw = pd.Series(kickoff).dt.strftime('%Y-%m-%d %H:%M:%S')
+    return pd.DataFrame({
+        'Tarih': pd.Series(kickoff).dt.normalize(),
+        'Saat': pd.Series(kickoff).dt.time,
+        KICKOFF_COLUMN: raw,
+    })
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+if __name__ == "__main__":
+    df = synthetic_frame(ROWS)
+    df[KICKOFF_COLUMN], parse_time = timed(lambda: to_kickoff(df[KICKOFF_COLUMN]))
+    since = pd.Timestamp('2022-06-01 18:00')
+
+    old_sorted, old_sort = timed(lambda: df.sort_values(by=['Tarih', 'Saat'], ascending=[False, False]))
+    new_sorted, new_sort = timed(lambda: df.sort_values(by=KICKOFF_COLUMN, ascending=False, kind='stable'))
+    old_filtered, old_filter = timed(lambda: df[(df['Tarih'] > since.normalize()) | ((df['Tarih'] == since.normalize()) & (df['Saat'] >= since.time()))])
+    new_filtered, new_filter = timed(lambda: df[df[KICKOFF_COLUMN] >= since])
+
+    if not old_sorted[KICKOFF_COLUMN].reset_index(drop=True).equals(new_sorted[KICKOFF_COLUMN].reset_index(drop=True)):
+        raise SystemExit("Tarih/Saat sıralaması ile kickoff sıralaması farklı!")
+    if len(old_filtered) != len(new_filtered):
+        raise SystemExit("Tarih/Saat filtresi ile kickoff filtresi farklı sonuç verdi!")
+
+    print(f"{ROWS} satır; span[date] metinlerinin datetime64'e çevrilmesi: {parse_time:.3f} sn")
+    print(f"Sıralama:        Tarih/Saat {old_sort:7.3f} sn, kickoff {new_sort:7.3f} sn ({old_sort / new_sort:.1f}x)")
+    print(f"Aralık filtresi: Tarih/Saat {old_filter:7.3f} sn, kickoff {new_filter:7.3f} sn ({old_filter / new_filter:.1f}x)")
@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_backend import make_soup
+from markets import DETAIL_COLUMNS, build_market_index, detail_data, detail_events
+from synthetic_page import build_page
+
+# Maç başına detay sütunu okuma maliyeti: her sütun için get_detail_value ile
+# ayrı arama yapmak ile detay satırını bir kez indeksleyip sözlükten okumak.
+
+def get_detail_value(detail_row, header_text, value_text):
+    # Eski iddaa.get_detail_value: her sütun için detay satırında ayrı arama
+    try:
+        div = detail_row.find('div', string=lambda x: x and x.strip() == header_text.strip())
+        if not div:
+            div = detail_row.find('div', string=lambda x: x and header_text in x)
+
+        if div:
+            span = div.find_next('span', string=lambda x: x and x.strip() == value_text.strip())
+            if not span:
+                span = div.find_next('span', string=lambda x: x and value_text in x)
+
+            if span:
+                next_element = span.find_next('br')
+                if next_element:
+                    value = next_element.next_sibling
+                    if value and isinstance(value, str):
+                        cleaned_value = value.strip()
+                        return '0' if cleaned_value == '-' else cleaned_value
+                    elif hasattr(value, 'get_text'):
+                        cleaned_value = value.get_text(strip=True)
+                        return '0' if cleaned_value == '-' else cleaned_value
+    except Exception:
+        pass
+    return '0'
+
+def repeated_search(detail_rows):
+    for detail_row in detail_rows:
+        {column: get_detail_value(detail_row, header_text, value_text) for column, header_text, value_text in DETAIL_COLUMNS}
+
+def market_index(detail_rows):
+    for detail_row in detail_rows:
+        detail_data(build_market_index(detail_events(detail_row)))
+
+def per_match(func, detail_rows, repeat=3):
+    best = min(timed(func, detail_rows) for _ in range(repeat))
+    return best / len(detail_rows)
+
+def timed(func, detail_rows):
+    start = time.perf_counter()
+    func(detail_rows)
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    soup = make_soup(build_page(25))
+    detail_rows = soup.find_all('tr', {'class': 'detail'})
+
+    # İki yöntem de aynı değerleri üretmeli
+    for detail_row in detail_rows:
+        expected = {column: get_detail_value(detail_row, header_text, value_text) for column, header_text, value_text in DETAIL_COLUMNS}
+        if detail_data(build_market_index(detail_events(detail_row))) != expected:
+            raise SystemExit("Pazar indeksi get_detail_value ile farklı sonuç üretti!")
+
+    old = per_match(repeated_search, detail_rows)
+    new = per_match(market_index, detail_rows)
+    print(f"{len(detail_rows)} detay satırı, {len(DETAIL_COLUMNS)} sütun")
+    print(f"get_detail_value x{len(DETAIL_COLUMNS)}: {old * 1e6:8.1f} µs/maç")
+    print(f"Pazar indeksi:       {new * 1e6:8.1f} µs/maç ({old / new:.1f}x)")
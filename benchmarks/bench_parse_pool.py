@@ -0,0 +1,47 @@
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from iddaa import LEAGUES, ParsePool, extract_league_rows, slice_league_sections
+from synthetic_page import build_page
+
+# Geçmiş taramasının ayrıştırma aşamasını süreç sayısına göre ölçer: aynı hafta
+# sayfaları tek süreçte ve 2, 4, ... işçili ParsePool ile ayrıştırılır, sonuçların
+# aynı olduğu doğrulanır. Sayfalar scraping.collect_historical_data'daki gibi
+# thread'lerden gönderilir. İşçilere sayfa değil lig dilimi gönderildiğinden hafta
+# başına süreçler arası aktarılan veri de yazdırılır. Tek çekirdekli makinede sadece
+# tek süreç ölçülür.
+
+WEEKS = 32
+
+def parse_all(pages, parse, threads):
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(lambda page: parse(page, LEAGUES), pages))
+
+def timed(pages, parse, threads):
+    start = time.perf_counter()
+    results = parse_all(pages, parse, threads)
+    return results, time.perf_counter() - start
+
+if __name__ == "__main__":
+    pages = [build_page(20, seed=seed) for seed in range(WEEKS)]
+    print(f"{WEEKS} hafta, sayfa başına {len(pages[0].encode('utf-8')) // 1024} KB, {os.cpu_count()} çekirdek")
+    page_bytes = sum(len(pickle.dumps(page)) for page in pages) / WEEKS
+    slice_bytes = sum(len(pickle.dumps(slice_league_sections(page, LEAGUES))) for page in pages) / WEEKS
+    print(f"İşçiye aktarılan (hafta başına): sayfa {page_bytes / 1024:.0f} KB, dilim {slice_bytes / 1024:.0f} KB")
+
+    reference, serial = timed(pages, extract_league_rows, 1)
+    print(f"{'tek süreç':>12} {serial:8.2f} sn")
+
+    workers = 2
+    while workers <= (os.cpu_count() or 1):
+        with ParsePool(workers) as pool:
+            results, elapsed = timed(pages, pool, workers)
+        if results != reference:
+            raise SystemExit(f"{workers} işçili ParsePool tek süreçle farklı sonuç üretti!")
+        print(f"{workers:>5} süreç  {elapsed:8.2f} sn  ({serial / elapsed:.1f}x)")
+        workers *= 2
@@ -0,0 +1,36 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_backend import available_parsers
+from iddaa import LEAGUES, build_dataframe, parse_week_page
+from synthetic_page import build_page
+
+# Kurulu her HTML ayrıştırıcısı ile hafta sayfasını ayrıştırır, süreleri karşılaştırır
+# ve tüm ayrıştırıcıların aynı DataFrame'leri ürettiğini doğrular.
+
+def parse_frames(page, parser):
+    league_rows = parse_week_page(page, LEAGUES, parser=parser)
+    return {league_slug: build_dataframe(rows) for league_slug, rows in league_rows.items()}
+
+if __name__ == "__main__":
+    parsers = available_parsers()
+    print(f"Kurulu ayrıştırıcılar: {', '.join(parsers)}")
+
+    for matches_per_league in (10, 40):
+        page = build_page(matches_per_league)
+        reference = None
+        for parser in parsers:
+            start = time.perf_counter()
+            frames = parse_frames(page, parser)
+            elapsed = time.perf_counter() - start
+
+            if reference is None:
+                reference = frames
+            elif frames.keys() != reference.keys() or not all(frames[k].equals(reference[k]) for k in frames):
+                raise SystemExit(f"{parser} ayrıştırıcısı {parsers[0]} ile farklı sonuç üretti!")
+            print(f"{len(page.encode('utf-8')) // 1024:>6} KB  {parser:<12} {elapsed:.3f} sn")
+
+    print("Tüm ayrıştırıcılar aynı DataFrame'leri üretti.")
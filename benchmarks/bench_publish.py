@@ -0,0 +1,80 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_github import FakeRepo
+from iddaa import LEAGUES
+from repo_publisher import RepoPublisher
+from scraping import markets_file_path
+
+# Bir güncelleme döngüsünde tüm lig CSV'lerinin hedef repo'ya yazılması: dosya başına
+# Contents API (get_contents + update_file, her dosya ayrı commit) ile Git Data API
+# üzerinden tek commit karşılaştırılır. İstekler bellekteki sahte depoda sayılır;
+# GitHub'da her istek ~0.3-1 s sürer ve saatlik istek kotasından düşer.
+
+REQUEST_LATENCY = 0.5
+
+def league_files(seed, changed=None):
+    rng = random.Random(seed)
+    files = {}
+    for league in LEAGUES:
+        for path in (league['file_path'], markets_file_path(league['file_path'])):
+            rows = '\n'.join(f"{rng.random():.6f}" for _ in range(2000))
+            files[path] = f"Tarih,Oran\n{rows}\n"
+    if changed is not None:
+        # Sadece ilk `changed` dosya değişmiş, diğerleri önceki içerikle aynı
+        base = league_files(seed - 1)
+        files = {path: content if index < changed else base[path] for index, (path, content) in enumerate(files.items())}
+    return files
+
+def contents_api_publish(repo, files):
+    # Eski update_file_in_target_repo akışı
+    for path, content in files.items():
+        try:
+            file = repo.get_contents(path)
+            repo.update_file(path, f"Update {path}", content, file.sha)
+        except Exception:
+            repo.create_file(path, f"Update {path}", content)
+
+def batch_publish(repo, files):
+    # Çalıştırmadaki gibi dosyalar önce diske yazılır, publisher'a sadece yolları verilir
+    with tempfile.TemporaryDirectory() as root:
+        publisher = RepoPublisher(repo)
+        for path, content in files.items():
+            local_path = os.path.join(root, path)
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            with open(local_path, 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+            publisher.stage(path, local_path)
+        publisher.commit(f"Update {len(files)} files")
+
+def measure(publish, initial, files, races=0):
+    repo = FakeRepo({path: content.encode() for path, content in initial.items()}, races=races)
+    commits = repo.commit_count
+    start = time.perf_counter()
+    publish(repo, files)
+    elapsed = time.perf_counter() - start
+    for path, content in files.items():
+        if repo.read(path) != content.encode():
+            raise SystemExit(f"{path} yayınlanan içerikle aynı değil!")
+    return repo.request_count, repo.commit_count - commits, elapsed
+
+if __name__ == "__main__":
+    initial = league_files(0)
+    cycles = [
+        ('Tüm dosyalar değişmiş', league_files(1), 0),
+        ('3 dosya değişmiş', league_files(1, changed=3), 0),
+        ('Dal eşzamanlı ilerlemiş', league_files(1), 1),
+    ]
+    print(f"{len(initial)} dosya, istek başına {REQUEST_LATENCY * 1000:.0f} ms varsayımı")
+    for name, files, races in cycles:
+        print(f"\n{name}:")
+        for label, publish in (('Contents API, dosya başına', contents_api_publish), ('Git Data API, tek commit', batch_publish)):
+            if races and publish is contents_api_publish:
+                continue
+            requests, commits, elapsed = measure(publish, initial, files, races)
+            print(f"  {label:27}: {requests:3} istek, {commits:2} commit, ~{requests * REQUEST_LATENCY:5.1f} s ağ ({elapsed * 1000:.1f} ms yerel)")
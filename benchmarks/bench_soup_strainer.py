@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_backend import available_parsers, make_soup
+from bs4 import SoupStrainer
+
+from iddaa import DATERANGE_STRAINER
+from synthetic_page import build_page
+
+# Hafta sayfasını tam ağaç olarak ve SoupStrainer ile sadece gereken elemanlarla
+# ayrıştırır; en yüksek bellek kullanımını (tracemalloc) ve süreyi karşılaştırır.
+# Hafta listesi (select) süzgeci kullanılıyor. Satır (tr) süzgeci ölçümde tam ağaçtan
+# yavaş (x0.8-0.9) ve bellek kazancı yok (x1.0) olduğu için hafta sayfasında kullanılmıyor;
+# karşılaştırma için burada tutuluyor.
+ROW_STRAINER = SoupStrainer('tr')
+
+def measure(page, parser, parse_only):
+    # Süre tracemalloc kapalıyken ölçülür, izleme ayrıştırmayı yavaşlatır
+    start = time.perf_counter()
+    make_soup(page, parse_only=parse_only, parser=parser)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    soup = make_soup(page, parse_only=parse_only, parser=parser)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del soup
+    return elapsed, peak
+
+if __name__ == "__main__":
+    cases = [
+        ('hafta sayfası (tr)', ROW_STRAINER),
+        ('hafta listesi (select)', DATERANGE_STRAINER),
+    ]
+
+    for matches_per_league in (10, 40):
+        page = build_page(matches_per_league)
+        print(f"\nSayfa boyutu: {len(page.encode('utf-8')) // 1024} KB")
+        for parser in available_parsers():
+            full_time, full_peak = measure(page, parser, None)
+            print(f"  {parser:<12} tam ağaç                 {full_time:.3f} sn  {full_peak / 2**20:7.1f} MB")
+            for name, strainer in cases:
+                elapsed, peak = measure(page, parser, strainer)
+                print(f"  {parser:<12} {name:<24} {elapsed:.3f} sn  {peak / 2**20:7.1f} MB  "
+                      f"(süre x{full_time / elapsed:.1f}, bellek x{full_peak / max(peak, 1):.1f} azaldı)")
@@ -0,0 +1,62 @@
+import io
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frame_schema import apply_frame_schema
+from iddaa import LEAGUES, build_dataframe, parse_week_page
+from sqlite_store import SqliteStore
+from synthetic_page import build_page
+
+# "Bir ligde bir takımın belirli bir haftadan sonraki maçları" sorgusunu tüm CSV'yi
+# okuyup filtrelemek ile SQLite'taki indeksli sorgu arasında karşılaştırır.
+
+WEEKS = 100
+
+def history():
+    frames = []
+    for offset in range(WEEKS):
+        for rows in parse_week_page(build_page(10, seed=offset), LEAGUES).values():
+            df = build_dataframe(rows)
+            df['Hafta'] = 1900 - offset
+            frames.append(df)
+    return apply_frame_schema(pd.concat(frames, ignore_index=True))
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+if __name__ == "__main__":
+    df = history()
+    csv_text = df.to_csv(index=False)
+    league_slug = df['Lig'].iloc[0]
+    team = df['Ev Sahibi'].iloc[0]
+    first_week = 1850
+
+    def csv_query():
+        csv_df = pd.read_csv(io.StringIO(csv_text))
+        selected = (csv_df['Lig'] == league_slug) & ((csv_df['Ev Sahibi'] == team) | (csv_df['Deplasman'] == team))
+        return csv_df[selected & (csv_df['Hafta'] >= first_week)]
+
+    with tempfile.TemporaryDirectory() as root:
+        with SqliteStore(os.path.join(root, 'odds.sqlite')) as store:
+            _, upsert_time = timed(lambda: store.upsert(df))
+            sqlite_df, sqlite_time = timed(lambda: store.matches([league_slug], team=team, first_week=first_week))
+            plan = store.connection.execute(
+                'EXPLAIN QUERY PLAN SELECT * FROM matches WHERE "Lig" = ? AND ("Ev Sahibi" = ? OR "Deplasman" = ?) AND "Hafta" >= ?',
+                (league_slug, team, team, first_week),
+            ).fetchall()
+        csv_df, csv_time = timed(csv_query)
+
+    if len(csv_df) != len(sqlite_df):
+        raise SystemExit("CSV ve SQLite sorguları farklı sayıda maç döndürdü!")
+    print(f"{len(df)} maç, {WEEKS} hafta; toplu upsert: {upsert_time:.2f} sn")
+    print(f"CSV tarama:     {csv_time * 1000:8.1f} ms ({len(csv_df)} maç)")
+    print(f"SQLite sorgusu: {sqlite_time * 1000:8.1f} ms ({len(sqlite_df)} maç)")
+    print("Sorgu planı: " + '; '.join(row[-1] for row in plan))
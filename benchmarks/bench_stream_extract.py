@@ -0,0 +1,47 @@
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from iddaa import LEAGUES, parse_week_page
+from stream_extract import StreamingRowExtractor
+from synthetic_page import build_page
+
+# DOM tabanlı ayrıştırma ile akış halindeki satır çıkarıcının süre ve tepe bellek
+# kullanımını karşılaştırır. Akış çıkarıcıya sayfa 4 KB'lık parçalar halinde verilir
+# ve çıkan satırlar hemen tüketilir, yani bellekte sadece açık satır tutulur.
+
+CHUNK_SIZE = 4096
+
+def dom_extract(page):
+    return sum(len(rows) for rows in parse_week_page(page, LEAGUES).values())
+
+def stream_extract(page):
+    extractor = StreamingRowExtractor(LEAGUES)
+    count = 0
+    for i in range(0, len(page), CHUNK_SIZE):
+        count += len(extractor.feed(page[i:i + CHUNK_SIZE]))
+        extractor.league_rows = {league_slug: [] for league_slug in extractor.league_rows}
+    count += len(extractor.close())
+    return count
+
+def measure(func, page):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = func(page)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+if __name__ == "__main__":
+    print(f"{'Sayfa (KB)':>10} {'Yöntem':>8} {'Maç':>6} {'Süre (s)':>9} {'Tepe bellek (MB)':>17}")
+    for matches_per_league in (10, 40, 160):
+        page = build_page(matches_per_league)
+        size_kb = len(page.encode('utf-8')) // 1024
+        # Sayfanın kendisi iki yöntemde de bellekte; sadece ayrıştırmanın ek maliyeti ölçülür
+        for name, func in (('dom', dom_extract), ('stream', stream_extract)):
+            count, elapsed, peak = measure(func, page)
+            print(f"{size_kb:>10} {name:>8} {count:>6} {elapsed:>9.3f} {peak / 1024 / 1024:>17.1f}")
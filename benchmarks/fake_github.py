@@ -0,0 +1,135 @@
+import base64
+import hashlib
+from types import SimpleNamespace
+
+from github import GithubException
+
+# Benchmark'larda kullanılan, bellekte çalışan GitHub deposu taklidi. PyGithub
+# Repository'nin Contents API (get_contents/update_file/create_file) ve Git Data API
+# (ref, commit, ağaç, blob) yöntemlerinin yayınlamada kullanılan kısmını uygular ve
+# her yöntem çağrısını bir API isteği olarak sayar.
+
+def object_sha(kind, payload):
+    return hashlib.sha1(f"{kind} {len(payload)}\0".encode() + payload).hexdigest()
+
+class FakeRef:
+    def __init__(self, repo, name):
+        self.repo = repo
+        self.name = name
+        self.object = SimpleNamespace(sha=repo.refs[name])
+
+    def edit(self, sha, force=False):
+        self.repo.count('PATCH ref')
+        if self.repo.races:
+            # Başka bir çalıştırma dalı bu arada ilerletmiş gibi davran
+            self.repo.races -= 1
+            self.repo.commit_files({'race.txt': str(self.repo.races).encode()}, 'Concurrent update')
+        if not force and self.repo.refs[self.name] != self.repo.commits[sha]['parents'][0]:
+            raise GithubException(422, {'message': 'Update is not a fast forward'}, None)
+        self.repo.refs[self.name] = sha
+        self.object = SimpleNamespace(sha=sha)
+
+class FakeRepo:
+    def __init__(self, files=None, branch='main', races=0):
+        self.default_branch = branch
+        self.blobs = {}
+        self.trees = {}
+        self.commits = {}
+        self.refs = {}
+        self.requests = {}
+        self.races = races
+        root = self._store_commit({}, 'Initial commit', [])
+        self.refs[f"heads/{branch}"] = root
+        if files:
+            self.commit_files(files, 'Add files')
+
+    def count(self, name):
+        self.requests[name] = self.requests.get(name, 0) + 1
+
+    @property
+    def request_count(self):
+        return sum(self.requests.values())
+
+    @property
+    def commit_count(self):
+        return len(self.commits)
+
+    def _head(self):
+        return self.refs[f"heads/{self.default_branch}"]
+
+    def _store_blob(self, data):
+        sha = object_sha('blob', data)
+        self.blobs[sha] = data
+        return sha
+
+    def _store_commit(self, files, message, parents):
+        tree_sha = hashlib.sha1(repr(sorted(files.items())).encode()).hexdigest()
+        self.trees[tree_sha] = dict(files)
+        sha = hashlib.sha1(f"{tree_sha}{message}{parents}{len(self.commits)}".encode()).hexdigest()
+        self.commits[sha] = {'tree': tree_sha, 'message': message, 'parents': parents}
+        return sha
+
+    def commit_files(self, files, message):
+        # Doğrudan (istek sayılmadan) dala commit ekler: {yol: bytes}
+        head = self._head()
+        tree = dict(self.trees[self.commits[head]['tree']])
+        tree.update({path: self._store_blob(data) for path, data in files.items()})
+        self.refs[f"heads/{self.default_branch}"] = self._store_commit(tree, message, [head])
+
+    def read(self, path):
+        return self.blobs[self.trees[self.commits[self._head()]['tree']][path]]
+
+    # Contents API
+    def get_contents(self, path):
+        self.count('GET contents')
+        tree = self.trees[self.commits[self._head()]['tree']]
+        if path not in tree:
+            raise GithubException(404, {'message': 'Not Found'}, None)
+        data = self.blobs[tree[path]]
+        return SimpleNamespace(sha=tree[path], content=base64.b64encode(data).decode(), decoded_content=data)
+
+    def update_file(self, path, message, content, sha):
+        self.count('PUT contents')
+        self.commit_files({path: content.encode('utf-8')}, message)
+
+    def create_file(self, path, message, content):
+        self.count('PUT contents')
+        self.commit_files({path: content.encode('utf-8')}, message)
+
+    # Git Data API
+    def get_git_ref(self, name):
+        self.count('GET ref')
+        return FakeRef(self, name)
+
+    def get_git_commit(self, sha):
+        self.count('GET commit')
+        return SimpleNamespace(sha=sha, tree=SimpleNamespace(sha=self.commits[sha]['tree']))
+
+    def get_git_tree(self, sha, recursive=False):
+        self.count('GET tree')
+        elements = [SimpleNamespace(path=path, sha=blob, type='blob') for path, blob in self.trees[sha].items()]
+        return SimpleNamespace(sha=sha, tree=elements)
+
+    def get_git_blob(self, sha):
+        self.count('GET blob')
+        return SimpleNamespace(sha=sha, content=base64.b64encode(self.blobs[sha]).decode(), encoding='base64')
+
+    def create_git_blob(self, content, encoding):
+        self.count('POST blob')
+        data = base64.b64decode(content) if encoding == 'base64' else content.encode('utf-8')
+        return SimpleNamespace(sha=self._store_blob(data))
+
+    def create_git_tree(self, tree, base_tree=None):
+        self.count('POST tree')
+        files = dict(self.trees[base_tree.sha]) if base_tree is not None else {}
+        for element in tree:
+            identity = element._identity
+            files[identity['path']] = identity['sha']
+        sha = hashlib.sha1(repr(sorted(files.items())).encode()).hexdigest()
+        self.trees[sha] = files
+        return SimpleNamespace(sha=sha)
+
+    def create_git_commit(self, message, tree, parents):
+        self.count('POST commit')
+        sha = self._store_commit(self.trees[tree.sha], message, [parent.sha for parent in parents])
+        return SimpleNamespace(sha=sha)
@@ -0,0 +1,71 @@
+import random
+
+# Benchmark'larda kullanılan, spordb program tablosunu taklit eden sentetik sayfa üreticisi
+
+LEAGUE_HEADERS = [
+    ("Almanya  - Bundesliga I", "AL1"),
+    ("Avrupa Ligi", "AVL"),
+    ("Fransa - 1.Lig", "FRA1"),
+    ("Hollanda - Eredivisie", "HOL"),
+    ("Türkiye - Süper Lig", "TÜR S"),
+    ("İngiltere - Premier Lig", "İNP"),
+    ("İspanya - LaLiga", "İSP"),
+    ("İtalya - Serie A", "İTA A"),
+]
+
+DETAIL_MARKETS = {
+    'İlk Yarı Çifte Şans': ['1/X', '1/2', '0/2'],
+    'İlk Yarı Sonucu': ['1', '0', '2'],
+    'İkinci Yarı Sonucu': ['1', '0', '2'],
+    'Tek / Çift': ['Tek', 'Çift'],
+    'İlk Yarı / Maç Sonucu': ['1/1', '1/0', '1/2', '0/1', '0/0', '0/2', '2/1', '2/0', '2/2'],
+    'Handikaplı Maç Sonucu (0:1)': ['1', '0', '2'],
+    'Toplam Gol Aralığı': ['0-1', '2-3', '4-5', '6+'],
+}
+
+def random_odds(rng):
+    return f"{rng.uniform(1.05, 9.0):.2f}"
+
+def detail_row(rng):
+    parts = ['<tr class="detail"><td colspan="23">']
+    for header, labels in DETAIL_MARKETS.items():
+        parts.append(f'<div class="markettitle">{header}</div>')
+        for label in labels:
+            value = random_odds(rng) if rng.random() > 0.1 else '-'
+            parts.append(f'<div class="odd"><span>{label}</span><br>{value}</div>')
+    parts.append('</td></tr>')
+    return ''.join(parts)
+
+def match_row(rng, league_slug, finished=True):
+    day = rng.randint(1, 28)
+    hour = rng.randint(12, 22)
+    score = f"{rng.randint(0, 4)}-{rng.randint(0, 4)}" if finished else ''
+    half_time = f"{rng.randint(0, 2)}-{rng.randint(0, 2)}" if finished else ''
+    cells = [
+        f'<td><span date="2024-10-{day:02d} {hour}:30:00">{hour}:30</span></td>',
+        f'<td>{rng.randint(100, 999)}</td>',
+        f'<td>{league_slug}</td>',
+        '<td>1</td>',
+        f'<td><span class="hide-on-mobile">Ev Takımı {rng.randint(1, 99)}</span><span class="hide-on-desktop">EV</span></td>',
+        f'<td>{score}</td>',
+        f'<td><span class="hide-on-mobile">Deplasman Takımı {rng.randint(1, 99)}</span></td>',
+        f'<td>{half_time}</td>',
+    ]
+    cells += [f'<td><span class="betwhite">{random_odds(rng)}</span></td>' for _ in range(11)]
+    cells += ['<td>+</td>']
+    cells += [f'<td><span class="betred">{random_odds(rng)}</span></td>' for _ in range(3)]
+    return f'<tr filtervalue="futbol {league_slug}">' + ''.join(cells) + '</tr>' + detail_row(rng)
+
+def build_page(matches_per_league=10, league_count=len(LEAGUE_HEADERS), finished=True, seed=1):
+    rng = random.Random(seed)
+    parts = [
+        '<html><body><select id="iddaa_daterange">',
+        '<option value="1850">1850</option><option value="1849">1849</option>',
+        '</select><table>',
+    ]
+    for league_string, league_slug in LEAGUE_HEADERS[:league_count]:
+        parts.append(f'<tr class="tablemainheader"><td colspan="23">{league_string}</td></tr>')
+        for _ in range(matches_per_league):
+            parts.append(match_row(rng, league_slug, finished))
+    parts.append('</table></body></html>')
+    return ''.join(parts)
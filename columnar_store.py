@@ -0,0 +1,210 @@
+import json
+import os
+import shutil
+from datetime import datetime
+from urllib.parse import quote
+
+import pandas as pd
+
+from frame_schema import KICKOFF_COLUMN, apply_frame_schema
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pc = ds = pq = None
+
+class ColumnarStore:
+    # Maç geçmişinin lig başına tek dosyalık Parquet kopyası:
+    #   <kök>/lig=<kısaltma>/part-0.parquet
+    # Haftalar geldikçe ParquetWriter ile eklenir; ROW_GROUP_ROWS satır birikince bir
+    # satır grubu yazılır, bellekte bundan fazlası tutulmaz. Hafta başına ayrı satır
+    # grubu (ya da dosya) birkaç satırlık binlerce parça demek olur ve okumada her
+    # parçanın açılış maliyeti ödenir. Takım adları ve lig gibi kategorik sütunlar
+    # sözlük kodlu, oranlar float32 yazılır. manifest.json her ligin dosyasını, satır
+    # sayısını ve haftalarını tutar; okuyucu istenmeyen ligleri ve hafta aralığı dışında
+    # kalan dosyaları açmaz, kalanları tek bir pyarrow.dataset taramasıyla okur.
+    MANIFEST = 'manifest.json'
+    FILE_NAME = 'part-0.parquet'
+    ROW_GROUP_ROWS = 65536
+
+    def __init__(self, root):
+        if pa is None:
+            raise ImportError("Sütunlu çıktı için pyarrow kurulu olmalı (pip install pyarrow).")
+        self.root = root
+        self.manifest_path = os.path.join(root, self.MANIFEST)
+        os.makedirs(root, exist_ok=True)
+        self.manifest = self._read_manifest()
+        # Lig/hafta bölümlü eski düzenin manifest'i okunmaz; ligler yayınlanmış
+        # CSV'lerden yeniden yazılır, eski bölüm dizinleri kapanışta silinir
+        self.leagues = self.manifest.get('leagues', {})
+        # Bu çalıştırmada yazılan ligler: {lig: LeagueWriter}
+        self.writers = {}
+        self.pruned = set()
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self):
+        self.manifest = {
+            'layout': 'lig',
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'leagues': self.leagues,
+        }
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.manifest_path)
+
+    def league_path(self, league_slug):
+        # Hive biçimi; değer URI kodlanır
+        return os.path.join(f"lig={quote(league_slug, safe='')}", self.FILE_NAME)
+
+    def has_league(self, league_slug):
+        return league_slug in self.leagues
+
+    def write_weeks(self, league_slug, df):
+        # df'teki haftalar ligin yeni dosyasına satır grubu olarak eklenir; aynı
+        # haftanın önceki çalıştırmadan kalan satırları save_manifest'te atılır
+        if league_slug not in self.writers:
+            full_path = os.path.join(self.root, self.league_path(league_slug))
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            self.writers[league_slug] = LeagueWriter(f"{full_path}.tmp", writer_schema(table_from_frame(df).schema), self.ROW_GROUP_ROWS)
+        self.writers[league_slug].write(df)
+
+    def prune(self, league_slug):
+        # Tam yeniden kurulumda bu çalıştırmada yazılmayan haftalar yeni dosyaya taşınmaz
+        self.pruned.add(league_slug)
+
+    def save_manifest(self):
+        for league_slug in list(self.writers):
+            self._finish_league(league_slug)
+        self._write_manifest()
+
+    def _finish_league(self, league_slug):
+        writer = self.writers.pop(league_slug)
+        path = self.league_path(league_slug)
+        full_path = os.path.join(self.root, path)
+        previous = self.leagues.get(league_slug)
+        if previous and league_slug not in self.pruned and os.path.exists(full_path):
+            # Önceki çalıştırmadan kalan, bu sefer yazılmayan haftalar sona eklenir; eski
+            # dosya satır grubu boyutunda parçalarla okunur, geçmişin tamamı belleğe alınmaz
+            written = pa.array(sorted(writer.weeks), type=pa.int64())
+            for batch in pq.ParquetFile(full_path).iter_batches(batch_size=self.ROW_GROUP_ROWS):
+                table = pa.Table.from_batches([batch])
+                writer.write_table(table.filter(pc.invert(pc.is_in(table['Hafta'].cast(pa.int64()), value_set=written))))
+        writer.close()
+        os.replace(f"{full_path}.tmp", full_path)
+
+        # Lig/hafta bölümlü eski düzenden kalan dizinler
+        for entry in os.scandir(os.path.dirname(full_path)):
+            if entry.is_dir():
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+        rows = pq.ParquetFile(full_path).metadata.num_rows
+        self.leagues[league_slug] = {
+            'path': path,
+            'rows': rows,
+            'weeks': sorted(writer.weeks, reverse=True),
+            'schema': {field.name: str(field.type) for field in writer.schema},
+        }
+
+    def read(self, league_slugs=None, first_week=None, last_week=None, columns=None, since=None):
+        # Manifest'ten sadece istenen ligler ve hafta aralığıyla kesişen dosyalar seçilir;
+        # hafta ve kickoff filtresi aynı taramada satır gruplarına ve satırlara uygulanır
+        paths = []
+        for league_slug, entry in self.leagues.items():
+            if league_slugs and league_slug not in league_slugs:
+                continue
+            weeks = entry['weeks']
+            if first_week is not None and weeks[0] < first_week:
+                continue
+            if last_week is not None and weeks[-1] > last_week:
+                continue
+            paths.append(os.path.join(self.root, entry['path']))
+        if not paths:
+            return pd.DataFrame()
+
+        conditions = []
+        if first_week is not None:
+            conditions.append(ds.field('Hafta') >= first_week)
+        if last_week is not None:
+            conditions.append(ds.field('Hafta') <= last_week)
+        if since is not None:
+            conditions.append(ds.field(KICKOFF_COLUMN) >= pa.scalar(pd.Timestamp(since), type=pa.timestamp('us')))
+        condition = None
+        for expression in conditions:
+            condition = expression if condition is None else condition & expression
+
+        # Ligler arasında sütunlar farklı olabilir (yeni pazarlar); şemalar birleştirilir
+        schema = pa.unify_schemas([pq.read_schema(path) for path in paths])
+        dataset = ds.dataset(paths, schema=schema, format='parquet')
+        table = dataset.to_table(columns=columns, filter=condition)
+        return apply_frame_schema(table.to_pandas())
+
+class LeagueWriter:
+    # Bir ligin dosyasına yazılacak haftaları satır grubu boyutuna ulaşana kadar biriktirir
+    def __init__(self, path, schema, row_group_rows):
+        self.writer = pq.ParquetWriter(path, schema, compression='zstd')
+        self.schema = schema
+        self.row_group_rows = row_group_rows
+        self.pending = []
+        self.pending_rows = 0
+        self.weeks = set()
+
+    def write(self, df):
+        if not df.empty:
+            self.write_table(table_from_frame(df, self.schema))
+
+    def write_table(self, table):
+        if not table.num_rows:
+            return
+        self.pending.append(conform_table(table, self.schema))
+        self.pending_rows += table.num_rows
+        self.weeks.update(pc.unique(table['Hafta']).to_pylist())
+        if self.pending_rows >= self.row_group_rows:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.writer.write_table(pa.concat_tables(self.pending), row_group_size=self.row_group_rows)
+        self.pending = []
+        self.pending_rows = 0
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+def table_from_frame(df, schema=None):
+    if schema is None:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    return pa.Table.from_pandas(df.reindex(columns=schema.names), schema=schema, preserve_index=False)
+
+def conform_table(table, schema):
+    # Önceki çalıştırmanın dosyası farklı sütunlarla yazılmış olabilir (yeni pazarlar);
+    # sütunlar dosya şemasının sırasına ve tiplerine getirilir, eksikler boş kalır
+    if table.schema.equals(schema):
+        return table
+    columns = [
+        table[field.name].cast(field.type) if field.name in table.column_names else pa.nulls(table.num_rows, field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+def writer_schema(schema):
+    # Haftadan haftaya değişmeyen dosya şeması: sözlük indeksleri int32, ilk haftada
+    # tamamen boş gelen sütunlar metin
+    fields = []
+    for field in schema:
+        if pa.types.is_dictionary(field.type):
+            field = field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+        elif pa.types.is_null(field.type):
+            field = field.with_type(pa.string())
+        fields.append(field)
+    return pa.schema(fields)
@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+
+from markets import DETAIL_COLUMNS, EXTRA_DETAIL_COLUMNS
+from row_schema import COLUMN_SPECS
+
+# Maç DataFrame'lerinin tipli şeması. Oranlar float32 tutulur ve eksik oranlar
+# ('-', '' ya da eski CSV'lerdeki '0') NaN olur; tekrarlanan metin sütunları
+# kategoriktir; başlama zamanı tek bir datetime64 sütunudur (kickoff). kickoff
+# tarih hücresindeki span[date] özniteliğinden okunur; özniteliği olmayan satırlarda
+# Tarih ve Saat sütunlarından türetilir.
+
+ODDS_COLUMNS = (
+    [column for column, label, kind, required in COLUMN_SPECS if kind == 'bet']
+    + [column for column, header_text, value_text in DETAIL_COLUMNS + EXTRA_DETAIL_COLUMNS]
+)
+CATEGORY_COLUMNS = ['Lig', 'MBS', 'Ev Sahibi', 'Deplasman']
+KICKOFF_COLUMN = 'kickoff'
+KICKOFF_FORMAT = '%Y-%m-%d %H:%M:%S'
+ODDS_DTYPE = 'float32'
+WEEK_DTYPE = 'int16'
+
+# Maç kimliği: başlama zamanı, lig ve iki takımdan türetilen 64 bitlik özet.
+# Oranlar kimliğe girmez; oranı değişen maç aynı kimliği korur. Özetleme biçimi
+# değişirse MATCH_ID_VERSION artırılır, SqliteStore eski kimlikleri yeniden hesaplar.
+MATCH_ID_COLUMN = 'match_id'
+MATCH_KEY_COLUMNS = [KICKOFF_COLUMN, 'Lig', 'Ev Sahibi', 'Deplasman']
+MATCH_ID_VERSION = 2
+
+# Yazılan CSV'lerin sütun sırası; sayfada bulunmayan sütunlar boş kalır
+FRAME_COLUMNS = (
+    [column for column, label, kind, required in COLUMN_SPECS]
+    + [column for column, header_text, value_text in DETAIL_COLUMNS + EXTRA_DETAIL_COLUMNS]
+    + [MATCH_ID_COLUMN, 'Hafta']
+)
+
+def to_odds(values):
+    odds = pd.to_numeric(values, errors='coerce').astype(ODDS_DTYPE)
+    # Oran 1'den küçük olamaz; 0 eski çıktılarda eksik oran işaretiydi
+    return odds.where(odds > 0)
+
+def to_odds_block(df):
+    # Birden çok oran sütunu tek geçişte: 2 boyutlu blok düzleştirilir, bir kez sayıya
+    # çevrilip float32 matrise geri şekillendirilir (sütun başına to_odds yerine)
+    values = pd.to_numeric(df.to_numpy(dtype=object).ravel(), errors='coerce')
+    odds = np.asarray(values, dtype=ODDS_DTYPE).reshape(df.shape)
+    odds[~(odds > 0)] = np.nan
+    return pd.DataFrame(odds, index=df.index, columns=df.columns)
+
+def to_kickoff(values):
+    # span[date] metinleri (ya da CSV'den okunan kickoff) tek seferde datetime64'e çevrilir
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, format=KICKOFF_FORMAT, errors='coerce')
+
+def kickoff_from_columns(df):
+    # Tarih (datetime64) ve Saat (datetime.time) sütunlarından başlama zamanı
+    hours = pd.to_timedelta(df['Saat'].astype(str), errors='coerce')
+    return df['Tarih'] + hours
+
+def match_ids(df):
+    # hash_pandas_object sabit anahtarlı SipHash kullanır, aynı değerler her çalıştırmada
+    # aynı özeti verir. Özet sütunların ham değerlerinden alındığı için tipler sabitlenir:
+    # kickoff saniye cinsinden int64'e çevrilir (pandas 2 datetime64[ns], pandas 3
+    # datetime64[us] üretir), metinler kategorik ya da str tipinden bağımsız olarak
+    # object dizisi olarak özetlenir. Sonuç SQLite gibi işaretli 64 bit tamsayı bekleyen
+    # hedefler için int64 olarak saklanır.
+    key = pd.DataFrame({KICKOFF_COLUMN: df[KICKOFF_COLUMN].to_numpy().astype('datetime64[s]').view('int64')}, index=df.index)
+    for column in MATCH_KEY_COLUMNS[1:]:
+        key[column] = pd.Series(df[column].astype(str).to_numpy(dtype=object), index=df.index, dtype=object)
+    return pd.util.hash_pandas_object(key, index=False).to_numpy().view('int64')
+
+class MatchIndex:
+    # Haftalar geldikçe görülen maç kimliklerini tutar; her hafta sadece kendi
+    # satır sayısı kadar iş yapılır, birleştirilmiş geçmiş yeniden taranmaz.
+
+    def __init__(self, ids=()):
+        self.seen = set(ids)
+
+    def drop_seen(self, df):
+        # Daha önce görülmüş (ya da aynı hafta içinde tekrarlanan) maçlar atılır
+        keep = []
+        for match_id in df[MATCH_ID_COLUMN].tolist():
+            keep.append(match_id not in self.seen)
+            self.seen.add(match_id)
+        return df.loc[keep]
+
+def apply_frame_schema(df):
+    # Hem hafta DataFrame'lerine hem de birleştirilmiş geçmişe uygulanır; farklı
+    # kategorilere sahip kategorik sütunlar pd.concat'te object'e döndüğü için
+    # birleştirmeden sonra yeniden çağrılmalıdır
+    odds_columns = [column for column in ODDS_COLUMNS if column in df.columns and df[column].dtype != ODDS_DTYPE]
+    if odds_columns:
+        df[odds_columns] = to_odds_block(df[odds_columns])
+
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+
+    if 'Hafta' in df.columns:
+        df['Hafta'] = df['Hafta'].astype(WEEK_DTYPE)
+
+    if KICKOFF_COLUMN in df.columns:
+        df[KICKOFF_COLUMN] = to_kickoff(df[KICKOFF_COLUMN])
+        if 'Tarih' in df.columns and 'Saat' in df.columns:
+            missing = df[KICKOFF_COLUMN].isna()
+            if missing.any():
+                df.loc[missing, KICKOFF_COLUMN] = kickoff_from_columns(df[missing])
+    elif 'Tarih' in df.columns and 'Saat' in df.columns:
+        df[KICKOFF_COLUMN] = kickoff_from_columns(df)
+
+    if all(column in df.columns for column in MATCH_KEY_COLUMNS):
+        df[MATCH_ID_COLUMN] = match_ids(df)
+
+    return df
@@ -0,0 +1,25 @@
+import os
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+# Tercih sırasına göre BeautifulSoup ağaç kurucuları; derlenmiş lxml kuruluysa
+# o kullanılır, değilse Python'un kendi html.parser'ına düşülür.
+# IDDAA_HTML_PARSER ile belirli bir kurucu zorlanabilir.
+PARSER_PREFERENCE = ['lxml', 'html.parser']
+
+def available_parsers():
+    return [name for name in PARSER_PREFERENCE if builder_registry.lookup(name) is not None]
+
+def select_parser():
+    requested = os.environ.get('IDDAA_HTML_PARSER')
+    if requested:
+        if builder_registry.lookup(requested) is None:
+            raise ValueError(f"HTML ayrıştırıcısı kurulu değil: {requested}")
+        return requested
+    return available_parsers()[0]
+
+HTML_PARSER = select_parser()
+
+def make_soup(markup, parse_only=None, parser=None):
+    return BeautifulSoup(markup, parser or HTML_PARSER, parse_only=parse_only)
@@ -0,0 +1,82 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Tüm spordb istekleri için ortak HTTP ayarları
+USER_AGENT = os.environ.get('IDDAA_USER_AGENT', 'Mozilla/5.0 (compatible; create_odds_csv)')
+CONNECT_TIMEOUT = float(os.environ.get('IDDAA_CONNECT_TIMEOUT', '10'))
+READ_TIMEOUT = float(os.environ.get('IDDAA_READ_TIMEOUT', '60'))
+POOL_SIZE = int(os.environ.get('IDDAA_POOL_SIZE', '8'))
+
+# Aynı sunucuya eşzamanlı açık istek sınırı
+HOST_CONCURRENCY = int(os.environ.get('IDDAA_HOST_CONCURRENCY', '4'))
+
+# Her istek için (url, durum kodu, başlıkların gelme süresi, toplam süre, sıkıştırma)
+REQUEST_TIMINGS = []
+
+_session = None
+_session_lock = threading.Lock()
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+
+def get_session():
+    # Bağlantılar keep-alive ile havuzda tutulur, her istek yeni TCP+TLS el sıkışması yapmaz
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Accept-Encoding': 'gzip, deflate',
+            })
+            _session = session
+        return _session
+
+def host_slot(url):
+    # Her sunucu için paylaşılan semafor; paralel indirmelerde sunucuyu korur
+    host = urlsplit(url).netloc
+    with _host_slots_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.BoundedSemaphore(HOST_CONCURRENCY)
+        return _host_slots[host]
+
+@contextmanager
+def fetch(url, params=None, stream=False):
+    with host_slot(url):
+        start = time.perf_counter()
+        response = get_session().get(url, params=params, stream=stream, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+        try:
+            yield response
+        finally:
+            total = time.perf_counter() - start
+            response.close()
+            REQUEST_TIMINGS.append({
+                'url': response.url,
+                'status': response.status_code,
+                'headers_seconds': response.elapsed.total_seconds(),
+                'total_seconds': total,
+                'encoding': response.headers.get('Content-Encoding', 'identity'),
+            })
+
+def print_request_timings():
+    if not REQUEST_TIMINGS:
+        return
+    timings = list(REQUEST_TIMINGS)
+    header_times = [timing['headers_seconds'] for timing in timings]
+    total_times = [timing['total_seconds'] for timing in timings]
+    compressed = sum(1 for timing in timings if timing['encoding'] != 'identity')
+
+    print(f"\nHTTP istek sayısı: {len(timings)} (sıkıştırılmış: {compressed})")
+    print(f"Ortalama başlık süresi: {sum(header_times) / len(timings):.3f} sn, ortalama toplam süre: {sum(total_times) / len(timings):.3f} sn")
+    # İlk istek bağlantıyı kurar; sonrakiler havuzdaki bağlantıyı yeniden kullanır
+    if len(timings) > 1:
+        reused = header_times[1:]
+        print(f"İlk istek başlık süresi: {header_times[0]:.3f} sn, sonraki isteklerin ortalaması: {sum(reused) / len(reused):.3f} sn")
@@ -0,0 +1,509 @@
+import html
+import multiprocessing
+import os
+import re
+import time
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from bs4 import SoupStrainer
+from datetime import datetime
+
+from frame_schema import KICKOFF_COLUMN, apply_frame_schema, to_kickoff, to_odds
+from html_backend import make_soup
+from http_session import fetch
+from markets import MARKETS_KEY, build_market_index, detail_data, detail_events, market_catalog
+from row_schema import DEFAULT_SCHEMA, compile_column_schema, expand_header_labels, normalize_text
+from stream_extract import StreamingRowExtractor
+
+BASE_URL = "https://www.spordb.com/view/iddaa_program_table.php"
+
+# Oynanmış maçların final skoru, örn. "2-1"
+SCORE_PATTERN = re.compile(r'^\d+\s*-\s*\d+$')
+TAG_PATTERN = re.compile(r'<[^>]*>')
+HEADER_CELL_PATTERN = re.compile(r'<th[\s>]', re.IGNORECASE)
+
+# Satır çıkarıcı: 'dom' sayfayı BeautifulSoup ağacına çevirir, 'stream' ise
+# baytlar geldikçe satırları çıkarır ve tam DOM kurmaz
+ROW_EXTRACTOR = os.environ.get('IDDAA_ROW_EXTRACTOR', 'dom')
+
+# Hafta listesi için ağaca sadece daterange select'i alınır. Hafta sayfasına süzgeç
+# uygulanmaz: ayrıştırıcıya zaten sadece lig bölümlerinin satırları verilir ve
+# SoupStrainer('tr') orada hız ya da bellek kazancı sağlamaz (bench_soup_strainer.py)
+DATERANGE_STRAINER = SoupStrainer('select', attrs={'id': 'iddaa_daterange'})
+
+# Her hafta için ayrıştırılan dilim boyutu ve ayrıştırma süresi
+WEEK_METRICS = []
+
+# Takip edilen ligler: sayfadaki lig başlığı, tablodaki lig kısaltması ve hedef CSV dosyası
+LEAGUES = [
+    {'league_string': "Türkiye - Süper Lig", 'league_slug': "TÜR S", 'file_path': 'matchodds.csv'},
+    {'league_string': "Türkiye - TFF 1. Lig", 'league_slug': "TÜR 1", 'file_path': 'turkiye1.csv'},
+    {'league_string': "Almanya  - Bundesliga I", 'league_slug': "AL1", 'file_path': 'bundesliga.csv'},
+    {'league_string': "Fransa - 1.Lig", 'league_slug': "FRA1", 'file_path': 'ligue1.csv'},
+    {'league_string': "İngiltere - Premier Lig", 'league_slug': "İNP", 'file_path': 'premierleague.csv'},
+    {'league_string': "İspanya - LaLiga", 'league_slug': "İSP", 'file_path': 'laliga.csv'},
+    {'league_string': "İtalya - Serie A", 'league_slug': "İTA A", 'file_path': 'seriea.csv'},
+    {'league_string': "Şampiyonlar Ligi - ", 'league_slug': "ŞMP", 'file_path': 'championsleague.csv'},
+    {'league_string': "Avrupa Ligi", 'league_slug': "AVL", 'file_path': 'europeleague.csv'},
+    {'league_string': "Konferans Ligi", 'league_slug': "AVKL", 'file_path': 'conferenceleague.csv'},
+]
+
+def select_leagues(league_slugs=None):
+    if not league_slugs:
+        return list(LEAGUES)
+    selected = [league for league in LEAGUES if league['league_slug'] in league_slugs]
+    unknown = set(league_slugs) - {league['league_slug'] for league in selected}
+    if unknown:
+        raise ValueError(f"Tanımsız lig kısaltması: {', '.join(sorted(unknown))}")
+    return selected
+
+def get_current_week():
+    try:
+        with fetch(BASE_URL) as response:
+            response.raise_for_status()  # HTTP hatalarını kontrol eder
+            soup = make_soup(response.content, parse_only=DATERANGE_STRAINER)
+
+        # Doğru select etiketini bul
+        select_tag = soup.find('select', {'id': 'iddaa_daterange'})
+        if not select_tag:
+            raise ValueError("iddaa_daterange select etiketi bulunamadı.")
+
+        # En üstteki option etiketini al
+        top_option_tag = select_tag.find('option')
+        if top_option_tag and top_option_tag.has_attr('value'):
+            return int(top_option_tag['value'])  # En üst option'un value değerini döndür
+
+    except Exception as e:
+        print(f"Mevcut hafta kontrolünde hata: {str(e)}")
+
+    return None
+
+def get_cell_value(cell):
+    bet_span = cell.find('span', {'class': ['betwhite', 'betred']})
+    return normalize_text(bet_span.get_text(strip=True) if bet_span else cell.get_text(strip=True))
+
+def get_team_name(cell):
+    mobile_span = cell.find('span', {'class': 'hide-on-desktop'})
+    desktop_span = cell.find('span', {'class': 'hide-on-mobile'})
+    return normalize_text(desktop_span.get_text(strip=True) if desktop_span else mobile_span.get_text(strip=True) if mobile_span else cell.get_text(strip=True))
+
+def get_kickoff_value(cell):
+    # Ham span[date] metni; DataFrame kurulurken tek seferde datetime64'e çevrilir
+    date_span = cell.find('span', attrs={'date': True})
+    return (date_span.get('date') or None) if date_span else None
+
+def get_date_value(cell):
+    date_span = cell.find('span', attrs={'date': True})
+    if date_span and date_span.get('date'):
+        try:
+            dt = datetime.strptime(date_span.get('date'), '%Y-%m-%d %H:%M:%S')
+            return dt.strftime('%d.%m.%Y')
+        except ValueError:
+            pass
+    icon = cell.find('i', {'class': 'fa-angle-double-right'})
+    return normalize_text(icon.get('title')) if icon and icon.get('title') else ''
+
+HEADER_MARKER = 'tablemainheader'
+
+def find_header_row(text, position=0):
+    # position'dan sonraki ilk tablemainheader satırı: (satır başı, satır sonu, başlık metni).
+    # Satır metnin sonunda yarım kaldıysa satır sonu ve başlık metni None'dır;
+    # başka satır yoksa None döner. HTML ayrıştırılmaz, düz metin aranır.
+    while True:
+        row_start = text.find('<tr', position)
+        if row_start == -1:
+            return None
+        tag_end = text.find('>', row_start)
+        if tag_end == -1:
+            return row_start, None, None
+        if HEADER_MARKER not in text[row_start:tag_end]:
+            position = tag_end + 1
+            continue
+        row_end = text.find('</tr>', tag_end)
+        if row_end == -1:
+            return row_start, None, None
+        return row_start, row_end + len('</tr>'), html.unescape(TAG_PATTERN.sub('', text[tag_end + 1:row_end]))
+
+class LeagueBoundaryScanner:
+    # Akıştan gelen her parçada sadece yeni gelen metni tarayarak
+    # tablemainheader satırlarını bulur. Sayfa lig sırasına göre geldiği için,
+    # her ligin başlığından sonra farklı bir lig başlığı görüldüyse o ligin
+    # bölümü tamamlanmıştır.
+
+    def __init__(self, leagues):
+        self.league_strings = [league['league_string'] for league in leagues]
+        self.headers = []
+        self.first_index = {}
+        self.completed = set()
+        self.pending = ''
+
+    def feed(self, chunk):
+        # Yarım kalan satır etiketi ya da başlık satırı için önceki parçanın kuyruğu saklanır
+        text = self.pending + chunk
+        position = 0
+        while True:
+            found = find_header_row(text, position)
+            if found is None:
+                self.pending = text[max(position, len(text) - 2):]
+                break
+            row_start, position, header_text = found
+            if position is None:
+                self.pending = text[row_start:]
+                break
+            self.add_header(header_text)
+        return self.is_complete()
+
+    def add_header(self, header_text):
+        index = len(self.headers)
+        self.headers.append(header_text)
+        for league_string in self.league_strings:
+            first = self.first_index.get(league_string)
+            if first is None and league_string in header_text:
+                self.first_index[league_string] = index
+            elif first == index - 1 and league_string not in header_text:
+                self.completed.add(league_string)
+
+    def is_complete(self):
+        return len(self.completed) == len(self.league_strings)
+
+def find_league_sections(content, leagues):
+    # Sayfa lig sırasına göre geldiği için her lig tek parça bir metin aralığıdır:
+    # ligin ilk başlık satırından bir sonraki tablemainheader satırına kadar.
+    headers = []
+    position = 0
+    while True:
+        found = find_header_row(content, position)
+        if found is None or found[1] is None:
+            break
+        row_start, position, header_text = found
+        headers.append((row_start, header_text))
+
+    sections = {}
+    for index, (row_start, header_text) in enumerate(headers):
+        for league in leagues:
+            league_slug = league['league_slug']
+            if league_slug in sections or league['league_string'] not in header_text:
+                continue
+            if index + 1 < len(headers):
+                section_end = headers[index + 1][0]
+            else:
+                section_end = content.find('</table>', row_start)
+                if section_end == -1:
+                    section_end = len(content)
+            sections[league_slug] = (row_start, section_end)
+    return sections
+
+def get_header_row(content, section_start):
+    # Sütun şeması için lig bölümlerini içeren tablonun, ilk bölümden önceki ilk th
+    # satırı (yoksa boş). Sayfadaki başka tabloların başlıkları dikkate alınmaz.
+    table_start = content.rfind('<table', 0, section_start)
+    match = HEADER_CELL_PATTERN.search(content, max(table_start, 0), section_start)
+    if not match:
+        return ''
+    row_start = content.rfind('<tr', 0, match.start())
+    row_end = content.find('</tr>', match.start())
+    if row_start == -1 or row_end == -1:
+        return ''
+    return content[row_start:row_end + len('</tr>')]
+
+def slice_league_sections(content, leagues):
+    # İstenen liglerin bölümleri, başlık satırıyla birlikte tek bir tabloya konur;
+    # sayfanın geri kalanı ayrıştırıcıya hiç verilmez
+    ranges = sorted(set(find_league_sections(content, leagues).values()))
+    if not ranges:
+        return ''
+    parts = [content[start:end] for start, end in ranges]
+    return '<table>' + get_header_row(content, ranges[0][0]) + ''.join(parts) + '</table>'
+
+def week_metric(iddaa_hafta, content, sliced, parse_seconds):
+    return {
+        'hafta': iddaa_hafta,
+        'page_chars': len(content),
+        'slice_chars': len(sliced),
+        'parse_seconds': parse_seconds,
+    }
+
+def extract_league_rows(content, leagues, iddaa_hafta=None):
+    start = time.perf_counter()
+    sliced = slice_league_sections(content, leagues)
+    league_rows = extract_week_rows(sliced, leagues)
+    WEEK_METRICS.append(week_metric(iddaa_hafta, content, sliced, time.perf_counter() - start))
+    return league_rows
+
+def pack_league_rows(league_rows):
+    # Süreçler arası taşıma için satır sözlükleri (sütun düzeni no, değerler) ikililerine
+    # çevrilir; sütun adları her satırda tekrar serileştirilmez. Detay satırı olmayan
+    # maçların sütunları farklı olduğundan her farklı sütun düzeni bir kez saklanır.
+    layouts = {}
+    packed = {}
+    for league_slug, rows in league_rows.items():
+        packed[league_slug] = [(layouts.setdefault(tuple(row), len(layouts)), tuple(row.values())) for row in rows]
+    return list(layouts), packed
+
+def unpack_league_rows(layouts, packed):
+    return {league_slug: [dict(zip(layouts[layout], values)) for layout, values in rows] for league_slug, rows in packed.items()}
+
+def parse_sliced_rows(sliced, leagues):
+    # Ayrıştırma süreç havuzunda çalışan kısım: ligin dilimi girer, sıkıştırılmış
+    # satırlar ve ayrıştırma süresi çıkar (alt süreçte WEEK_METRICS'e yazılanlar ana
+    # sürece ulaşmaz)
+    start = time.perf_counter()
+    league_rows = extract_week_rows(sliced, leagues)
+    return pack_league_rows(league_rows), time.perf_counter() - start
+
+class ParsePool:
+    # Hafta sayfalarını ProcessPoolExecutor'da ayrıştırır. BeautifulSoup ayrıştırması
+    # CPU'ya bağlı olduğundan GIL yüzünden thread'lerle tek çekirdekte kalır; her
+    # işçi ayrı bir süreç olduğunda ayrıştırma birden çok çekirdeğe dağılır.
+    # Lig sınırları ana süreçte bulunur (ucuz bir metin taraması) ve işçiye birkaç
+    # MB'lık sayfa yerine sadece ligin dilimi gönderilir; yoksa sayfanın serileştirilip
+    # aktarılması ayrıştırma kadar sürer.
+    #
+    # İşçiler ilk submit'te, indirme/ayrıştırma thread'leri çalışırken başlatılır.
+    # fork ile başlatılan süreç o anda başka bir thread'in tuttuğu kilitleri (logging,
+    # ssl, http bağlantı havuzu) kilitli olarak devralıp takılabilir; bu yüzden işçiler
+    # thread'siz bir sunucudan (forkserver) ya da sıfırdan (spawn) başlatılır.
+
+    def __init__(self, workers):
+        self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=pool_context())
+
+    def __call__(self, content, leagues, iddaa_hafta=None):
+        start = time.perf_counter()
+        sliced = slice_league_sections(content, leagues)
+        slice_seconds = time.perf_counter() - start
+        (layouts, packed), parse_seconds = self.executor.submit(parse_sliced_rows, sliced, leagues).result()
+        WEEK_METRICS.append(week_metric(iddaa_hafta, content, sliced, slice_seconds + parse_seconds))
+        return unpack_league_rows(layouts, packed)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.executor.shutdown()
+
+def pool_context():
+    # forkserver olmayan platformlarda (Windows, macOS'ta bazı kurulumlar) spawn
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+def print_week_metrics():
+    if not WEEK_METRICS:
+        return
+    metrics = list(WEEK_METRICS)
+    page_chars = sum(metric['page_chars'] for metric in metrics)
+    slice_chars = sum(metric['slice_chars'] for metric in metrics)
+    parse_seconds = sum(metric['parse_seconds'] for metric in metrics)
+
+    print(f"\nAyrıştırılan hafta sayısı: {len(metrics)}")
+    print(f"Ayrıştırılan dilim: {slice_chars} / {page_chars} karakter (%{100 * slice_chars / max(page_chars, 1):.1f})")
+    print(f"Toplam ayrıştırma süresi: {parse_seconds:.3f} sn, hafta başına ortalama: {parse_seconds / len(metrics):.3f} sn")
+
+def get_time_value(cell):
+    return normalize_text(cell.find('span').get_text(strip=True))
+
+def get_text_value(cell):
+    return normalize_text(cell.get_text(strip=True))
+
+# row_schema okuma şekillerinin BeautifulSoup hücreleri için karşılıkları
+CELL_READERS = {
+    'date': get_date_value,
+    'time': get_time_value,
+    'kickoff': get_kickoff_value,
+    'text': get_text_value,
+    'team': get_team_name,
+    'bet': get_cell_value,
+}
+
+def read_header_labels(table):
+    # Lig bölümlerini içeren tablonun ilk th satırı
+    header_cell = table.find('th')
+    if header_cell is None:
+        return None
+    return expand_header_labels((th.get_text(strip=True), th.get('colspan')) for th in header_cell.find_parent('tr').find_all('th'))
+
+def get_page_schema(soup, lig_header):
+    # Tablo etiketi olmayan parçalarda (yalnız satırlar) tüm sayfaya bakılır
+    header_labels = read_header_labels(lig_header.find_parent('table') or soup)
+    if header_labels is None:
+        return DEFAULT_SCHEMA
+    return compile_column_schema(header_labels)
+
+def get_match_row(current_row, cells, columns, schema):
+    row_data = schema.read_row(cells, columns)
+
+    detail_row = current_row.find_next_sibling('tr', {'class': 'detail'})
+    if detail_row:
+        # Detay satırı bir kez indekslenir, tüm detay sütunları bu indeksten okunur
+        market_index = build_market_index(detail_events(detail_row))
+        row_data.update(detail_data(market_index))
+        row_data[MARKETS_KEY] = market_index
+
+    return row_data
+
+def get_league_rows(lig_header, league_slug, schema):
+    data = []
+    columns = schema.bind(CELL_READERS)
+    lig_index = schema.indices['Lig']
+    mbs_index = schema.indices['MBS']
+    current_row = lig_header.find_next_sibling('tr')
+
+    # Bir sonraki lige kadar olan tüm futbol maçlarını al
+    while current_row:
+        if current_row.get('class', [''])[0] == 'tablemainheader':
+            break
+
+        filter_value = current_row.get('filtervalue', '')
+        if 'futbol' in filter_value:
+            cells = current_row.find_all(['td'])
+            if len(cells) > max(lig_index, mbs_index):
+                lig_cell = cells[lig_index].get_text(strip=True)
+                if lig_cell != league_slug:
+                    break
+
+                mbs_value = cells[mbs_index].get_text(strip=True)
+                if mbs_value == '1':
+                    data.append(get_match_row(current_row, cells, columns, schema))
+
+        current_row = current_row.find_next_sibling('tr')
+
+    return data
+
+def parse_week_page(content, leagues, parser=None):
+    soup = make_soup(content, parser=parser)
+    schema = None
+
+    # Tüm lig başlıklarını tek seferde dolaş, her lig için ilk bölümünü al
+    league_rows = {}
+    for lig_header in soup.find_all('tr', {'class': 'tablemainheader'}):
+        header_text = lig_header.get_text()
+        for league in leagues:
+            league_slug = league['league_slug']
+            if league_slug not in league_rows and league['league_string'] in header_text:
+                # Sütun şeması sayfa başına bir kez, ilk gerekli lig bölümünde derlenir
+                if schema is None:
+                    schema = get_page_schema(soup, lig_header)
+                league_rows[league_slug] = get_league_rows(lig_header, league_slug, schema)
+
+    return league_rows
+
+def parse_date_columns(df):
+    if 'Tarih' in df.columns:
+        df['Tarih'] = pd.to_datetime(df['Tarih'], format='%d.%m.%Y', errors='coerce')
+
+    if 'Saat' in df.columns:
+        df['Saat'] = pd.to_datetime(df['Saat'], format='%H:%M', errors='coerce').dt.time
+
+    if KICKOFF_COLUMN in df.columns:
+        df[KICKOFF_COLUMN] = to_kickoff(df[KICKOFF_COLUMN])
+
+    return df
+
+def build_dataframe(data):
+    # Hücre metinleri okunurken boşlukları normalize edildiği için ayrıca temizlik gerekmez
+    df = pd.DataFrame(data).drop(columns=MARKETS_KEY, errors='ignore')
+    df = apply_frame_schema(parse_date_columns(df))
+
+    if KICKOFF_COLUMN in df.columns:
+        # datetime64 sütunu üzerinde NumPy sıralaması; eski Tarih/Saat (object) sıralamasının yerine
+        df = df.sort_values(by=KICKOFF_COLUMN, ascending=False, kind='stable').reset_index(drop=True)
+
+    return df
+
+def week_is_closed(league_rows):
+    # Hafta, bulunan tüm maçların final skoru girilmişse kapanmış sayılır
+    matches = [row for rows in league_rows.values() for row in rows]
+    return bool(matches) and all(SCORE_PATTERN.match(row['Skor']) for row in matches)
+
+def download_week_page(iddaa_hafta, leagues, extractor=None, keep_content=True):
+    # extractor verilirse her parça ona da beslenir; keep_content False ise
+    # indirilen sayfa bellekte biriktirilmez
+    params = {
+        'iddaa_hafta': str(iddaa_hafta),
+        'tarih': '*',
+        'orderby': 'lig'
+    }
+
+    # Stream kullanarak veriyi parça parça al
+    with fetch(BASE_URL, params=params, stream=True) as response:
+        scanner = LeagueBoundaryScanner(leagues)
+        chunks = []
+
+        for chunk in response.iter_content(chunk_size=4096, decode_unicode=True):
+            if chunk:
+                if keep_content:
+                    chunks.append(chunk)
+                if extractor:
+                    extractor.feed(chunk)
+
+                # Tüm liglerin bölümleri tamamlandıysa indirmeyi bırak
+                if scanner.feed(chunk):
+                    print("İstenen tüm lig bölümleri tamamlandı!")
+                    break
+
+        if extractor:
+            extractor.close()
+        content = ''.join(chunks) if keep_content else None
+
+    return content
+
+def extract_week_rows(content, leagues):
+    if ROW_EXTRACTOR == 'stream':
+        extractor = StreamingRowExtractor(leagues)
+        extractor.feed(content)
+        extractor.close()
+        return extractor.league_rows
+    return parse_week_page(content, leagues)
+
+def build_market_catalog(data):
+    # Oranlar maç tablosundaki sütunlarla aynı tipte: float32, eksik oran '0' yerine NaN
+    catalog = parse_date_columns(market_catalog(data))
+    catalog['Oran'] = to_odds(catalog['Oran'])
+    return catalog
+
+def fetch_week(iddaa_hafta, leagues, cache=None):
+    # İndirme aşaması. Dönüş değeri: (sayfa, lig satırları, önbellekten mi okundu);
+    # satırlar sadece akış çıkarıcısı indirme sırasında çıkardıysa doludur, yoksa None
+    league_slugs = [league['league_slug'] for league in leagues]
+    content = cache.load(iddaa_hafta, league_slugs) if cache else None
+    if content is not None:
+        print(f"\n{iddaa_hafta} haftası önbellekten okundu.")
+        return content, None, True
+
+    print(f"\n{iddaa_hafta} haftası verileri yükleniyor...")
+    if ROW_EXTRACTOR == 'stream':
+        # Satırlar indirme sırasında çıkarılır; önbellek yoksa sayfa saklanmaz
+        extractor = StreamingRowExtractor(leagues)
+        content = download_week_page(iddaa_hafta, leagues, extractor, keep_content=cache is not None)
+        return content, extractor.league_rows, False
+    return download_week_page(iddaa_hafta, leagues), None, False
+
+def parse_week(iddaa_hafta, leagues, fetched, cache=None, parse=extract_league_rows):
+    # Ayrıştırma aşaması: satırlar çıkarılır, yeni indirilen sayfa önbelleğe yazılır
+    content, league_rows, cached = fetched
+    if league_rows is None:
+        league_rows = parse(content, leagues, iddaa_hafta)
+    if cache and not cached:
+        league_slugs = [league['league_slug'] for league in leagues]
+        cache.store(iddaa_hafta, content, league_slugs, week_is_closed(league_rows))
+    return league_rows
+
+def build_week_frames(leagues, league_rows, results, catalogs=None):
+    # Birleştirme aşaması: her lig için DataFrame (ve istenirse pazar kataloğu) kurulur
+    for league in leagues:
+        league_string = league['league_string']
+        league_slug = league['league_slug']
+        data = league_rows.get(league_slug)
+
+        if data is None:
+            print(f"{league_string} başlığı bulunamadı!")
+            continue
+        if not data:
+            print(f"\n{league_string} maçı bulunamadı!")
+            continue
+
+        print(f"Bulunan {league_string} maç sayısı: {len(data)}")
+        results[league_slug] = build_dataframe(data)
+        if catalogs is not None:
+            catalogs[league_slug] = build_market_catalog(data)
+    return results
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+# Pazar gruplarından türetilen sütunlar: her seçenek için ima edilen olasılık
+# ("<sütun> Olasılık", marjı ayıklanmış), marjsız adil oran ("<sütun> Adil") ve
+# her grup için bahis şirketinin toplam marjı ("<grup> Marj", overround).
+# Şemanın parçası değildir; scraping IDDAA_MARKET_MARGINS=1 ise yazılan hafta
+# DataFrame'lerine ayrı bir adım olarak ekler.
+
+# (grup, seçenek sütunları, her sonucun kaç seçenekte yer aldığı)
+# Çifte şans seçenekleri her sonucu iki kez kapsar; olasılıkların toplamı 2'dir.
+MARKET_GROUPS = [
+    ('MS', ['MS1', 'MS0', 'MS2'], 1),
+    ('AU2.5', ['AU2.5 Alt', 'AU2.5 Üst'], 1),
+    ('KG', ['KG Var', 'KG Yok'], 1),
+    ('IY0.5', ['IY0.5 Alt', 'IY0.5 Üst'], 1),
+    ('AU1.5', ['AU1.5 Alt', 'AU1.5 Üst'], 1),
+    ('Çifte Şans', ['Çifte Şans 1-X', 'Çifte Şans 1-2', 'Çifte Şans X-2'], 2),
+    ('IY Çifte Şans', ['IY Çifte Şans 1-X', 'IY Çifte Şans 1-2', 'IY Çifte Şans X-2'], 2),
+    ('IY', ['IY1', 'IY0', 'IY2'], 1),
+    ('2Y', ['2Y1', '2Y0', '2Y2'], 1),
+    ('Tek/Çift', ['Tek', 'Çift'], 1),
+    ('IY/MS', ['IY/MS 1/1', 'IY/MS 1/0', 'IY/MS 1/2', 'IY/MS 0/1', 'IY/MS 0/0', 'IY/MS 0/2', 'IY/MS 2/1', 'IY/MS 2/0', 'IY/MS 2/2'], 1),
+]
+
+MARGIN_DTYPE = 'float32'
+
+def margin_columns(groups=MARKET_GROUPS):
+    columns = []
+    for group, selections, coverage in groups:
+        columns += [f"{column} Olasılık" for column in selections]
+        columns += [f"{column} Adil" for column in selections]
+        columns.append(f"{group} Marj")
+    return columns
+
+MARGIN_COLUMNS = margin_columns()
+
+def add_market_margins(df, groups=MARKET_GROUPS):
+    # Tüm grupların oranları tek bir (satır x seçenek) matrisine alınır ve grup
+    # toplamları np.add.reduceat ile tek geçişte hesaplanır. Grubun herhangi bir oranı
+    # eksikse (NaN) o grubun tüm türetilmiş değerleri NaN olur.
+    groups = [(group, selections, coverage) for group, selections, coverage in groups if all(column in df.columns for column in selections)]
+    if not groups or df.empty:
+        return df
+
+    selections = [column for group, columns, coverage in groups for column in columns]
+    sizes = np.array([len(columns) for group, columns, coverage in groups])
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    coverage = np.array([coverage for group, columns, coverage in groups], dtype='float64')
+
+    odds = df[selections].to_numpy(dtype='float64', na_value=np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        implied = 1.0 / odds
+        # Toplam / kapsama: marjsız pazarda 1, fazlası bahis şirketinin payı
+        booksum = np.add.reduceat(implied, starts, axis=1) / coverage
+        probability = implied / np.repeat(booksum, sizes, axis=1)
+        fair_odds = 1.0 / probability
+
+    derived = {}
+    for index, (group, columns, group_coverage) in enumerate(groups):
+        block = slice(starts[index], starts[index] + sizes[index])
+        for offset, column in enumerate(columns):
+            derived[f"{column} Olasılık"] = probability[:, block][:, offset]
+        for offset, column in enumerate(columns):
+            derived[f"{column} Adil"] = fair_odds[:, block][:, offset]
+        derived[f"{group} Marj"] = booksum[:, index] - 1.0
+
+    derived_df = pd.DataFrame(derived, index=df.index).astype(MARGIN_DTYPE)
+    return pd.concat([df.drop(columns=[column for column in derived if column in df.columns]), derived_df], axis=1)
@@ -0,0 +1,108 @@
+import json
+import os
+
+import pandas as pd
+from bs4 import NavigableString, Tag
+
+from row_schema import normalize_text
+
+# Satır sözlüğünde detay satırının tüm pazar indeksinin tutulduğu anahtar;
+# DataFrame'e sütun olarak girmez, uzun formatlı pazar kataloğu için kullanılır
+MARKETS_KEY = '_markets'
+
+# Pazar kataloğunda her maçı tanımlayan sütunlar
+CATALOG_KEY_COLUMNS = ['Tarih', 'Saat', 'kickoff', 'Lig', 'Ev Sahibi', 'Deplasman']
+
+# Detay satırından okunan sütunlar: (sütun, detay başlığı, seçenek)
+DETAIL_COLUMNS = [
+    ('IY Çifte Şans 1-X', 'İlk Yarı Çifte Şans', '1/X'),
+    ('IY Çifte Şans 1-2', 'İlk Yarı Çifte Şans', '1/2'),
+    ('IY Çifte Şans X-2', 'İlk Yarı Çifte Şans', '0/2'),
+    ('IY1', 'İlk Yarı Sonucu', '1'),
+    ('IY0', 'İlk Yarı Sonucu', '0'),
+    ('IY2', 'İlk Yarı Sonucu', '2'),
+    ('2Y1', 'İkinci Yarı Sonucu', '1'),
+    ('2Y0', 'İkinci Yarı Sonucu', '0'),
+    ('2Y2', 'İkinci Yarı Sonucu', '2'),
+    ('Tek', 'Tek / Çift', 'Tek'),
+    ('Çift', 'Tek / Çift', 'Çift'),
+    ('IY/MS 1/1', 'İlk Yarı / Maç Sonucu', '1/1'),
+    ('IY/MS 1/0', 'İlk Yarı / Maç Sonucu', '1/0'),
+    ('IY/MS 1/2', 'İlk Yarı / Maç Sonucu', '1/2'),
+    ('IY/MS 0/1', 'İlk Yarı / Maç Sonucu', '0/1'),
+    ('IY/MS 0/0', 'İlk Yarı / Maç Sonucu', '0/0'),
+    ('IY/MS 0/2', 'İlk Yarı / Maç Sonucu', '0/2'),
+    ('IY/MS 2/1', 'İlk Yarı / Maç Sonucu', '2/1'),
+    ('IY/MS 2/0', 'İlk Yarı / Maç Sonucu', '2/0'),
+    ('IY/MS 2/2', 'İlk Yarı / Maç Sonucu', '2/2'),
+]
+
+# Geniş CSV'ye ek olarak yansıtılacak pazarlar; sütun adı "<başlık> <seçenek>" olur
+# Örn. IDDAA_EXTRA_MARKETS='{"Handikaplı Maç Sonucu (0:1)": ["1", "0", "2"]}'
+EXTRA_MARKETS = json.loads(os.environ.get('IDDAA_EXTRA_MARKETS') or '{}')
+EXTRA_DETAIL_COLUMNS = [(f"{header} {label}", header, label) for header, labels in EXTRA_MARKETS.items() for label in labels]
+
+def clean_odds(value):
+    if not value:
+        return '0'
+    cleaned_value = normalize_text(value)
+    return '0' if cleaned_value == '-' else cleaned_value
+
+def detail_events(detail_row):
+    # BeautifulSoup detay satırını (etiket, .string, <br> sonrası değer) olaylarına çevirir
+    for element in detail_row.descendants:
+        if not isinstance(element, Tag):
+            continue
+        if element.name == 'br':
+            value = element.next_sibling
+            if isinstance(value, NavigableString):
+                yield 'br', None, str(value)
+            elif isinstance(value, Tag):
+                yield 'br', None, value.get_text(strip=True)
+            else:
+                yield 'br', None, None
+        elif element.name in ('div', 'span'):
+            yield element.name, element.string, None
+
+def build_market_index(events):
+    # Detay satırı tek geçişte {pazar başlığı: {seçenek: oran}} sözlüğüne çevrilir
+    index = {}
+    selections = None
+    label = None
+    for tag, string, value in events:
+        if tag == 'div' and string and string.strip():
+            selections = index.setdefault(string.strip(), {})
+            label = None
+        elif tag == 'span' and string and string.strip() and selections is not None:
+            label = string.strip()
+        elif tag == 'br' and label is not None:
+            selections.setdefault(label, clean_odds(value))
+            label = None
+    return index
+
+def lookup_market(index, header_text, value_text):
+    # Önce birebir eşleşme, bulunamazsa içeren ilk başlık/seçenek (eski get_detail_value ile aynı sıra)
+    selections = index.get(header_text.strip())
+    if selections is None:
+        selections = next((selections for header, selections in index.items() if header_text in header), None)
+    if not selections:
+        return '0'
+
+    value = selections.get(value_text.strip())
+    if value is None:
+        value = next((value for label, value in selections.items() if value_text in label), '0')
+    return value
+
+def detail_data(index):
+    columns = DETAIL_COLUMNS + EXTRA_DETAIL_COLUMNS
+    return {column: lookup_market(index, header_text, value_text) for column, header_text, value_text in columns}
+
+def market_catalog(data):
+    # Satırlardaki pazar indekslerinden uzun formatlı tablo: maç başına her pazar/seçenek bir satır
+    records = []
+    for row in data:
+        key = [row.get(column) for column in CATALOG_KEY_COLUMNS]
+        for market, selections in row.get(MARKETS_KEY, {}).items():
+            for selection, odds in selections.items():
+                records.append(key + [market, selection, odds])
+    return pd.DataFrame(records, columns=CATALOG_KEY_COLUMNS + ['Pazar', 'Seçenek', 'Oran'])
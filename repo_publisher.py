@@ -0,0 +1,94 @@
+import base64
+import hashlib
+import os
+
+from github import GithubException, InputGitTreeElement
+
+class RepoPublisher:
+    # Bir çalıştırmada güncellenen tüm dosyaları Git Data API ile tek commit'te
+    # yayınlar. stage ile sadece yerel dosya yolları toplanır, içerikler bellekte
+    # tutulmaz: commit sırasında her dosyanın blob özeti dosya parça parça okunarak
+    # hesaplanır, dalın ağacıyla karşılaştırılır ve sadece değişen dosyalar blob
+    # oluşturulurken birer birer okunur. Ardından tek bir ağaç ve commit kurulur ve
+    # dal ileri alınır.
+    # Contents API'de dosya başına 2-3 istek ve ayrı bir commit gerekiyordu; burada
+    # istek sayısı 5 + değişen dosya sayısıdır.
+    FILE_MODE = '100644'
+    MAX_ATTEMPTS = 3
+
+    def __init__(self, repo, branch=None):
+        self.repo = repo
+        self.branch = branch or repo.default_branch
+        # {repo'daki yol: yerel dosya yolu}
+        self.files = {}
+        # Yeniden denemelerde aynı içerik için blob tekrar oluşturulmaz: {yol: (özet, blob sha)}
+        self.blobs = {}
+
+    def stage(self, path, local_path):
+        self.files[path] = local_path
+
+    def commit(self, message):
+        # Yayınlanan yolların listesi döner; değişiklik yoksa commit oluşturulmaz.
+        # Dal bu sırada başka bir çalıştırma tarafından ilerletilirse (fast-forward
+        # olmayan güncelleme, 422) değişiklikler yeni uca göre yeniden kurulur.
+        digests = {path: file_blob_sha(local_path) for path, local_path in self.files.items()}
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            ref = self.repo.get_git_ref(f"heads/{self.branch}")
+            head = self.repo.get_git_commit(ref.object.sha)
+            existing = self.tree_blobs(head)
+            changed = [path for path, digest in digests.items() if existing.get(path) != digest]
+            if not changed:
+                print("Hedef repo'da değişen dosya yok, commit atlanıyor")
+                self.files.clear()
+                return []
+
+            elements = [InputGitTreeElement(path, self.FILE_MODE, 'blob', sha=self.create_blob(path, digests[path])) for path in sorted(changed)]
+            tree = self.repo.create_git_tree(elements, head.tree)
+            commit = self.repo.create_git_commit(message, tree, [head])
+            try:
+                ref.edit(commit.sha)
+            except GithubException as e:
+                if e.status != 422 or attempt == self.MAX_ATTEMPTS:
+                    raise
+                print(f"{self.branch} dalı değişmiş, commit yeniden kuruluyor ({attempt}/{self.MAX_ATTEMPTS})")
+                continue
+            for path in sorted(changed):
+                print(f"Updated {path} successfully")
+            self.files.clear()
+            return changed
+
+    def tree_blobs(self, commit):
+        # {yol: blob sha}; içerikler indirilmez
+        return {element.path: element.sha for element in self.repo.get_git_tree(commit.tree.sha, recursive=True).tree if element.type == 'blob'}
+
+    def published_blobs(self):
+        # Dalın ucundaki dosyalar
+        ref = self.repo.get_git_ref(f"heads/{self.branch}")
+        return self.tree_blobs(self.repo.get_git_commit(ref.object.sha))
+
+    def download(self, sha, local_path):
+        # Yayınlanmış bir dosyayı diske yazar; 1 MB üzerindeki dosyalar da blob olarak
+        # tek istekte gelir, bellekte aynı anda sadece bu dosya bulunur
+        blob = self.repo.get_git_blob(sha)
+        os.makedirs(os.path.dirname(local_path) or '.', exist_ok=True)
+        with open(local_path, 'wb') as f:
+            f.write(base64.b64decode(blob.content))
+
+    def create_blob(self, path, digest):
+        cached = self.blobs.get(path)
+        if cached and cached[0] == digest:
+            return cached[1]
+        # İstek gövdesi için dosyanın tamamı gerekir; aynı anda sadece bir dosya bellekte
+        with open(self.files[path], 'rb') as f:
+            content = base64.b64encode(f.read()).decode('ascii')
+        blob = self.repo.create_git_blob(content, 'base64')
+        self.blobs[path] = (digest, blob.sha)
+        return blob.sha
+
+def file_blob_sha(local_path, chunk_size=1 << 20):
+    # git hash-object ile aynı özet: sha1("blob <boyut>\0" + içerik), dosya parça parça okunur
+    digest = hashlib.sha1(b'blob %d\0' % os.path.getsize(local_path))
+    with open(local_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
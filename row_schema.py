@@ -0,0 +1,124 @@
+# Maç satırı sütunlarının tablo başlığına göre eşlenmesi. Sayfa başına bir kez
+# başlık satırı okunur ve sütun adı -> hücre sırası -> okuma şekli şeması derlenir;
+# her maç satırına bu şema dallanmadan uygulanır.
+
+class TableLayoutError(ValueError):
+    # Sayfa beklenen tablo düzenine uymuyor; WeekPipeline sadece o haftayı atlar
+    pass
+
+# (sütun, başlık etiketi, okuma şekli, zorunlu mu)
+# Başlık etiketi None ise sütun bir önceki sütunla aynı hücreden okunur.
+# Aynı etiket birden çok kez geçiyorsa (1/0/2, Alt/Üst ...) sırayla eşlenir.
+COLUMN_SPECS = [
+    ('Tarih', 'Tarih', 'date', True),
+    ('Saat', None, 'time', True),
+    ('kickoff', None, 'kickoff', True),
+    ('Lig', 'Lig', 'text', True),
+    ('MBS', 'MBS', 'text', True),
+    ('Ev Sahibi', 'Ev Sahibi', 'team', True),
+    ('Skor', 'Skor', 'text', True),
+    ('Deplasman', 'Deplasman', 'team', True),
+    ('İY', 'İY', 'text', True),
+    ('MS1', '1', 'bet', True),
+    ('MS0', '0', 'bet', True),
+    ('MS2', '2', 'bet', True),
+    ('AU2.5 Alt', 'Alt', 'bet', True),
+    ('AU2.5 Üst', 'Üst', 'bet', True),
+    ('KG Var', 'Var', 'bet', True),
+    ('KG Yok', 'Yok', 'bet', True),
+    ('IY0.5 Alt', 'Alt', 'bet', True),
+    ('IY0.5 Üst', 'Üst', 'bet', True),
+    ('AU1.5 Alt', 'Alt', 'bet', True),
+    ('AU1.5 Üst', 'Üst', 'bet', True),
+    ('Çifte Şans 1-X', '1-X', 'bet', False),
+    ('Çifte Şans 1-2', '1-2', 'bet', False),
+    ('Çifte Şans X-2', 'X-2', 'bet', False),
+]
+
+# Sayfada başlık satırı yoksa kullanılan, sitenin bilinen düzeni
+DEFAULT_HEADER_LABELS = [
+    'Tarih', 'Kod', 'Lig', 'MBS', 'Ev Sahibi', 'Skor', 'Deplasman', 'İY',
+    '1', '0', '2', 'Alt', 'Üst', 'Var', 'Yok', 'Alt', 'Üst', 'Alt', 'Üst',
+    '', '1-X', '1-2', 'X-2',
+]
+
+def normalize_text(text):
+    # Hücre metnindeki boşluk dizileri tek boşluğa indirilir, baş ve sondaki boşluklar atılır
+    return ' '.join(text.split()) if text else text
+
+def normalize_label(label):
+    return normalize_text(label).casefold()
+
+def expand_header_labels(cells):
+    # cells: başlık hücrelerinin (metin, colspan özniteliği) ikilileri. colspan'li
+    # başlıklar kapladıkları hücre sayısı kadar tekrarlanır; böylece etiketlerin
+    # sırası maç satırlarındaki hücre sırasıyla aynı olur
+    labels = []
+    for text, colspan in cells:
+        try:
+            span = max(1, int(colspan or 1))
+        except ValueError:
+            span = 1
+        labels.extend([text] * span)
+    return labels
+
+class ColumnSchema:
+    def __init__(self, columns, constants, required_width):
+        # columns: [(sütun, hücre sırası, okuma şekli)], constants: sayfada olmayan isteğe bağlı sütunlar
+        # required_width: zorunlu sütunların hepsini içeren en kısa satırın hücre sayısı
+        self.columns = columns
+        self.constants = constants
+        self.indices = {column: index for column, index, kind in columns}
+        self.required_width = required_width
+
+    def bind(self, readers):
+        # Okuma şekillerini çıkarıcıya özgü fonksiyonlara bağlar: [(sütun, hücre sırası, fonksiyon)]
+        return [(column, index, readers[kind]) for column, index, kind in self.columns]
+
+    def read_row(self, cells, columns):
+        # columns: bind ile bağlanmış sütunlar. Zorunlu bir sütunun hücresi yoksa tablo
+        # düzeni değişmiştir; isteğe bağlı sütunları (Çifte Şans) olmayan kısa satırlar
+        # o sütunlar boş okunarak kabul edilir
+        if len(cells) < self.required_width:
+            raise TableLayoutError(f"Maç satırında {len(cells)} hücre var, tablo düzeni en az {self.required_width} hücre bekliyor.")
+        row_data = {column: read(cells[index]) if index < len(cells) else '' for column, index, read in columns}
+        row_data.update(self.constants)
+        return row_data
+
+def compile_column_schema(header_labels):
+    labels = [normalize_label(label) for label in header_labels]
+    columns = []
+    constants = {}
+    position = 0
+    previous_index = None
+    required_width = 0
+
+    for column, label, kind, required in COLUMN_SPECS:
+        if label is None:
+            columns.append((column, previous_index, kind))
+            if required:
+                required_width = max(required_width, previous_index + 1)
+            continue
+
+        wanted = normalize_label(label)
+        index = next((i for i in range(position, len(labels)) if labels[i] == wanted), None)
+        if index is None:
+            if required:
+                raise TableLayoutError(
+                    f"Tablo düzeni değişmiş: '{column}' sütunu için '{label}' başlığı bulunamadı. "
+                    f"Sayfadaki başlıklar: {header_labels}"
+                )
+            constants[column] = ''
+            continue
+
+        columns.append((column, index, kind))
+        previous_index = index
+        position = index + 1
+        if required:
+            required_width = max(required_width, index + 1)
+
+    return ColumnSchema(columns, constants, required_width)
+
+# Başlık satırı olmayan sayfaların şeması. İsteğe bağlı sütunları olmayan kısa
+# satırlar read_row'da kabul edildiği için ilk satırın genişliğine göre kısaltılmaz.
+DEFAULT_SCHEMA = compile_column_schema(DEFAULT_HEADER_LABELS)
@@ -0,0 +1,64 @@
+import os
+
+from frame_schema import FRAME_COLUMNS, MatchIndex
+
+class CsvSink:
+    # DataFrame'leri geldikleri sırayla tek bir CSV dosyasının sonuna ekler. Sütunlar
+    # ilk yazımda sabitlenir, sonraki parçalar aynı sıraya getirilir.
+
+    def __init__(self, path, columns=None):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.columns = columns
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.header_written = False
+        self.rows = 0
+
+    def write(self, df):
+        if self.columns is None:
+            self.columns = list(df.columns)
+        df.reindex(columns=self.columns).to_csv(self.file, header=not self.header_written, index=False)
+        self.header_written = True
+        self.rows += len(df)
+
+    def close(self):
+        self.file.close()
+
+class LeagueSink:
+    # Bir ligin satırlarını hafta tamamlandıkça CSV'ye ve varsa sütunlu/SQLite
+    # depolara yazar; bellekte sadece o hafta ve görülen maç kimlikleri tutulur.
+    # Haftalar yeniden eskiye geldiği için bir maçın en yeni haftadaki satırı kalır.
+
+    def __init__(self, league_slug, path, stores=(), columns=FRAME_COLUMNS):
+        self.league_slug = league_slug
+        self.csv = CsvSink(path, columns)
+        self.match_index = MatchIndex()
+        self.stores = list(stores)
+        # Yayınlanmış eski satırlar sadece ligi henüz içermeyen depolara yazılır
+        self.previous_stores = [store for store in self.stores if not store.has_league(league_slug)]
+        self.weeks = 0
+        self.duplicates = 0
+
+    def write(self, df, stores=None):
+        match_count = len(df)
+        df = self.match_index.drop_seen(df)
+        self.duplicates += match_count - len(df)
+        if df.empty:
+            return
+        self.csv.write(df)
+        for store in self.stores if stores is None else stores:
+            store.write_weeks(self.league_slug, df)
+
+    def write_week(self, df):
+        self.weeks += 1
+        self.write(df)
+
+    def write_previous(self, df):
+        self.write(df, self.previous_stores)
+
+    @property
+    def rows(self):
+        return self.csv.rows
+
+    def close(self):
+        self.csv.close()
@@ -1,11 +1,21 @@
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
 import time
 import os
+import sys
+from contextlib import nullcontext
 from github import Github
 
+from columnar_store import ColumnarStore
+from sqlite_store import SqliteStore
+from frame_schema import FRAME_COLUMNS, apply_frame_schema
+from market_margins import MARGIN_COLUMNS, add_market_margins
+from iddaa import LEAGUES, ParsePool, extract_league_rows, select_leagues, get_current_week, print_week_metrics
+from week_cache import WeekCache
+from http_session import print_request_timings
+from repo_publisher import RepoPublisher
+from row_sink import CsvSink, LeagueSink
+from week_pipeline import WeekPipeline
+
 # GitHub token'larını ortam değişkenlerinden al
 SOURCE_REPO_TOKEN = os.environ.get('SOURCE_REPO_TOKEN')
 TARGET_REPO_TOKEN = os.environ.get('TARGET_REPO_TOKEN')
@@ -17,310 +27,234 @@ target_github = Github(TARGET_REPO_TOKEN)
 # Hedef repo bilgileri
 TARGET_REPO_OWNER = 'analysematchodds'
 TARGET_REPO_NAME = 'match_odds_csv'
-TARGET_FILE_PATH = 'matchodds.csv'
 
-def get_current_week():
-    try:
-        base_url = "https://www.spordb.com/view/iddaa_program_table.php"
-        response = requests.get(base_url)
-        response.raise_for_status()  # HTTP hatalarını kontrol eder
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Doğru select etiketini bul
-        select_tag = soup.find('select', {'id': 'iddaa_daterange'})
-        if not select_tag:
-            raise ValueError("iddaa_daterange select etiketi bulunamadı.")
-        
-        # En üstteki option etiketini al
-        top_option_tag = select_tag.find('option')
-        if top_option_tag and top_option_tag.has_attr('value'):
-            return int(top_option_tag['value'])  # En üst option'un value değerini döndür
-
-    except Exception as e:
-        print(f"Mevcut hafta kontrolünde hata: {str(e)}")
-    
-    return None
-
-start_week = get_current_week()
 end_week = 1810
 
-def get_detail_value(detail_row, header_text, value_text):
-    try:
-        div = detail_row.find('div', string=lambda x: x and x.strip() == header_text.strip())
-        if not div:
-            div = detail_row.find('div', string=lambda x: x and header_text in x)
-            
-        if div:
-            span = div.find_next('span', string=lambda x: x and x.strip() == value_text.strip())
-            if not span:
-                span = div.find_next('span', string=lambda x: x and value_text in x)
-                
-            if span:
-                next_element = span.find_next('br')
-                if next_element:
-                    value = next_element.next_sibling
-                    if value and isinstance(value, str):
-                        cleaned_value = value.strip()
-                        return '0' if cleaned_value == '-' else cleaned_value
-                    elif hasattr(value, 'get_text'):
-                        cleaned_value = value.get_text(strip=True)
-                        return '0' if cleaned_value == '-' else cleaned_value
-    except Exception:
-        pass
-    return '0'
-
-def get_cell_value(cell):
-    bet_span = cell.find('span', {'class': ['betwhite', 'betred']})
-    return bet_span.get_text(strip=True) if bet_span else cell.get_text(strip=True)
-
-def get_team_name(cell):
-    mobile_span = cell.find('span', {'class': 'hide-on-desktop'})
-    desktop_span = cell.find('span', {'class': 'hide-on-mobile'})
-    return desktop_span.get_text(strip=True) if desktop_span else mobile_span.get_text(strip=True) if mobile_span else cell.get_text(strip=True)
-
-def get_date_value(cell):
-    date_span = cell.find('span', attrs={'date': True})
-    if date_span and date_span.get('date'):
-        try:
-            dt = datetime.strptime(date_span.get('date'), '%Y-%m-%d %H:%M:%S')
-            return dt.strftime('%d.%m.%Y')
-        except ValueError:
-            pass
-    icon = cell.find('i', {'class': 'fa-angle-double-right'})
-    return icon.get('title') if icon and icon.get('title') else ''
-
-def get_iddaa_data(iddaa_hafta):
-    try:
-        ajax_url = "https://www.spordb.com/view/iddaa_program_table.php"
-        params = {
-            'iddaa_hafta': str(iddaa_hafta),
-            'tarih': '*',
-            'orderby': 'lig'
-        }
-        
-        print(f"\n{iddaa_hafta} haftası verileri yükleniyor...")
-        
-        # Stream kullanarak veriyi parça parça al
-        with requests.get(ajax_url, params=params, stream=True) as response:
-            content = ''
-            found_league = False
-            found_next_league = False
-            buffer = ''
-            
-            current_league_string = "Türkiye - Süper Lig"
-            current_league_slug = "TÜR S"
-            
-            for chunk in response.iter_content(chunk_size=4096, decode_unicode=True):
-                if chunk:
-                    buffer += chunk
-                    
-                    # Yeterli veri biriktiğinde işle
-                    if len(buffer) > 8192:
-                        content += buffer
-                        buffer = ''
-                    
-                    # İstenen lig başlığını bul
-                    if current_league_string in content and not found_league:
-                        found_league = True
-                        print(f"{current_league_string} bölümü bulundu!")
-                    
-                    # Bir sonraki lig başlığını bul
-                    if found_league and not found_next_league:
-                        soup_temp = BeautifulSoup(content, 'html.parser')
-                        headers = soup_temp.find_all('tr', {'class': 'tablemainheader'})
-                        
-                        for i, header in enumerate(headers):
-                            if current_league_string in header.get_text():
-                                # Bir sonraki header varsa ve farklı bir ligi gösteriyorsa
-                                if i + 1 < len(headers) and current_league_string not in headers[i+1].get_text():
-                                    found_next_league = True
-                                    print(f"{current_league_string} bölümü tamamlandı!")
-                                    break
-                    
-                    if found_next_league:
-                        break
-            
-            # Son buffer'ı da ekle
-            content += buffer
-            
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Lig başlığını bul
-            lig_header = soup.find('tr', {'class': 'tablemainheader'}, 
-                string=lambda x: x and current_league_string in str(x))
-            
-            if not lig_header:
-                print(f"{current_league_string} başlığı bulunamadı!")
-                return None
-            
-            # Maçları topla
-            data = []
-            current_row = lig_header.find_next_sibling('tr')
-            
-            # Bir sonraki lige kadar olan tüm futbol maçlarını al
-            while current_row:
-                if current_row.get('class', [''])[0] == 'tablemainheader':
-                    break
-                
-                filter_value = current_row.get('filtervalue', '')
-                if 'futbol' in filter_value:
-                    cells = current_row.find_all(['td'])
-                    if cells and len(cells) > 2:
-                        lig_cell = cells[2].get_text(strip=True)
-                        if lig_cell != current_league_slug:
-                            break
-                            
-                        # Mevcut veri toplama mantığını koru
-                        mbs_value = cells[3].get_text(strip=True)
-                        if (mbs_value == '1') & (lig_cell == current_league_slug):
-                            row_data = {
-                                'Tarih': get_date_value(cells[0]),
-                                'Saat': cells[0].find('span').get_text(strip=True),
-                                'Lig': lig_cell,
-                                'MBS': mbs_value,
-                                'Ev Sahibi': get_team_name(cells[4]),
-                                'Skor': cells[5].get_text(strip=True),
-                                'Deplasman': get_team_name(cells[6]),
-                                'İY': cells[7].get_text(strip=True),
-                                'MS1': get_cell_value(cells[8]),
-                                'MS0': get_cell_value(cells[9]),
-                                'MS2': get_cell_value(cells[10]),
-                                'AU2.5 Alt': get_cell_value(cells[11]),
-                                'AU2.5 Üst': get_cell_value(cells[12]),
-                                'KG Var': get_cell_value(cells[13]),
-                                'KG Yok': get_cell_value(cells[14]),
-                                'IY0.5 Alt': get_cell_value(cells[15]),
-                                'IY0.5 Üst': get_cell_value(cells[16]),
-                                'AU1.5 Alt': get_cell_value(cells[17]),
-                                'AU1.5 Üst': get_cell_value(cells[18]),
-                                'Çifte Şans 1-X': get_cell_value(cells[20]) if len(cells) > 20 else '',
-                                'Çifte Şans 1-2': get_cell_value(cells[21]) if len(cells) > 21 else '',
-                                'Çifte Şans X-2': get_cell_value(cells[22]) if len(cells) > 22 else '',
-                            }
-                            
-                            detail_row = current_row.find_next_sibling('tr', {'class': 'detail'})
-                            if detail_row:
-                                detail_data = {
-                                    'IY Çifte Şans 1-X': get_detail_value(detail_row, 'İlk Yarı Çifte Şans', '1/X'),
-                                    'IY Çifte Şans 1-2': get_detail_value(detail_row, 'İlk Yarı Çifte Şans', '1/2'),
-                                    'IY Çifte Şans X-2': get_detail_value(detail_row, 'İlk Yarı Çifte Şans', '0/2'),
-                                    'IY1': get_detail_value(detail_row, 'İlk Yarı Sonucu', '1'),
-                                    'IY0': get_detail_value(detail_row, 'İlk Yarı Sonucu', '0'),
-                                    'IY2': get_detail_value(detail_row, 'İlk Yarı Sonucu', '2'),
-                                    '2Y1': get_detail_value(detail_row, 'İkinci Yarı Sonucu', '1'),
-                                    '2Y0': get_detail_value(detail_row, 'İkinci Yarı Sonucu', '0'),
-                                    '2Y2': get_detail_value(detail_row, 'İkinci Yarı Sonucu', '2'),
-                                    'Tek': get_detail_value(detail_row, 'Tek / Çift', 'Tek'),
-                                    'Çift': get_detail_value(detail_row, 'Tek / Çift', 'Çift'),
-                                    'IY/MS 1/1': get_detail_value(detail_row, 'İlk Yarı / Maç Sonucu', '1/1'),
-                                    'IY/MS 1/0': get_detail_value(detail_row, 'İlk Yarı / Maç Sonucu', '1/0'),
-                                    'IY/MS 1/2': get_detail_value(detail_row, 'İlk Yarı / Maç Sonucu', '1/2'),
-                                    'IY/MS 0/1': get_detail_value(detail_row, 'İlk Yarı / Maç Sonucu', '0/1'),
-                                    'IY/MS 0/0': get_detail_value(detail_row, 'İlk Yarı / Maç Sonucu', '0/0'),
-                                    'IY/MS 0/2': get_detail_value(detail_row, 'İlk Yarı / Maç Sonucu', '0/2'),
-                                    'IY/MS 2/1': get_detail_value(detail_row, 'İlk Yarı / Maç Sonucu', '2/1'),
-                                    'IY/MS 2/0': get_detail_value(detail_row, 'İlk Yarı / Maç Sonucu', '2/0'),
-                                    'IY/MS 2/2': get_detail_value(detail_row, 'İlk Yarı / Maç Sonucu', '2/2')
-                                }
-                                row_data.update(detail_data)
-                            
-                            data.append(row_data)
-                
-                current_row = current_row.find_next_sibling('tr')
-            
-            if not data:
-                print(f"\n{current_league_string} maçı bulunamadı!")
-                return None
-            
-            print(f"Bulunan {current_league_string} maç sayısı: {len(data)}")
-            
-            df = pd.DataFrame(data)
-            
-            # Mevcut veri temizleme işlemlerini koru
-            for col in df.columns:
-                if df[col].dtype == 'object':
-                    df[col] = df[col].str.replace(r'\s+', ' ', regex=True).str.strip()
-
-            if 'Tarih' in df.columns:
-                df['Tarih'] = pd.to_datetime(df['Tarih'], format='%d.%m.%Y', errors='coerce')
-
-            if 'Saat' in df.columns:
-                df['Saat'] = pd.to_datetime(df['Saat'], format='%H:%M', errors='coerce').dt.time
-                
-            if 'Tarih' in df.columns and 'Saat' in df.columns:
-                df = df.sort_values(by=['Tarih', 'Saat'], ascending=[False, False]).reset_index(drop=True)
-            
-            return df
-            
-    except Exception as e:
-        print(f"Hata oluştu (Hafta {iddaa_hafta}): {str(e)}")
-        return None
+# Ham hafta sayfalarının saklandığı önbellek dizini
+CACHE_DIR = os.environ.get('IDDAA_CACHE_DIR', '.iddaa_cache')
+
+# Yayınlanmadan önce lig CSV'lerinin hafta hafta yazıldığı dizin
+OUTPUT_DIR = os.environ.get('IDDAA_OUTPUT_DIR', '.iddaa_output')
+
+# Aynı anda indirilecek hafta sayısı (spordb için ayrıca http_session.HOST_CONCURRENCY sınırı uygulanır)
+FETCH_WORKERS = int(os.environ.get('FETCH_WORKERS', '4'))
+
+# Hafta sayfalarını ayrıştıran süreç sayısı; 1 ise ayrıştırma ana süreçteki tek bir thread'de yapılır.
+# Süreç havuzu (forkserver + pandas içe aktaran işçiler) sadece en az PARSE_POOL_MIN_WEEKS
+# haftalık geri doldurmalarda açılır; artımlı çalıştırmanın birkaç haftası ana süreçte ayrıştırılır
+PARSE_WORKERS = int(os.environ.get('PARSE_WORKERS', '1'))
+PARSE_POOL_MIN_WEEKS = int(os.environ.get('PARSE_POOL_MIN_WEEKS', '50'))
+
+# İndirme/ayrıştırma hattında aynı anda bulunabilecek hafta sayısı (0: indirici + ayrıştırıcı sayısı)
+PIPELINE_DEPTH = int(os.environ.get('PIPELINE_DEPTH', '0'))
+
+# 'full': tüm geçmiş yeniden toplanır, 'incremental': yayınlanmış CSV'ye sadece son haftalar eklenir
+SCRAPE_MODE = os.environ.get('SCRAPE_MODE', 'full')
+INCREMENTAL_WEEKS = int(os.environ.get('INCREMENTAL_WEEKS', '4'))
+# Artımlı modda yayınlanmış CSV'nin bir seferde okunan satır sayısı
+PREVIOUS_CHUNK_ROWS = int(os.environ.get('PREVIOUS_CHUNK_ROWS', '50000'))
+
+# MARKET_CATALOG=1 ise her lig için tüm pazar/seçenek oranlarını içeren uzun formatlı
+# <dosya>_markets.csv de yayınlanır (sadece tam çalıştırmada)
+MARKET_CATALOG = os.environ.get('MARKET_CATALOG') == '1'
+
+# IDDAA_MARKET_MARGINS=1 ise yazılan maç tablolarına pazar grubu marjları, olasılıklar ve
+# adil oranlar eklenir (market_margins.MARGIN_COLUMNS)
+MARKET_MARGINS = os.environ.get('IDDAA_MARKET_MARGINS') == '1'
+
+# Verilirse CSV'lere ek olarak lig başına bir Parquet dosyası bu dizine yazılır (pyarrow gerekir)
+COLUMNAR_DIR = os.environ.get('COLUMNAR_DIR')
+
+# Verilirse tüm ligler bu SQLite veritabanındaki matches tablosuna da yazılır (upsert)
+SQLITE_PATH = os.environ.get('SQLITE_PATH')
+
+def with_margins(df):
+    return add_market_margins(df) if MARKET_MARGINS else df
+
+def process_week_data(hafta, week_data, leagues, sinks, missing_weeks, weekly_match_counts):
+    for league in leagues:
+        league_slug = league['league_slug']
+        df = week_data.get(league_slug)
 
-def collect_historical_data(start_week=1832, end_week=1820):
-    print("Geçmiş veriler toplanıyor...")
-    all_data = []
-    missing_weeks = []
-    weekly_match_counts = {}  # Her hafta için maç sayısını takip et
-    
-    for hafta in range(start_week, end_week-1, -1):
-        df = get_iddaa_data(hafta)
-        
         if df is not None and not df.empty:
             match_count = len(df)
-            weekly_match_counts[hafta] = match_count
+            weekly_match_counts[league_slug][hafta] = match_count
             if match_count < 3:  # Bir haftada en az 3 maç olmalı
-                print(f"⚠️ Hafta {hafta}: Sadece {match_count} maç bulundu!")
-            
+                print(f"⚠️ {league_slug} Hafta {hafta}: Sadece {match_count} maç bulundu!")
+
             df['Hafta'] = hafta
-            all_data.append(df)
-            print(f"{hafta}. hafta verileri çekildi. ({match_count} maç)")
+            sinks[league_slug].write_week(with_margins(df))
+            print(f"{league_slug} {hafta}. hafta verileri çekildi. ({match_count} maç)")
         else:
-            missing_weeks.append(hafta)
-            print(f"⚠️ {hafta}. hafta verisi alınamadı!")
-    
-    print("\nHaftalık maç sayıları:")
-    for hafta, count in weekly_match_counts.items():
-        print(f"Hafta {hafta}: {count} maç")
-    print(f"\nEksik haftalar: {missing_weeks}")
-    
-    if all_data:
-        final_df = pd.concat(all_data, ignore_index=True)
-        initial_rows = len(final_df)
-        final_df = final_df.drop_duplicates(subset=['Saat', 'Ev Sahibi', 'Deplasman', 'MS1', 'MS0', 'MS2'])
-        duplicate_rows = initial_rows - len(final_df)
-        
-        print(f"\nToplam {len(all_data)} hafta verisi toplandı")
-        print(f"Toplam {len(final_df)} maç verisi bulundu")
-        if duplicate_rows > 0:
-            print(f"{duplicate_rows} duplike kayıt temizlendi")
-        
-        # DataFrame'i CSV formatına dönüştür
-        csv_content = final_df.to_csv(index=False, encoding='utf-8-sig')
-        
-        # Hedef repo'ya dosyayı güncelle veya oluştur
-        update_file_in_target_repo(TARGET_FILE_PATH, csv_content, "Update matchodds.csv")
-        
-        return final_df
-    else:
-        print("Hiç veri toplanamadı!")
-        return None
+            missing_weeks[league_slug].append(hafta)
+            print(f"⚠️ {league_slug} {hafta}. hafta verisi alınamadı!")
+
+def collect_historical_data(start_week=1832, end_week=1820, leagues=LEAGUES, cache=None, workers=FETCH_WORKERS, previous_blobs=None, parse_workers=PARSE_WORKERS, incremental_first_week=None):
+    # Dönüş değeri: {lig kısaltması: yazılan CSV dosyasının yolu veya None}
+    # previous_blobs: {lig kısaltması: yayınlanmış CSV'nin blob sha'sı}. Bu ligler için
+    # incremental_first_week'ten eski haftalar atlanır ve yayınlanmış satırlar lig
+    # kapanırken parça parça eklenir; CSV'si olmayan ligler aynı geçişte tüm aralıkta toplanır
+    print("Geçmiş veriler toplanıyor...")
+    previous_blobs = previous_blobs or {}
+    missing_weeks = {league['league_slug']: [] for league in leagues}
+    weekly_match_counts = {league['league_slug']: {} for league in leagues}  # Her hafta için maç sayısını takip et
+    # Katalog sadece tüm geçmişi yeniden toplanan ligler için yazılır
+    with_catalog = MARKET_CATALOG and any(league['league_slug'] not in previous_blobs for league in leagues)
+    columnar_store = ColumnarStore(COLUMNAR_DIR) if COLUMNAR_DIR else None
+    sqlite_store = SqliteStore(SQLITE_PATH) if SQLITE_PATH else None
+    stores = [store for store in (columnar_store, sqlite_store) if store]
+    # Tüm liglerin CSV'leri çalıştırma sonunda hedef repo'ya tek commit olarak yazılır
+    publisher = RepoPublisher(get_target_repo())
+
+    # Satırlar her hafta tamamlandıkça dosyaya yazılır, bellekte tüm geçmiş biriktirilmez
+    file_paths = {league['league_slug']: league['file_path'] for league in leagues}
+    columns = FRAME_COLUMNS + (MARGIN_COLUMNS if MARKET_MARGINS else [])
+    sinks = {league_slug: LeagueSink(league_slug, os.path.join(OUTPUT_DIR, file_path), stores, columns) for league_slug, file_path in file_paths.items()}
+    catalog_sinks = {}
+
+    weeks = list(range(start_week, end_week-1, -1))
+    parse_workers = min(max(1, parse_workers), len(weeks))
+    if len(weeks) < PARSE_POOL_MIN_WEEKS:
+        parse_workers = 1
+    parse_pool = ParsePool(parse_workers) if parse_workers > 1 else None
+    parse = parse_pool or extract_league_rows
 
-def update_file_in_target_repo(file_path, content, commit_message):
-    target_repo = target_github.get_user(TARGET_REPO_OWNER).get_repo(TARGET_REPO_NAME)
+    # Her hafta sayfası bir kez indirilir ve tüm ligler aynı geçişte ayrıştırılır.
+    # Haftalar paralel indirilir ve ayrıştırılır, sonuçlar ise her zaman hafta sırasıyla
+    # işlenir. Ayrıştırma thread'leri süreç havuzunun sonucunu beklediğinden sayıları
+    # ayrıştırıcı süreç sayısı kadardır; ağ eşzamanlılığını http_session.HOST_CONCURRENCY sınırlar.
+    pipeline = WeekPipeline(leagues, cache, workers, parse, parse_workers, PIPELINE_DEPTH, with_catalog)
+    with parse_pool or nullcontext():
+        for hafta, week_data, week_catalogs in pipeline.run(weeks):
+            week_leagues = leagues
+            if incremental_first_week is not None and hafta < incremental_first_week:
+                week_leagues = [league for league in leagues if league['league_slug'] not in previous_blobs]
+            process_week_data(hafta, week_data, week_leagues, sinks, missing_weeks, weekly_match_counts)
+            for league_slug, catalog in (week_catalogs or {}).items():
+                if league_slug in previous_blobs:
+                    continue
+                catalog['Hafta'] = hafta
+                if league_slug not in catalog_sinks:
+                    catalog_path = os.path.join(OUTPUT_DIR, markets_file_path(file_paths[league_slug]))
+                    catalog_sinks[league_slug] = CsvSink(catalog_path)
+                catalog_sinks[league_slug].write(catalog)
+    if pipeline.layout_errors:
+        print(f"\n⚠️ Tablo düzenine uymadığı için atlanan haftalar: {pipeline.layout_errors}")
+
+    outputs = {}
+    for league in leagues:
+        league_slug = league['league_slug']
+        file_path = league['file_path']
+        sink = sinks[league_slug]
+
+        print(f"\n{league_slug} haftalık maç sayıları:")
+        for hafta, count in weekly_match_counts[league_slug].items():
+            print(f"Hafta {hafta}: {count} maç")
+        print(f"\n{league_slug} eksik haftalar: {missing_weeks[league_slug]}")
+
+        if league_slug in previous_blobs:
+            # Yeniden çekilen haftaların eski satırları atılır; aynı maç başka haftada
+            # yayınlanmışsa yeni satır kalır (upsert). Eski haftalar yenilerden sonra gelir.
+            fetched_weeks = list(weekly_match_counts[league_slug])
+            for previous_df in read_previous_csv(publisher, previous_blobs[league_slug], f"{sink.csv.path}.previous"):
+                sink.write_previous(with_margins(previous_df[~previous_df['Hafta'].isin(fetched_weeks)]))
+        sink.close()
+        catalog_sink = catalog_sinks.get(league_slug)
+        if catalog_sink:
+            catalog_sink.close()
+
+        if sink.rows:
+            if columnar_store and league_slug not in previous_blobs:
+                # Tam çalıştırmada artık veride olmayan haftalar Parquet dosyasına taşınmaz
+                columnar_store.prune(league_slug)
+
+            print(f"\nToplam {sink.weeks} hafta {league_slug} verisi toplandı")
+            print(f"Toplam {sink.rows} maç verisi bulundu")
+            if sink.duplicates > 0:
+                print(f"{sink.duplicates} duplike kayıt temizlendi")
+
+            publisher.stage(file_path, sink.csv.path)
+            outputs[league_slug] = sink.csv.path
+
+            if catalog_sink:
+                catalog_path = markets_file_path(file_path)
+                publisher.stage(catalog_path, catalog_sink.path)
+        else:
+            print(f"{league_slug} için hiç veri toplanamadı!")
+            outputs[league_slug] = None
+
+    if publisher.files:
+        published = sorted(publisher.files)
+        publisher.commit(f"Update {len(published)} files\n\n" + "\n".join(published))
+
+    if columnar_store:
+        columnar_store.save_manifest()
+    if sqlite_store:
+        sqlite_store.close()
+
+    return outputs
+
+def markets_file_path(file_path):
+    return file_path.replace('.csv', '_markets.csv')
+
+def read_published_csv(source, chunksize):
+    # Yayınlanmış CSV'yi chunksize satırlık parçalar halinde maç tablosu tipleriyle verir
+    for df in pd.read_csv(source, dtype=str, keep_default_na=False, encoding='utf-8-sig', chunksize=chunksize):
+        df['Tarih'] = pd.to_datetime(df['Tarih'], format='%Y-%m-%d', errors='coerce')
+        df['Saat'] = pd.to_datetime(df['Saat'], format='%H:%M:%S', errors='coerce').dt.time
+        df['Hafta'] = df['Hafta'].astype(int)
+        yield apply_frame_schema(df)
+
+def read_previous_csv(publisher, sha, local_path):
+    # Ligin yayınlanmış CSV'si sadece lig kapanırken diske indirilip parça parça okunur
+    publisher.download(sha, local_path)
     try:
-        # Mevcut dosyayı al
-        file = target_repo.get_contents(file_path)
-        # Dosyayı güncelle
-        target_repo.update_file(file_path, commit_message, content, file.sha)
-        print(f"Updated {file_path} successfully")
-    except Exception as e:
-        # Dosya yoksa yeni dosya oluştur
-        target_repo.create_file(file_path, commit_message, content)
-        print(f"Created {file_path} successfully")
+        yield from read_published_csv(local_path, PREVIOUS_CHUNK_ROWS)
+    finally:
+        os.remove(local_path)
 
-if __name__ == "__main__":
+def get_target_repo():
+    return target_github.get_user(TARGET_REPO_OWNER).get_repo(TARGET_REPO_NAME)
+
+def load_published_blobs(leagues):
+    # Dalın ağacından liglerin yayınlanmış CSV'lerinin blob sha'ları; içerikler burada
+    # indirilmez. CSV'si olmayan ligler sonuçta yer almaz, sadece onlar baştan toplanır
+    published = RepoPublisher(get_target_repo()).published_blobs()
+    return {league['league_slug']: published[league['file_path']] for league in leagues if league['file_path'] in published}
+
+def run(league_slugs=None):
+    # league_slugs verilmezse tüm ligler tek indirme ile güncellenir
+    leagues = select_leagues(league_slugs)
     start_time = time.time()
-    df = collect_historical_data(start_week, end_week)
+    start_week = get_current_week()
+    if start_week is None:
+        print("Mevcut hafta alınamadı, işlem durduruldu!")
+        return None
+    cache = WeekCache(CACHE_DIR)
+
+    first_week = end_week
+    previous_blobs = None
+    incremental_first_week = None
+    if SCRAPE_MODE == 'incremental':
+        previous_blobs = load_published_blobs(leagues)
+        missing = [league['league_slug'] for league in leagues if league['league_slug'] not in previous_blobs]
+        if not previous_blobs:
+            print("Yayınlanmış CSV bulunamadı, tüm geçmiş yeniden toplanacak.")
+        else:
+            incremental_first_week = max(end_week, start_week - INCREMENTAL_WEEKS + 1)
+            print(f"Artımlı mod: {start_week}-{incremental_first_week} haftaları yeniden çekilecek.")
+            if missing:
+                print(f"Yayınlanmış CSV'si olmayan ligler tüm geçmişle toplanacak: {', '.join(missing)}")
+            else:
+                first_week = incremental_first_week
+
+    data = collect_historical_data(start_week, first_week, leagues, cache, previous_blobs=previous_blobs, incremental_first_week=incremental_first_week)
     end_time = time.time()
     execution_time = end_time - start_time
+    print_request_timings()
+    print_week_metrics()
     print(f"\nScript çalışma süresi: {execution_time:.2f} saniye")
+    return data
+
+if __name__ == "__main__":
+    run(sys.argv[1:])
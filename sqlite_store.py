@@ -0,0 +1,175 @@
+import sqlite3
+
+import pandas as pd
+
+from frame_schema import KICKOFF_COLUMN, MATCH_ID_COLUMN, MATCH_ID_VERSION, MATCH_KEY_COLUMNS, apply_frame_schema, match_ids
+
+class SqliteStore:
+    # Tüm liglerin maçları tek bir SQLite veritabanında, match_id anahtarlı `matches`
+    # tablosunda tutulur. Sütunlar DataFrame sütunlarıyla aynı adı taşır; yeni bir
+    # pazar sütunu geldiğinde tabloya eklenir. WAL modunda okuyucular yazıcıyı
+    # beklemez; yazmalar BEGIN IMMEDIATE ile kilidi baştan alır ve kilit doluysa
+    # busy_timeout kadar beklenir, böylece lig betikleri aynı dosyaya aynı anda yazabilir.
+    TABLE = 'matches'
+    INDEXES = {
+        'matches_league_kickoff': ('Lig', KICKOFF_COLUMN),
+        'matches_home': ('Ev Sahibi',),
+        'matches_away': ('Deplasman',),
+        'matches_week': ('Hafta',),
+    }
+    BATCH_SIZE = 5000
+    BUSY_TIMEOUT_MS = 60000
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=self.BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(f'PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}')
+        with self.transaction():
+            self.connection.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.TABLE} ('
+                f'{quote(MATCH_ID_COLUMN)} INTEGER PRIMARY KEY, "Lig" TEXT, "Hafta" INTEGER, '
+                f'{quote(KICKOFF_COLUMN)} TEXT, "Ev Sahibi" TEXT, "Deplasman" TEXT)'
+            )
+            for name, columns in self.INDEXES.items():
+                self.connection.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {self.TABLE} ({", ".join(map(quote, columns))})')
+            # user_version, satırların hangi kimlik biçimiyle yazıldığını tutar
+            if self.connection.execute('PRAGMA user_version').fetchone()[0] != MATCH_ID_VERSION:
+                self.migrate_match_ids()
+                self.connection.execute(f'PRAGMA user_version={MATCH_ID_VERSION}')
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def transaction(self):
+        return Transaction(self.connection)
+
+    def table_columns(self):
+        return [row[1] for row in self.connection.execute(f'PRAGMA table_info({self.TABLE})')]
+
+    def migrate_match_ids(self):
+        # Kimlik biçimi değiştiyse mevcut satırların match_id'leri yeniden hesaplanır;
+        # aynı maçın farklı biçimlerle yazılmış kopyaları tek satıra iner (OR REPLACE)
+        keys = pd.read_sql_query(f'SELECT {", ".join(map(quote, [MATCH_ID_COLUMN] + MATCH_KEY_COLUMNS))} FROM {self.TABLE}', self.connection)
+        if keys.empty:
+            return
+        keys[KICKOFF_COLUMN] = pd.to_datetime(keys[KICKOFF_COLUMN], format='%Y-%m-%d %H:%M:%S', errors='coerce')
+        old_ids = keys[MATCH_ID_COLUMN].to_numpy()
+        new_ids = match_ids(keys)
+        changed = old_ids != new_ids
+        self.connection.executemany(
+            f'UPDATE OR REPLACE {self.TABLE} SET {quote(MATCH_ID_COLUMN)} = ? WHERE {quote(MATCH_ID_COLUMN)} = ?',
+            zip(new_ids[changed].tolist(), old_ids[changed].tolist()),
+        )
+
+    def has_league(self, league_slug):
+        return self.connection.execute(f'SELECT 1 FROM {self.TABLE} WHERE "Lig" = ? LIMIT 1', (league_slug,)).fetchone() is not None
+
+    def ensure_columns(self, column_types):
+        # Yazma kilidi alınmışken çağrılır; başka bir betiğin eklediği sütunlar da görülür
+        existing = set(self.table_columns())
+        for column, column_type in column_types.items():
+            if column not in existing:
+                self.connection.execute(f'ALTER TABLE {self.TABLE} ADD COLUMN {quote(column)} {column_type}')
+
+    def upsert(self, df):
+        # Satırlar BATCH_SIZE'lık işlemlerle yazılır; aynı match_id varsa satır güncellenir
+        if df.empty:
+            return 0
+        column_types = {column: sql_type(df[column]) for column in df.columns}
+        df = to_sql_values(df)
+        columns = list(df.columns)
+        assignments = ', '.join(f'{quote(column)}=excluded.{quote(column)}' for column in columns if column != MATCH_ID_COLUMN)
+        statement = (
+            f'INSERT INTO {self.TABLE} ({", ".join(map(quote, columns))}) VALUES ({", ".join("?" * len(columns))}) '
+            f'ON CONFLICT({quote(MATCH_ID_COLUMN)}) DO UPDATE SET {assignments}'
+        )
+        rows = df.itertuples(index=False, name=None)
+        written = 0
+        while True:
+            batch = [row for _, row in zip(range(self.BATCH_SIZE), rows)]
+            if not batch:
+                break
+            with self.transaction():
+                if written == 0:
+                    self.ensure_columns(column_types)
+                self.connection.executemany(statement, batch)
+            written += len(batch)
+        return written
+
+    def write_weeks(self, league_slug, df):
+        # ColumnarStore ile aynı arayüz; lig satırlarda zaten bulunduğu için sadece upsert
+        return self.upsert(df)
+
+    def matches(self, league_slugs=None, team=None, first_week=None, since=None, columns=None):
+        # İndeksli sorgular: lig + başlama zamanı, ev sahibi/deplasman ve hafta
+        # Örn. store.matches(['AL1'], team='Bayern Münih', first_week=1820)
+        conditions = []
+        params = []
+        if league_slugs:
+            conditions.append(f'"Lig" IN ({", ".join("?" * len(league_slugs))})')
+            params.extend(league_slugs)
+        if since is not None:
+            conditions.append(f'{quote(KICKOFF_COLUMN)} >= ?')
+            params.append(pd.Timestamp(since).strftime('%Y-%m-%d %H:%M:%S'))
+        if team is not None:
+            conditions.append('("Ev Sahibi" = ? OR "Deplasman" = ?)')
+            params.extend([team, team])
+        if first_week is not None:
+            conditions.append('"Hafta" >= ?')
+            params.append(int(first_week))
+
+        selected = ', '.join(map(quote, columns)) if columns else '*'
+        query = f'SELECT {selected} FROM {self.TABLE}'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += f' ORDER BY {quote(KICKOFF_COLUMN)} DESC'
+        return from_sql_values(pd.read_sql_query(query, self.connection, params=params))
+
+class Transaction:
+    # BEGIN IMMEDIATE ... COMMIT; hata olursa ROLLBACK
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        self.connection.execute('BEGIN IMMEDIATE')
+        return self.connection
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.connection.execute('ROLLBACK' if exc_type else 'COMMIT')
+
+def quote(identifier):
+    return '"' + identifier.replace('"', '""') + '"'
+
+def sql_type(series):
+    if pd.api.types.is_integer_dtype(series):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(series):
+        return 'REAL'
+    return 'TEXT'
+
+def to_sql_values(df):
+    # Tarihler sıralanabilir metin olarak, eksik değerler NULL olarak yazılır
+    df = df.copy()
+    for column in df.columns:
+        if pd.api.types.is_datetime64_any_dtype(df[column]):
+            df[column] = df[column].dt.strftime('%Y-%m-%d %H:%M:%S' if column == KICKOFF_COLUMN else '%Y-%m-%d')
+        elif isinstance(df[column].dtype, pd.CategoricalDtype) or df[column].dtype == object:
+            df[column] = df[column].astype(str).where(df[column].notna(), None)
+    return df.astype(object).where(df.notna(), None)
+
+def from_sql_values(df):
+    if 'Tarih' in df.columns:
+        df['Tarih'] = pd.to_datetime(df['Tarih'], format='%Y-%m-%d', errors='coerce')
+    if 'Saat' in df.columns:
+        df['Saat'] = pd.to_datetime(df['Saat'], format='%H:%M:%S', errors='coerce').dt.time
+    if KICKOFF_COLUMN in df.columns:
+        df[KICKOFF_COLUMN] = pd.to_datetime(df[KICKOFF_COLUMN], format='%Y-%m-%d %H:%M:%S', errors='coerce')
+    return apply_frame_schema(df)
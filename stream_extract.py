@@ -0,0 +1,296 @@
+from datetime import datetime
+from html.parser import HTMLParser
+
+from markets import MARKETS_KEY, build_market_index, detail_data
+from row_schema import DEFAULT_SCHEMA, compile_column_schema, expand_header_labels, normalize_text
+
+# Kapanış etiketi olmayan HTML elemanları
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr'}
+
+def strip_join(texts):
+    # BeautifulSoup get_text(strip=True) ile aynı sonuç
+    return ''.join(text.strip() for text in texts if text.strip())
+
+def get_date_value(cell):
+    if cell['date']:
+        try:
+            return datetime.strptime(cell['date'], '%Y-%m-%d %H:%M:%S').strftime('%d.%m.%Y')
+        except ValueError:
+            pass
+    return normalize_text(cell['icon']) or ''
+
+def get_kickoff_value(cell):
+    return cell['date'] or None
+
+def get_time_value(cell):
+    return normalize_text(cell['first_span'])
+
+def get_text_value(cell):
+    return normalize_text(strip_join(cell['texts']))
+
+def get_team_name(cell):
+    if cell['desktop'] is not None:
+        return normalize_text(cell['desktop'])
+    if cell['mobile'] is not None:
+        return normalize_text(cell['mobile'])
+    return normalize_text(strip_join(cell['texts']))
+
+def get_cell_value(cell):
+    return normalize_text(cell['bet'] if cell['bet'] is not None else strip_join(cell['texts']))
+
+# row_schema okuma şekillerinin akış hücreleri için karşılıkları
+CELL_READERS = {
+    'date': get_date_value,
+    'time': get_time_value,
+    'kickoff': get_kickoff_value,
+    'text': get_text_value,
+    'team': get_team_name,
+    'bet': get_cell_value,
+}
+
+class StreamingRowExtractor(HTMLParser):
+    # Sayfanın tamamını DOM olarak kurmadan, baytlar geldikçe maç satırlarını çıkarır.
+    # Bellekte sadece açık olan satırın hücreleri tutulur; her maç satırı, ardından
+    # gelen detail satırı kapandığında (ya da başka bir satır başladığında) yayınlanır.
+
+    def __init__(self, leagues):
+        super().__init__(convert_charrefs=True)
+        self.leagues = leagues
+        self.league_rows = {}
+        self.active_slugs = set()
+        self.emitted = []
+        self.pending = None
+        self.row = None
+        self.stack = []
+        self.in_text = False
+        self.schema = None
+        self.columns = None
+        # İçinde bulunulan tablonun başlık (th) satırı; şema ilk izlenen lig bölümü
+        # başladığında bu satırdan derlenir, başka tabloların başlıkları kullanılmaz
+        self.table_header = None
+
+    def feed(self, data):
+        # Bu parçayla tamamlanan (lig kısaltması, satır) çiftlerini döndürür
+        super().feed(data)
+        return self.drain()
+
+    def close(self):
+        super().close()
+        self.finish_row()
+        self.flush_pending()
+        return self.drain()
+
+    def drain(self):
+        emitted, self.emitted = self.emitted, []
+        return emitted
+
+    def handle_starttag(self, tag, attrs):
+        self.in_text = False
+        attrs = dict(attrs)
+        if tag == 'tr':
+            self.finish_row()
+            classes = (attrs.get('class') or '').split()
+            self.row = {
+                'classes': classes,
+                'filtervalue': attrs.get('filtervalue') or '',
+                'cells': [],
+                'texts': [],
+                'events': [],
+            }
+            if not (classes and classes[0] == 'tablemainheader') and 'detail' not in classes:
+                self.flush_pending()
+            return
+        if self.row is None:
+            if tag == 'table':
+                self.table_header = None
+            return
+
+        if tag in ('td', 'th') and not any(entry['tag'] in ('td', 'th') for entry in self.stack):
+            cell = {'tag': tag, 'colspan': attrs.get('colspan'), 'texts': [], 'first_span': None, 'bet': None, 'desktop': None, 'mobile': None, 'date': None, 'icon': None}
+            self.row['cells'].append(cell)
+            self.stack.append(self.new_entry(tag, attrs, cell))
+            return
+
+        cell = self.current_cell()
+        if cell is not None:
+            classes = (attrs.get('class') or '').split()
+            if tag == 'span':
+                if cell['date'] is None and 'date' in attrs:
+                    cell['date'] = attrs.get('date') or ''
+            elif tag == 'i' and cell['icon'] is None and 'fa-angle-double-right' in classes:
+                cell['icon'] = attrs.get('title') or ''
+
+        event = None
+        if 'detail' in self.row['classes'] and tag in ('div', 'span', 'br'):
+            event = {'tag': tag, 'string': None, 'value': None}
+            self.row['events'].append(event)
+
+        if tag in VOID_TAGS:
+            if self.stack:
+                self.add_child(None)
+            if event is not None:
+                # <br>'den sonraki kardeş düğüm oranın değeridir
+                self.row['awaiting'] = (event, len(self.stack))
+            return
+
+        self.stack.append(self.new_entry(tag, attrs, None, event))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        self.in_text = False
+        if tag == 'tr':
+            self.finish_row()
+            return
+        if self.row is None or tag in VOID_TAGS:
+            return
+        if not any(entry['tag'] == tag for entry in self.stack):
+            return
+        while self.stack:
+            entry = self.stack.pop()
+            self.close_entry(entry)
+            if entry['tag'] == tag:
+                break
+
+    def handle_data(self, data):
+        if self.row is None:
+            return
+        awaiting = self.row.get('awaiting')
+        if awaiting and awaiting[1] == len(self.stack):
+            event = awaiting[0]
+            event['value'] = (event['value'] or '') + data if self.in_text else data
+        if self.in_text:
+            for entry in self.stack:
+                entry['texts'][-1] += data
+            self.row['texts'][-1] += data
+            if self.stack and self.stack[-1]['children'] == 1 and self.stack[-1]['single_is_text']:
+                self.stack[-1]['single'] += data
+        else:
+            for entry in self.stack:
+                entry['texts'].append(data)
+            self.row['texts'].append(data)
+            if self.stack:
+                self.add_child(data, is_text=True)
+        self.in_text = True
+
+    def new_entry(self, tag, attrs, cell=None, event=None):
+        return {
+            'tag': tag,
+            'classes': (attrs.get('class') or '').split(),
+            'cell': cell,
+            'event': event,
+            'texts': [],
+            'children': 0,
+            'single': None,
+            'single_is_text': False,
+        }
+
+    def add_child(self, string, is_text=False):
+        parent = self.stack[-1]
+        parent['children'] += 1
+        parent['single'] = string
+        parent['single_is_text'] = is_text
+
+    def current_cell(self):
+        for entry in reversed(self.stack):
+            if entry['cell'] is not None:
+                return entry['cell']
+        return None
+
+    def close_entry(self, entry):
+        string = entry['single'] if entry['children'] == 1 else None
+        if entry['event'] is not None:
+            entry['event']['string'] = string
+
+        awaiting = self.row.get('awaiting')
+        if awaiting and awaiting[1] == len(self.stack):
+            # <br>'den sonraki kardeş bir eleman ise değeri onun metnidir
+            if awaiting[0]['value'] is None:
+                awaiting[0]['value'] = strip_join(entry['texts'])
+            self.row['awaiting'] = None
+        elif awaiting and awaiting[1] > len(self.stack):
+            self.row['awaiting'] = None
+
+        if entry['cell'] is not None:
+            entry['cell']['texts'] = entry['texts']
+        else:
+            cell = self.current_cell()
+            if cell is not None and entry['tag'] == 'span':
+                text = strip_join(entry['texts'])
+                if cell['first_span'] is None:
+                    cell['first_span'] = text
+                if cell['bet'] is None and ('betwhite' in entry['classes'] or 'betred' in entry['classes']):
+                    cell['bet'] = text
+                if cell['desktop'] is None and 'hide-on-mobile' in entry['classes']:
+                    cell['desktop'] = text
+                if cell['mobile'] is None and 'hide-on-desktop' in entry['classes']:
+                    cell['mobile'] = text
+
+        if self.stack:
+            self.add_child(string)
+
+    def finish_row(self):
+        row = self.row
+        if row is None:
+            return
+        while self.stack:
+            self.close_entry(self.stack.pop())
+        self.row = None
+
+        if row['classes'] and row['classes'][0] == 'tablemainheader':
+            self.flush_pending()
+            header_text = ''.join(row['texts'])
+            self.active_slugs = set()
+            for league in self.leagues:
+                league_slug = league['league_slug']
+                if league_slug not in self.league_rows and league['league_string'] in header_text:
+                    self.league_rows[league_slug] = []
+                    self.active_slugs.add(league_slug)
+            if self.active_slugs and self.schema is None:
+                self.set_schema(compile_column_schema(self.table_header) if self.table_header else DEFAULT_SCHEMA)
+        elif 'detail' in row['classes']:
+            if self.pending is not None:
+                league_slug, row_data = self.pending
+                events = ((event['tag'], event['string'], event['value']) for event in row['events'])
+                market_index = build_market_index(events)
+                row_data.update(detail_data(market_index))
+                row_data[MARKETS_KEY] = market_index
+                self.flush_pending()
+        elif 'futbol' in row['filtervalue']:
+            self.match_row([cell for cell in row['cells'] if cell['tag'] == 'td'])
+        elif self.table_header is None and any(cell['tag'] == 'th' for cell in row['cells']):
+            header_cells = [(strip_join(cell['texts']), cell['colspan']) for cell in row['cells'] if cell['tag'] == 'th']
+            self.table_header = expand_header_labels(header_cells)
+
+    def set_schema(self, schema):
+        self.schema = schema
+        self.columns = schema.bind(CELL_READERS)
+
+    def match_row(self, cells):
+        if not self.active_slugs:
+            return
+        lig_index = self.schema.indices['Lig']
+        mbs_index = self.schema.indices['MBS']
+        if len(cells) <= max(lig_index, mbs_index):
+            return
+        lig_cell = strip_join(cells[lig_index]['texts'])
+        for league_slug in list(self.active_slugs):
+            if lig_cell != league_slug:
+                # Bölüm içinde başka lige geçildiyse bu lig için okuma biter
+                self.active_slugs.discard(league_slug)
+                continue
+            if strip_join(cells[mbs_index]['texts']) == '1':
+                self.pending = (league_slug, self.row_data(cells))
+
+    def row_data(self, cells):
+        return self.schema.read_row(cells, self.columns)
+
+    def flush_pending(self):
+        if self.pending is not None:
+            league_slug, row_data = self.pending
+            self.league_rows[league_slug].append(row_data)
+            self.emitted.append(self.pending)
+            self.pending = None
@@ -0,0 +1,27 @@
+import glob
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Hafta sayfası fixture'ları. synthetic_week_*.html benchmarks/synthetic_page.py ile
+# üretilmiştir ve başlık satırı row_schema.DEFAULT_HEADER_LABELS'in aynısıdır; yani
+# ayrıştırıcıların ve çıkarıcıların birbiriyle tutarlılığını sınar, gerçek spordb
+# işaretlemesini değil. Gerçek bir sayfa (WeekCache blob'u, ham HTML) week_<hafta>.html
+# adıyla buraya kopyalandığında week_page kullanan tüm testlere kendiliğinden katılır.
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+SYNTHETIC_PAGES = sorted(glob.glob(os.path.join(FIXTURE_DIR, 'synthetic_week_*.html')))
+WEEK_PAGES = SYNTHETIC_PAGES + sorted(glob.glob(os.path.join(FIXTURE_DIR, 'week_*.html')))
+
+def synthetic_page(name):
+    return read_fixture(os.path.join(FIXTURE_DIR, f'synthetic_{name}'))
+
+def read_fixture(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+@pytest.fixture(params=WEEK_PAGES, ids=os.path.basename)
+def week_page(request):
+    return read_fixture(request.param)
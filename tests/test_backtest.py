@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import SELECTIONS, favourite_picks, odds_between, settle_markets, strategy_roi
+
+# Seçeneklerin elle belirlenmiş skorlarda sonuçlanması ve stratejilerin getirisi.
+# Skoru olmayan ya da okunamayan maçlar sonuçlanmaz (bahis iade), oranı eksik
+# seçeneklere bahis yapılmaz.
+
+MS = ['MS1', 'MS0', 'MS2']
+
+def matches():
+    return pd.DataFrame({
+        'Lig': ['A', 'A', 'B', 'B', 'B', 'B'],
+        'Skor': ['2-1', '0-0', '1-3', '', '2-0', 'ERT'],
+        'İY': ['1-1', '0-0', '1-0', '', 'abc', ' 0 - 0 '],
+        'MS1': np.array([1.50, 2.00, 3.00, 1.80, 1.30, 2.50], dtype='float32'),
+        'MS0': np.array([4.00, 3.00, 3.20, 3.50, np.nan, 3.00], dtype='float32'),
+        'MS2': np.array([6.00, 3.50, 2.20, 4.00, 8.00, 2.80], dtype='float32'),
+    })
+
+# (seçenek, her satır için kazandı, her satır için sonuçlandı)
+FULL_TIME = [True, True, True, False, True, False]
+HALF_TIME = [True, True, True, False, False, True]
+BOTH_HALVES = [True, True, True, False, False, False]
+EXPECTED = [
+    # MS
+    ('MS1', [True, False, False, False, True, False], FULL_TIME),
+    ('MS0', [False, True, False, False, False, False], FULL_TIME),
+    ('MS2', [False, False, True, False, False, False], FULL_TIME),
+    # İY ve ikinci yarı (2-1 / 1-1: ikinci yarı 1-0, 1-3 / 1-0: ikinci yarı 0-3)
+    ('IY1', [False, False, True, False, False, False], HALF_TIME),
+    ('IY0', [True, True, False, False, False, True], HALF_TIME),
+    ('IY2', [False, False, False, False, False, False], HALF_TIME),
+    ('2Y1', [True, False, False, False, False, False], BOTH_HALVES),
+    ('2Y0', [False, True, False, False, False, False], BOTH_HALVES),
+    ('2Y2', [False, False, True, False, False, False], BOTH_HALVES),
+    ('IY/MS 0/1', [True, False, False, False, False, False], BOTH_HALVES),
+    ('IY/MS 1/2', [False, False, True, False, False, False], BOTH_HALVES),
+    # Alt/Üst
+    ('AU2.5 Alt', [False, True, False, False, True, False], FULL_TIME),
+    ('AU2.5 Üst', [True, False, True, False, False, False], FULL_TIME),
+    ('AU1.5 Alt', [False, True, False, False, False, False], FULL_TIME),
+    ('AU1.5 Üst', [True, False, True, False, True, False], FULL_TIME),
+    ('IY0.5 Alt', [False, True, False, False, False, True], HALF_TIME),
+    ('IY0.5 Üst', [True, False, True, False, False, False], HALF_TIME),
+    # KG ve Tek/Çift
+    ('KG Var', [True, False, True, False, False, False], FULL_TIME),
+    ('KG Yok', [False, True, False, False, True, False], FULL_TIME),
+    ('Tek', [True, False, False, False, False, False], FULL_TIME),
+    ('Çift', [False, True, True, False, True, False], FULL_TIME),
+    # Çifte Şans
+    ('Çifte Şans 1-X', [True, True, False, False, True, False], FULL_TIME),
+    ('Çifte Şans 1-2', [True, False, True, False, True, False], FULL_TIME),
+    ('Çifte Şans X-2', [False, True, True, False, False, False], FULL_TIME),
+    ('IY Çifte Şans 1-X', [True, True, True, False, False, True], HALF_TIME),
+    ('IY Çifte Şans 1-2', [False, False, True, False, False, False], HALF_TIME),
+    ('IY Çifte Şans X-2', [True, True, False, False, False, True], HALF_TIME),
+]
+
+@pytest.mark.parametrize('selection, won, settled', EXPECTED, ids=[selection for selection, won, settled in EXPECTED])
+def test_settle_markets(selection, won, settled):
+    won_df, settled_df = settle_markets(matches(), [selection])
+    assert won_df[selection].tolist() == won
+    assert settled_df[selection].tolist() == settled
+
+def test_every_selection_settles():
+    won, settled = settle_markets(matches())
+    assert list(won.columns) == SELECTIONS
+    # Sonuçlanmayan satırda hiçbir seçenek kazanmış sayılmaz
+    assert not (won & ~settled).to_numpy().any()
+    # Sonuçlanan her satırda MS seçeneklerinden tam biri kazanır
+    assert (won.loc[settled['MS1'], MS].sum(axis=1) == 1).all()
+
+def test_odds_between_skips_missing_odds():
+    picks = odds_between(matches(), MS, low=2.0, high=3.0)
+    assert picks['MS0'].tolist() == [False, True, False, False, False, True]
+    assert picks['MS1'].tolist() == [False, True, True, False, False, True]
+
+def test_favourite_picks_skip_rows_with_missing_odds():
+    picks = favourite_picks(matches(), MS)
+    assert picks.idxmax(axis=1)[picks.any(axis=1)].tolist() == ['MS1', 'MS1', 'MS2', 'MS1', 'MS1']
+    assert not picks.loc[4].any()
+
+def test_strategy_roi_by_hand():
+    df = matches()
+    # Favori: 0 MS1 1.50 kazandı, 1 MS1 2.00 kaybetti, 2 MS2 2.20 kazandı; 3 ve 5 skorsuz
+    # (iade), 4'te MS0 oranı eksik olduğu için favori seçilmez.
+    # Bahis 3, getiri 1.50 + 2.20 = 3.70, kâr 0.70, ROI 0.70 / 3
+    summary = strategy_roi(df, favourite_picks(df, MS))
+    assert summary['Bahis'].item() == 3
+    assert summary['Kazanan'].item() == 2
+    assert summary['Getiri'].item() == pytest.approx(3.7, rel=1e-6)
+    assert summary['ROI'].item() == pytest.approx(0.7 / 3, rel=1e-5)
+
+    by_league = strategy_roi(df, favourite_picks(df, MS), by=['Lig'], stake=2.0)
+    # A: 2 bahis (4 birim), getiri 1.50 * 2 = 3.0, ROI -0.25; B: 1 bahis (2 birim), getiri 4.40, ROI 1.2
+    assert by_league['Bahis'].tolist() == [4.0, 2.0]
+    assert by_league['Getiri'].tolist() == pytest.approx([3.0, 4.4], rel=1e-6)
+    assert by_league['ROI'].tolist() == pytest.approx([-0.25, 1.2], rel=1e-5)
+
+def test_strategy_roi_ignores_picks_without_odds():
+    df = matches()
+    df.loc[1, 'MS0'] = np.nan
+    # 0-0 biten maçta beraberliğe oynanmış ama oran yok: bahis sayılmaz
+    picks = pd.DataFrame(False, index=df.index, columns=MS)
+    picks.loc[[0, 1], 'MS0'] = True
+    summary = strategy_roi(df, picks)
+    assert summary['Bahis'].item() == 1
+    assert summary['Getiri'].item() == 0
+    assert summary['ROI'].item() == -1
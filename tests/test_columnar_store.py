@@ -0,0 +1,108 @@
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from columnar_store import ColumnarStore
+from frame_schema import KICKOFF_COLUMN, MATCH_ID_COLUMN, apply_frame_schema
+from iddaa import LEAGUES, build_dataframe, parse_week_page
+
+# Lig başına tek Parquet dosyası: artımlı çalıştırmada yeniden çekilmeyen haftalar
+# korunur, okuma manifest'e göre budanır ve filtreler CSV'den okunanla aynı satırları verir.
+
+def league_weeks(week_page, weeks):
+    # Aynı sayfanın satırları farklı haftalar olarak kullanılır
+    frames = {}
+    league_rows = parse_week_page(week_page, LEAGUES)
+    for hafta in weeks:
+        for league_slug, rows in league_rows.items():
+            if rows:
+                df = build_dataframe(rows)
+                df['Hafta'] = hafta
+                df[KICKOFF_COLUMN] = df[KICKOFF_COLUMN] + pd.Timedelta(weeks=hafta - weeks[-1])
+                frames.setdefault(league_slug, []).append(apply_frame_schema(df))
+    return frames
+
+def write_run(root, frames, pruned=()):
+    store = ColumnarStore(root)
+    for league_slug, dfs in frames.items():
+        for df in dfs:
+            store.write_weeks(league_slug, df)
+        if league_slug in pruned:
+            store.prune(league_slug)
+    store.save_manifest()
+
+def sorted_frame(df):
+    return df.sort_values(MATCH_ID_COLUMN, ignore_index=True)
+
+@pytest.fixture
+def history(week_page):
+    return league_weeks(week_page, [1852, 1851, 1850])
+
+def test_round_trip(tmp_path, history):
+    write_run(str(tmp_path), history)
+    expected = apply_frame_schema(pd.concat([df for dfs in history.values() for df in dfs], ignore_index=True))
+    actual = ColumnarStore(str(tmp_path)).read()
+    pd.testing.assert_frame_equal(sorted_frame(actual), sorted_frame(expected[actual.columns]), check_categorical=False)
+
+def test_one_file_per_league(tmp_path, history):
+    write_run(str(tmp_path), history)
+    store = ColumnarStore(str(tmp_path))
+    assert set(store.leagues) == set(history)
+    for league_slug, entry in store.leagues.items():
+        assert os.path.isfile(os.path.join(str(tmp_path), entry['path']))
+        assert entry['weeks'] == [1852, 1851, 1850]
+        assert entry['rows'] == sum(len(df) for df in history[league_slug])
+
+def test_incremental_run_keeps_older_weeks(tmp_path, history):
+    write_run(str(tmp_path), history)
+    # Sadece son hafta yeniden çekilir; 1851 ve 1850 önceki dosyadan taşınır
+    write_run(str(tmp_path), {league_slug: dfs[:1] for league_slug, dfs in history.items()})
+    store = ColumnarStore(str(tmp_path))
+    for league_slug, dfs in history.items():
+        assert store.leagues[league_slug]['weeks'] == [1852, 1851, 1850]
+        assert len(store.read([league_slug])) == sum(len(df) for df in dfs)
+
+def test_pruned_league_drops_weeks_not_written(tmp_path, history):
+    write_run(str(tmp_path), history)
+    league_slug = next(iter(history))
+    write_run(str(tmp_path), {league_slug: history[league_slug][:1]}, pruned=[league_slug])
+    store = ColumnarStore(str(tmp_path))
+    assert store.leagues[league_slug]['weeks'] == [1852]
+    assert set(store.read([league_slug])['Hafta']) == {1852}
+
+def test_read_filters(tmp_path, history):
+    write_run(str(tmp_path), history)
+    store = ColumnarStore(str(tmp_path))
+    league_slug = next(iter(history))
+    assert set(store.read([league_slug], first_week=1851)['Hafta']) == {1852, 1851}
+    assert set(store.read(last_week=1850)['Hafta']) == {1850}
+    # Hafta aralığının dışında kalan ligler hiç açılmaz
+    assert store.read(first_week=1853).empty
+
+    since = history[league_slug][0][KICKOFF_COLUMN].min()
+    recent = store.read([league_slug], since=since)
+    assert (recent[KICKOFF_COLUMN] >= since).all()
+    assert len(recent) == (pd.concat(history[league_slug])[KICKOFF_COLUMN] >= since).sum()
+
+def test_old_week_partitions_are_removed(tmp_path, history):
+    league_slug = next(iter(history))
+    old_partition = tmp_path / f'lig={league_slug}' / 'hafta=1850'
+    old_partition.mkdir(parents=True)
+    (old_partition / 'part-0.parquet').write_bytes(b'')
+    write_run(str(tmp_path), history)
+    assert not old_partition.exists()
+    assert len(ColumnarStore(str(tmp_path)).read([league_slug])) == sum(len(df) for df in history[league_slug])
+
+def test_carried_over_weeks_follow_new_columns(tmp_path, history):
+    # Önceki dosya bir oran sütunu eksik yazılmış; yeni çalıştırmanın şemasına getirilir
+    league_slug = next(iter(history))
+    dropped = 'Çifte Şans 1-X'
+    write_run(str(tmp_path), {league_slug: [df.drop(columns=dropped) for df in history[league_slug]]})
+    write_run(str(tmp_path), {league_slug: history[league_slug][:1]})
+    df = ColumnarStore(str(tmp_path)).read([league_slug])
+    assert set(df['Hafta']) == {1852, 1851, 1850}
+    assert df.loc[df['Hafta'] < 1852, dropped].isna().all()
+    assert df.loc[df['Hafta'] == 1852, dropped].notna().any()
@@ -0,0 +1,120 @@
+import io
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('github')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import scraping
+from conftest import synthetic_page
+from fake_github import FakeRepo
+from frame_schema import FRAME_COLUMNS, apply_frame_schema
+from iddaa import LEAGUES, build_dataframe, parse_week_page
+
+# Artımlı modda yayınlanmış CSV'si olmayan lig tüm geçmişiyle toplanır; CSV'si olan
+# ligler sadece son haftaları yeniden çeker, eski haftalarını korur ve yayınlanmış
+# CSV'yi ancak lig kapanırken parça parça okur.
+
+WEEKS = [1852, 1851, 1850, 1849]
+INCREMENTAL_FIRST_WEEK = 1851
+OLD_WEEKS = [1850, 1849, 1848]
+
+def week_frames(hafta):
+    # Aynı sayfa her hafta farklı maçlar olarak kullanılır
+    frames = {}
+    for league_slug, rows in parse_week_page(synthetic_page('week_1850_header.html'), LEAGUES).items():
+        if rows:
+            frames[league_slug] = build_dataframe([dict(row, **{'Ev Sahibi': f"{row['Ev Sahibi']} {hafta}"}) for row in rows])
+    return frames
+
+class StubPipeline:
+    def __init__(self, leagues, *args):
+        self.leagues = leagues
+        self.layout_errors = []
+
+    def run(self, weeks):
+        for hafta in weeks:
+            yield hafta, week_frames(hafta), None
+
+@pytest.fixture
+def leagues():
+    slugs = list(week_frames(WEEKS[0]))[:2]
+    return [league for league in LEAGUES if league['league_slug'] in slugs]
+
+@pytest.fixture
+def previous_df(leagues):
+    # Önceki CSV'deki maçlar yeniden çekilecek olanlardan ayırt edilebilsin diye farklı adlarla
+    league_slug = leagues[0]['league_slug']
+    df = pd.concat([week_frames(hafta - 100)[league_slug].assign(Hafta=hafta) for hafta in OLD_WEEKS], ignore_index=True)
+    return apply_frame_schema(df)
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch, leagues, previous_df):
+    repo = FakeRepo({leagues[0]['file_path']: previous_df.reindex(columns=FRAME_COLUMNS).to_csv(index=False).encode('utf-8')})
+    monkeypatch.setattr(scraping, 'WeekPipeline', StubPipeline)
+    monkeypatch.setattr(scraping, 'get_target_repo', lambda: repo)
+    monkeypatch.setattr(scraping, 'OUTPUT_DIR', str(tmp_path))
+    monkeypatch.setattr(scraping, 'COLUMNAR_DIR', None)
+    monkeypatch.setattr(scraping, 'SQLITE_PATH', None)
+    monkeypatch.setattr(scraping, 'PREVIOUS_CHUNK_ROWS', 3)
+    return repo
+
+def published(repo, league):
+    return pd.concat(scraping.read_published_csv(io.BytesIO(repo.read(league['file_path'])), 1000), ignore_index=True)
+
+def test_load_published_blobs_skips_missing_leagues(repo, leagues):
+    previous_blobs = scraping.load_published_blobs(leagues)
+    assert list(previous_blobs) == [leagues[0]['league_slug']]
+    # İçerikler burada indirilmez
+    assert 'GET blob' not in repo.requests and 'GET contents' not in repo.requests
+
+def test_missing_league_is_collected_in_full(repo, leagues, previous_df, tmp_path):
+    published_league, missing_league = leagues
+    previous_blobs = scraping.load_published_blobs(leagues)
+
+    scraping.collect_historical_data(WEEKS[0], WEEKS[-1], leagues, previous_blobs=previous_blobs, parse_workers=1, incremental_first_week=INCREMENTAL_FIRST_WEEK)
+
+    # Yayınlanmış lig: son iki hafta yeniden çekildi, 1850 ve öncesi önceki CSV'den
+    incremental = published(repo, published_league)
+    assert sorted(incremental['Hafta'].unique(), reverse=True) == [1852, 1851, 1850, 1849, 1848]
+    for hafta in OLD_WEEKS:
+        expected = previous_df.loc[previous_df['Hafta'] == hafta, 'Ev Sahibi']
+        assert sorted(incremental.loc[incremental['Hafta'] == hafta, 'Ev Sahibi']) == sorted(expected)
+    assert repo.requests['GET blob'] == 1
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.previous')]
+
+    # CSV'si olmayan lig: tüm aralık toplandı
+    full = published(repo, missing_league)
+    assert sorted(full['Hafta'].unique(), reverse=True) == WEEKS
+    assert len(full) == sum(len(week_frames(hafta)[missing_league['league_slug']]) for hafta in WEEKS)
+
+def test_previous_csv_is_read_in_chunks(repo, leagues, previous_df, tmp_path):
+    sha = scraping.load_published_blobs(leagues)[leagues[0]['league_slug']]
+    publisher = scraping.RepoPublisher(repo)
+    chunks = list(scraping.read_previous_csv(publisher, sha, str(tmp_path / 'previous.csv')))
+    assert len(chunks) == -(-len(previous_df) // 3)
+    assert sum(len(chunk) for chunk in chunks) == len(previous_df)
+    assert not (tmp_path / 'previous.csv').exists()
+
+def test_short_run_does_not_start_parse_pool(repo, leagues, monkeypatch):
+    # Birkaç haftalık artımlı çalıştırma için süreç havuzu açılmaz
+    def no_pool(workers):
+        raise AssertionError('ParsePool başlatılmamalı')
+    monkeypatch.setattr(scraping, 'ParsePool', no_pool)
+    outputs = scraping.collect_historical_data(WEEKS[0], WEEKS[-1], leagues, parse_workers=4)
+    assert all(outputs.values())
+
+def test_margins_are_added_only_when_enabled(repo, leagues, monkeypatch):
+    previous_blobs = scraping.load_published_blobs(leagues)
+    monkeypatch.setattr(scraping, 'MARKET_MARGINS', True)
+    scraping.collect_historical_data(WEEKS[0], WEEKS[-1], leagues, previous_blobs=previous_blobs, parse_workers=1, incremental_first_week=INCREMENTAL_FIRST_WEEK)
+    for league in leagues:
+        df = published(repo, league)
+        # Önceki CSV'den gelen haftalar için de hesaplanır; MS oranı eksik satırlarda boş
+        complete = df[['MS1', 'MS0', 'MS2']].notna().all(axis=1)
+        assert set(df.loc[complete, 'Hafta']) == set(df['Hafta'])
+        assert pd.to_numeric(df['MS Marj'], errors='coerce').notna().tolist() == complete.tolist()
@@ -0,0 +1,48 @@
+import pytest
+
+from iddaa import LEAGUES, LeagueBoundaryScanner, find_header_row, find_league_sections, parse_week_page, slice_league_sections
+from stream_extract import StreamingRowExtractor
+
+# Lig bölümleri ve sütun şeması: hem akış tarayıcısı hem de tam sayfa araması aynı
+# başlık satırlarını bulmalı; program tablosundan önce gelen başka bir tablonun
+# th satırı şemayı etkilememeli.
+
+UNRELATED_TABLE = '<table class="standings"><tr><th>Sıra</th><th>Takım</th><th>Puan</th></tr><tr><td>1</td><td>X</td><td>3</td></tr></table>\n'
+
+def header_texts(content):
+    headers = []
+    position = 0
+    while True:
+        found = find_header_row(content, position)
+        if found is None or found[1] is None:
+            return headers
+        row_start, position, header_text = found
+        headers.append(header_text)
+
+def dom_rows(page):
+    return parse_week_page(page, LEAGUES)
+
+def sliced_rows(page):
+    return parse_week_page(slice_league_sections(page, LEAGUES), LEAGUES)
+
+def stream_rows(page):
+    extractor = StreamingRowExtractor(LEAGUES)
+    extractor.feed(page)
+    extractor.close()
+    return extractor.league_rows
+
+@pytest.mark.parametrize('chunk_size', [1, 97, 4096])
+def test_scanner_sees_same_headers_as_page_search(week_page, chunk_size):
+    scanner = LeagueBoundaryScanner(LEAGUES)
+    for start in range(0, len(week_page), chunk_size):
+        scanner.feed(week_page[start:start + chunk_size])
+    assert scanner.headers == header_texts(week_page)
+    assert set(find_league_sections(week_page, LEAGUES)) == {
+        league['league_slug'] for league in LEAGUES if league['league_string'] in scanner.first_index
+    }
+
+@pytest.mark.parametrize('extract', [dom_rows, sliced_rows, stream_rows])
+def test_header_of_unrelated_table_is_ignored(week_page, extract):
+    page = week_page.replace('<table class="program">', UNRELATED_TABLE + '<table class="program">', 1)
+    assert page != week_page
+    assert extract(page) == extract(week_page)
@@ -0,0 +1,59 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from frame_schema import apply_frame_schema
+from market_margins import MARGIN_COLUMNS, MARKET_GROUPS, add_market_margins
+
+# reduceat ile tek geçişte hesaplanan marjlar satır satır doğrudan hesapla aynı olmalı;
+# grubun bir oranı eksikse grubun türetilmiş değerleri NaN kalır.
+
+def small_frame():
+    rng = np.random.default_rng(7)
+    data = {}
+    for group, columns, coverage in MARKET_GROUPS:
+        for column in columns:
+            data[column] = np.round(rng.uniform(1.1, 8.0, size=4), 2).astype('float32')
+    df = pd.DataFrame(data)
+    df.loc[1, 'MS0'] = np.nan
+    df.loc[2, 'KG Var'] = np.nan
+    df.loc[3, 'Çifte Şans 1-2'] = np.nan
+    return df
+
+def direct_margin(odds, coverage):
+    if any(math.isnan(value) for value in odds):
+        return math.nan
+    return sum(1 / value for value in odds) / coverage - 1
+
+def test_margins_match_direct_sum():
+    df = small_frame()
+    enriched = add_market_margins(df)
+    for row in range(len(df)):
+        for group, columns, coverage in MARKET_GROUPS:
+            odds = [float(df.loc[row, column]) for column in columns]
+            expected = direct_margin(odds, coverage)
+            actual = float(enriched.loc[row, f"{group} Marj"])
+            if math.isnan(expected):
+                assert math.isnan(actual), (row, group)
+                assert enriched.loc[row, [f"{column} Adil" for column in columns]].isna().all()
+            else:
+                assert actual == pytest.approx(expected, rel=1e-5, abs=1e-6), (row, group)
+                # Olasılıklar kapsama toplamına normalize, adil oran olasılığın tersi
+                probabilities = enriched.loc[row, [f"{column} Olasılık" for column in columns]].astype(float)
+                assert probabilities.sum() == pytest.approx(coverage, rel=1e-5)
+                for column in columns:
+                    assert float(enriched.loc[row, f"{column} Adil"]) == pytest.approx(1 / float(enriched.loc[row, f"{column} Olasılık"]), rel=1e-5)
+
+def test_missing_group_columns_are_skipped():
+    df = small_frame()[['MS1', 'MS0', 'MS2', 'KG Var']]
+    enriched = add_market_margins(df)
+    assert 'MS Marj' in enriched.columns
+    assert 'KG Marj' not in enriched.columns
+
+def test_schema_does_not_add_margins(monkeypatch):
+    # Marjlar şemanın parçası değil; ortam değişkeni apply_frame_schema'yı etkilemez
+    monkeypatch.setenv('IDDAA_MARKET_MARGINS', '1')
+    df = apply_frame_schema(small_frame())
+    assert not set(MARGIN_COLUMNS) & set(df.columns)
@@ -0,0 +1,59 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from frame_schema import KICKOFF_COLUMN, MATCH_ID_COLUMN, MATCH_ID_VERSION, MatchIndex, apply_frame_schema, match_ids
+from iddaa import LEAGUES, build_dataframe, parse_week_page
+from sqlite_store import SqliteStore
+
+# match_id yayınlanmış CSV'lerde ve SQLite birincil anahtarında saklanır; aynı maç
+# pandas sürümünden ve sütun tiplerinden bağımsız olarak hep aynı kimliği almalı.
+
+# pandas 2.3 (datetime64[ns], object) ve pandas 3.0 (datetime64[us], str) ile hesaplandı
+KNOWN_MATCH = {KICKOFF_COLUMN: '2024-10-07 20:30:00', 'Lig': 'AL1', 'Ev Sahibi': 'Bayern Münih', 'Deplasman': 'Köln'}
+KNOWN_MATCH_ID = -4932050266164699012
+
+def known_match(unit='ns', text_dtype=object):
+    df = pd.DataFrame([dict(KNOWN_MATCH, Hafta=1850)])
+    df[KICKOFF_COLUMN] = pd.to_datetime(df[KICKOFF_COLUMN]).astype(f'datetime64[{unit}]')
+    for column in ['Lig', 'Ev Sahibi', 'Deplasman']:
+        df[column] = df[column].astype(text_dtype)
+    return df
+
+@pytest.mark.parametrize('unit', ['s', 'ms', 'us', 'ns'])
+@pytest.mark.parametrize('text_dtype', [object, 'category', 'string'])
+def test_match_id_is_independent_of_dtypes(unit, text_dtype):
+    assert match_ids(known_match(unit, text_dtype)).tolist() == [KNOWN_MATCH_ID]
+
+def test_week_frames_have_unique_stable_ids(week_page):
+    frames = [build_dataframe(rows) for rows in parse_week_page(week_page, LEAGUES).values() if rows]
+    for df in frames:
+        assert df[MATCH_ID_COLUMN].is_unique
+        # Odds ya da tip dönüşümleri kimliği değiştirmez
+        assert (apply_frame_schema(df.copy())[MATCH_ID_COLUMN] == df[MATCH_ID_COLUMN]).all()
+
+def test_match_index_drops_seen_ids():
+    df = apply_frame_schema(known_match())
+    index = MatchIndex()
+    assert len(index.drop_seen(df)) == 1
+    assert index.drop_seen(df).empty
+
+def test_sqlite_store_migrates_old_ids(tmp_path):
+    path = str(tmp_path / 'odds.sqlite')
+    with SqliteStore(path) as store:
+        store.upsert(apply_frame_schema(known_match()))
+
+    # Eski biçimle yazılmış kopya: farklı kimlik, eski user_version
+    connection = sqlite3.connect(path)
+    connection.execute(
+        f'INSERT INTO matches ({MATCH_ID_COLUMN}, {KICKOFF_COLUMN}, "Lig", "Hafta", "Ev Sahibi", "Deplasman") VALUES (?, ?, ?, ?, ?, ?)',
+        (12345, KNOWN_MATCH[KICKOFF_COLUMN], 'AL1', 1850, 'Bayern Münih', 'Köln'),
+    )
+    connection.execute('PRAGMA user_version=1')
+    connection.commit()
+    connection.close()
+
+    with SqliteStore(path) as store:
+        assert store.connection.execute('PRAGMA user_version').fetchone()[0] == MATCH_ID_VERSION
+        assert store.matches()[MATCH_ID_COLUMN].tolist() == [KNOWN_MATCH_ID]
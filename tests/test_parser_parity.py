@@ -0,0 +1,74 @@
+import pandas as pd
+import pytest
+
+from html_backend import available_parsers
+from iddaa import LEAGUES, ParsePool, build_dataframe, build_market_catalog, extract_league_rows, parse_week_page, pool_context, slice_league_sections
+from markets import market_catalog
+from stream_extract import StreamingRowExtractor
+
+# Aynı hafta sayfasından, hangi HTML ayrıştırıcısı ve hangi satır çıkarıcısı
+# kullanılırsa kullanılsın aynı DataFrame'ler çıkmalı.
+
+def build_frames(league_rows):
+    return {league_slug: build_dataframe(rows) for league_slug, rows in league_rows.items() if rows}
+
+def assert_same_frames(actual, expected):
+    assert actual.keys() == expected.keys()
+    for league_slug in expected:
+        pd.testing.assert_frame_equal(actual[league_slug], expected[league_slug], obj=league_slug)
+
+def stream_rows(content, chunk_size=None):
+    extractor = StreamingRowExtractor(LEAGUES)
+    chunk_size = chunk_size or len(content)
+    for start in range(0, len(content), chunk_size):
+        extractor.feed(content[start:start + chunk_size])
+    extractor.close()
+    return extractor.league_rows
+
+def test_fixture_pages_have_matches(week_page):
+    league_rows = parse_week_page(week_page, LEAGUES)
+    assert sum(len(rows) for rows in league_rows.values()) > 0
+
+@pytest.mark.parametrize('parser', [parser for parser in available_parsers() if parser != 'html.parser'])
+def test_parsers_produce_identical_frames(week_page, parser):
+    expected = build_frames(parse_week_page(week_page, LEAGUES, parser='html.parser'))
+    assert_same_frames(build_frames(parse_week_page(week_page, LEAGUES, parser=parser)), expected)
+
+def test_stream_extractor_matches_dom(week_page):
+    expected = build_frames(parse_week_page(week_page, LEAGUES))
+    assert_same_frames(build_frames(stream_rows(week_page)), expected)
+
+@pytest.mark.parametrize('chunk_size', [1, 97, 4096])
+def test_stream_extractor_is_chunking_independent(week_page, chunk_size):
+    expected = build_frames(stream_rows(week_page))
+    assert_same_frames(build_frames(stream_rows(week_page, chunk_size)), expected)
+
+def test_market_catalogs_match(week_page):
+    dom_rows = parse_week_page(week_page, LEAGUES)
+    streamed_rows = stream_rows(week_page)
+    for league_slug, rows in dom_rows.items():
+        pd.testing.assert_frame_equal(market_catalog(streamed_rows[league_slug]), market_catalog(rows), obj=league_slug)
+
+def test_sliced_page_matches_full_page(week_page):
+    expected = build_frames(parse_week_page(week_page, LEAGUES))
+    assert_same_frames(build_frames(parse_week_page(slice_league_sections(week_page, LEAGUES), LEAGUES)), expected)
+
+def test_parse_pool_matches_serial(week_page):
+    # İşçiler pipeline thread'leri çalışırken başlatılır; fork ile değil
+    assert pool_context().get_start_method() != 'fork'
+    with ParsePool(2) as pool:
+        submitted = []
+        submit = pool.executor.submit
+        pool.executor.submit = lambda func, *args: submitted.append(args) or submit(func, *args)
+        assert pool(week_page, LEAGUES) == extract_league_rows(week_page, LEAGUES)
+    # İşçiye sayfanın tamamı değil, lig dilimi gönderilir
+    assert submitted[0][0] == slice_league_sections(week_page, LEAGUES)
+
+def test_market_catalog_odds_are_numeric(week_page):
+    for rows in parse_week_page(week_page, LEAGUES).values():
+        if rows:
+            odds = build_market_catalog(rows)['Oran']
+            assert odds.dtype == 'float32'
+            # Eksik oran 0 değil NaN
+            assert not (odds <= 0).any()
+            assert odds.notna().any()
@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('github')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+from fake_github import FakeRepo
+from repo_publisher import RepoPublisher, file_blob_sha
+
+# Publisher sadece yerel dosya yollarını tutar; içerik commit sırasında diskten okunur.
+
+def write_file(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+def test_blob_sha_matches_git(tmp_path):
+    # git hash-object ile hesaplanan özetler
+    assert file_blob_sha(write_file(tmp_path, 'empty', b'')) == 'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391'
+    assert file_blob_sha(write_file(tmp_path, 'hello', b'hello\n'), chunk_size=2) == 'ce013625030ba8dba906f756967f9e9ca394464a'
+
+def test_publishes_changed_files_from_disk(tmp_path):
+    repo = FakeRepo({'a.csv': b'1\n', 'b.csv': b'2\n'})
+    publisher = RepoPublisher(repo)
+    publisher.stage('a.csv', write_file(tmp_path, 'a.csv', b'1\n'))
+    publisher.stage('b.csv', write_file(tmp_path, 'b.csv', b'3\n'))
+    publisher.stage('c.csv', write_file(tmp_path, 'c.csv', b'4\n'))
+    commits = repo.commit_count
+
+    assert all(isinstance(local_path, str) for local_path in publisher.files.values())
+    assert publisher.commit('Update') == ['b.csv', 'c.csv']
+    assert (repo.read('a.csv'), repo.read('b.csv'), repo.read('c.csv')) == (b'1\n', b'3\n', b'4\n')
+    assert repo.commit_count == commits + 1
+
+def test_unchanged_files_skip_commit(tmp_path):
+    repo = FakeRepo({'a.csv': b'1\n'})
+    publisher = RepoPublisher(repo)
+    publisher.stage('a.csv', write_file(tmp_path, 'a.csv', b'1\n'))
+    commits = repo.commit_count
+    assert publisher.commit('Update') == []
+    assert repo.commit_count == commits
+
+def test_race_rebuilds_commit(tmp_path):
+    repo = FakeRepo({'a.csv': b'1\n'}, races=1)
+    publisher = RepoPublisher(repo)
+    publisher.stage('a.csv', write_file(tmp_path, 'a.csv', b'2\n'))
+    assert publisher.commit('Update') == ['a.csv']
+    assert repo.read('a.csv') == b'2\n'
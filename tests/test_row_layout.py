@@ -0,0 +1,71 @@
+import re
+
+import numpy as np
+import pytest
+
+from conftest import synthetic_page
+from iddaa import LEAGUES, build_dataframe, parse_week_page
+from row_schema import TableLayoutError
+from stream_extract import StreamingRowExtractor
+
+# Sitede bazı maç satırları isteğe bağlı sütunlar (Çifte Şans) olmadan, daha az hücreyle
+# gelir. Bu satırlar boş değerle okunmalı; sadece zorunlu bir sütunun hücresi eksikse
+# tablo düzeni değişmiş sayılır.
+
+CIFTE_SANS = ['Çifte Şans 1-X', 'Çifte Şans 1-2', 'Çifte Şans X-2']
+
+def trim_match_row(page, league_slug, occurrence, keep):
+    # league_slug ligindeki occurrence'ıncı maç satırının ilk keep hücresi bırakılır
+    marker = f'<tr filtervalue="futbol {league_slug}">'
+    start = -1
+    for _ in range(occurrence):
+        start = page.index(marker, start + 1)
+    end = page.index('</tr>', start)
+    cells = re.findall(r'<td>.*?</td>', page[start + len(marker):end])
+    return page[:start] + marker + ''.join(cells[:keep]) + page[end:]
+
+def dom_rows(page):
+    return parse_week_page(page, LEAGUES)
+
+def stream_rows(page):
+    extractor = StreamingRowExtractor(LEAGUES)
+    extractor.feed(page)
+    extractor.close()
+    return extractor.league_rows
+
+@pytest.mark.parametrize('extract', [dom_rows, stream_rows])
+@pytest.mark.parametrize('keep', [19, 20])
+@pytest.mark.parametrize('page_name, occurrence', [('week_1849_no_header.html', 2), ('week_1850_header.html', 1)])
+def test_short_row_reads_optional_columns_empty(page_name, occurrence, keep, extract):
+    page = synthetic_page(page_name)
+    full = extract(page)['AL1']
+    short = extract(trim_match_row(page, 'AL1', occurrence, keep))['AL1']
+    index = occurrence - 1
+
+    assert len(short) == len(full)
+    assert all(short[index][column] == '' for column in CIFTE_SANS)
+    assert {column: value for column, value in short[index].items() if column not in CIFTE_SANS} == \
+        {column: value for column, value in full[index].items() if column not in CIFTE_SANS}
+    assert build_dataframe(short)[CIFTE_SANS].isna().to_numpy().sum() >= len(CIFTE_SANS)
+
+@pytest.mark.parametrize('extract', [dom_rows, stream_rows])
+def test_missing_required_cell_raises(extract):
+    page = trim_match_row(synthetic_page('week_1849_no_header.html'), 'AL1', 2, 15)
+    with pytest.raises(TableLayoutError):
+        extract(page)
+
+def test_short_first_row_keeps_optional_columns_of_later_rows():
+    # Başlıksız sayfada şema ilk satırın genişliğine göre kısaltılmamalı
+    page = synthetic_page('week_1849_no_header.html')
+    first_league = LEAGUES[2]['league_slug']
+    rows = dom_rows(trim_match_row(page, first_league, 1, 19))[first_league]
+    assert rows[0][CIFTE_SANS[0]] == ''
+    assert not np.isnan(float(rows[1][CIFTE_SANS[0]]))
+
+@pytest.mark.parametrize('extract', [dom_rows, stream_rows])
+def test_colspan_header_keeps_cell_order(extract):
+    # Birden çok hücreyi kaplayan başlık, kapladığı hücre sayısı kadar sayılmalı
+    page = synthetic_page('week_1850_header.html')
+    spanned = page.replace('<th>Tarih</th><th>Kod</th>', '<th colspan="2">Tarih</th>', 1)
+    assert spanned != page
+    assert extract(spanned) == extract(page)
@@ -0,0 +1,34 @@
+import pytest
+
+import week_pipeline
+from conftest import synthetic_page
+from iddaa import LEAGUES, extract_league_rows
+from row_schema import TableLayoutError
+from week_pipeline import WeekPipeline
+
+# Tablo düzenine uymayan bir sayfa tüm çalıştırmayı durdurmaz: sadece kendi haftası
+# atlanır ve hafta numarasıyla kaydedilir.
+
+BROKEN_WEEK = 1851
+
+@pytest.fixture(autouse=True)
+def cached_pages(monkeypatch):
+    page = synthetic_page('week_1850_header.html')
+    monkeypatch.setattr(week_pipeline, 'fetch_week', lambda hafta, leagues, cache=None: (page, None, True))
+
+def parse(content, leagues, iddaa_hafta=None):
+    if iddaa_hafta == BROKEN_WEEK:
+        raise TableLayoutError("Maç satırında 12 hücre var, tablo düzeni en az 20 hücre bekliyor.")
+    return extract_league_rows(content, leagues, iddaa_hafta)
+
+@pytest.mark.parametrize('fetch_workers', [1, 3])
+def test_layout_error_skips_only_its_week(fetch_workers, capsys):
+    pipeline = WeekPipeline(LEAGUES, fetch_workers=fetch_workers, parse=parse)
+    weeks = {hafta: week_data for hafta, week_data, catalogs in pipeline.run([1852, BROKEN_WEEK, 1850])}
+
+    assert list(weeks) == [1852, BROKEN_WEEK, 1850]
+    assert all(df is None for df in weeks[BROKEN_WEEK].values())
+    for hafta in (1852, 1850):
+        assert any(df is not None and not df.empty for df in weeks[hafta].values())
+    assert pipeline.layout_errors == [BROKEN_WEEK]
+    assert f"Hafta {BROKEN_WEEK}" in capsys.readouterr().out
@@ -0,0 +1,81 @@
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+class WeekCache:
+    # Ham hafta sayfaları içerik özetine (sha256) göre blobs/ altında saklanır,
+    # index.json ise hafta -> blob eşlemesini ve haftanın kapanıp kapanmadığını tutar.
+    # Kapanmış (tüm maçların skoru belli) haftalar bir daha indirilmez.
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.blob_dir = os.path.join(cache_dir, 'blobs')
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.index = self._read_index()
+        # Paralel indirmelerde index.json yazımlarını sıraya sokar
+        self.lock = threading.Lock()
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_atomic(self, path, data):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _blob_path(self, digest):
+        return os.path.join(self.blob_dir, f"{digest}.html")
+
+    def load(self, iddaa_hafta, league_slugs):
+        # Sadece kapanmış ve istenen liglerin hepsini kapsayan kayıtlar kullanılır
+        with self.lock:
+            entry = self.index.get(str(iddaa_hafta))
+        if not entry or not entry.get('immutable'):
+            return None
+        if not set(league_slugs) <= set(entry.get('league_slugs', [])):
+            return None
+
+        try:
+            with open(self._blob_path(entry['sha256']), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        # Bozulmuş blob'ları kullanma, yeniden indirilsin
+        if hashlib.sha256(data).hexdigest() != entry['sha256']:
+            return None
+        return data.decode('utf-8')
+
+    def store(self, iddaa_hafta, content, league_slugs, immutable):
+        data = content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(digest)
+
+        with self.lock:
+            if not os.path.exists(blob_path):
+                self._write_atomic(blob_path, data)
+
+            previous = self.index.get(str(iddaa_hafta))
+            self.index[str(iddaa_hafta)] = {
+                'sha256': digest,
+                'immutable': bool(immutable),
+                'league_slugs': sorted(league_slugs),
+                'fetched_at': datetime.now().isoformat(timespec='seconds'),
+            }
+            self._write_atomic(self.index_path, json.dumps(self.index, ensure_ascii=False, indent=1, sort_keys=True).encode('utf-8'))
+
+            # Artık hiçbir haftanın göstermediği eski blob'u sil
+            if previous and previous['sha256'] != digest:
+                if not any(entry['sha256'] == previous['sha256'] for entry in self.index.values()):
+                    try:
+                        os.remove(self._blob_path(previous['sha256']))
+                    except OSError:
+                        pass
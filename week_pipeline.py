@@ -0,0 +1,76 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from iddaa import build_week_frames, extract_league_rows, fetch_week, parse_week
+from row_schema import TableLayoutError
+
+class WeekPipeline:
+    # Haftaları indirme -> ayrıştırma -> birleştirme aşamalarından geçirir.
+    # İndirme ve ayrıştırma ayrı thread havuzlarında çalışır, DataFrame'ler ise
+    # tüketen thread'de hafta sırasıyla kurulur; böylece N. hafta ayrıştırılırken
+    # N+1. hafta iner. Aynı anda en fazla `depth` hafta hatta bulunur: hattaki en
+    # eski hafta tüketilmeden yeni hafta başlatılmaz, bellek haftalar değil
+    # derinlik kadar büyür.
+
+    def __init__(self, leagues, cache=None, fetch_workers=4, parse=extract_league_rows, parse_workers=1, depth=None, with_catalog=False):
+        self.leagues = leagues
+        self.cache = cache
+        self.fetch_workers = max(1, fetch_workers)
+        self.parse = parse
+        self.parse_workers = max(1, parse_workers)
+        self.depth = max(1, depth or self.fetch_workers + self.parse_workers)
+        self.with_catalog = with_catalog
+        # Tablo düzenine uymadığı için atlanan haftalar
+        self.layout_errors = []
+
+    def run(self, weeks):
+        # (hafta, {lig kısaltması: DataFrame veya None}, pazar katalogları veya None) üretir
+        weeks = iter(weeks)
+        in_flight = deque()
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as fetcher, ThreadPoolExecutor(max_workers=self.parse_workers) as parser:
+            try:
+                for hafta in weeks:
+                    in_flight.append((hafta, self.submit(fetcher, parser, hafta)))
+                    if len(in_flight) >= self.depth:
+                        break
+
+                while in_flight:
+                    hafta, future = in_flight.popleft()
+                    league_rows = self.wait(hafta, future)
+                    # Tüketilen haftanın yerine bir sonraki hafta hatta girer
+                    next_hafta = next(weeks, None)
+                    if next_hafta is not None:
+                        in_flight.append((next_hafta, self.submit(fetcher, parser, next_hafta)))
+                    yield (hafta,) + self.assemble(hafta, league_rows)
+            finally:
+                # Erken çıkışta (hata ya da tüketicinin durması) başlamamış işler iptal edilir
+                for hafta, future in in_flight:
+                    future.cancel()
+
+    def submit(self, fetcher, parser, hafta):
+        fetched = fetcher.submit(fetch_week, hafta, self.leagues, self.cache)
+        # Ayrıştırma işleri hafta sırasıyla kuyruğa girer ve kendi haftalarının inmesini bekler
+        return parser.submit(lambda: parse_week(hafta, self.leagues, fetched.result(), self.cache, self.parse))
+
+    def wait(self, hafta, future):
+        try:
+            return future.result()
+        except TableLayoutError as e:
+            # Tablo düzenine uymayan sayfanın satırları sütunlar kaydırılarak yazılmaz; sadece
+            # o hafta düşer, diğer haftalar ve liglerin CSV'leri yayınlanmaya devam eder
+            print(f"⚠️ Tablo düzeni hatası (Hafta {hafta}), hafta atlanıyor: {str(e)}")
+            self.layout_errors.append(hafta)
+            return None
+        except Exception as e:
+            print(f"Hata oluştu (Hafta {hafta}): {str(e)}")
+            return None
+
+    def assemble(self, hafta, league_rows):
+        results = {league['league_slug']: None for league in self.leagues}
+        catalogs = {} if self.with_catalog else None
+        if league_rows is not None:
+            try:
+                build_week_frames(self.leagues, league_rows, results, catalogs)
+            except Exception as e:
+                print(f"Hata oluştu (Hafta {hafta}): {str(e)}")
+        return results, catalogs